@@ -0,0 +1,330 @@
+import fs from 'fs';
+import path from 'path';
+import { fileURLToPath } from 'url';
+import { convertFundToGistProfile, loadFundStatus, withFundStatus } from './push_strike_data_to_gist.js';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = path.dirname(__filename);
+
+// Configuration
+const GIST_ID = '2198c40a1181db1edc86727df7f86260';
+const GIST_FILENAME = 'profiles.json';
+// Hash of the catalogue the gist profiles were built from
+const CATALOGUE_FILENAME = 'catalogue.json';
+const DELTA_FILE = path.join(__dirname, 'strike_funds_delta.json');
+const DATA_FILE = path.join(__dirname, 'strike_funds_data.json');
+const STATUS_FILE = path.join(__dirname, 'strike_funds_status.json');
+// Written by strike_data_extractor.py --incremental; the baseline is ours to write
+const STATE_FILE = path.join(__dirname, 'strike_funds_state.json');
+const BASELINE_FILE = path.join(__dirname, 'strike_funds_baseline.json');
+const OUTPUT_FILE = path.join(__dirname, 'updated_gist_data.json');
+
+// Same rules as canonicalize_url() in fund_dedup.py
+const TRACKING_PARAMS = new Set([
+  'fbclid', 'gclid', 'dclid', 'msclkid', 'igshid', 'mc_cid', 'mc_eid',
+  '_hsenc', '_hsmi', 'mkt_tok', 'yclid', 'twclid'
+]);
+// Profile IDs assigned by the extractor's --incremental mode
+const STABLE_ID_RE = /^strike-fund-[0-9a-f]{12}(-\d+)?$/;
+
+// GitHub API configuration
+const GITHUB_TOKEN = process.env.GITHUB_TOKEN;
+const GITHUB_API_BASE = 'https://api.github.com';
+
+/**
+ * Canonical form of a fund URL, used only to match funds with profiles
+ */
+export function canonicalizeUrl(url) {
+  let parsed;
+  try {
+    parsed = new URL(url.trim());
+  } catch {
+    return url.trim();
+  }
+
+  const params = [...parsed.searchParams].filter(([key]) => {
+    const lower = key.toLowerCase();
+    return !TRACKING_PARAMS.has(lower) && !lower.startsWith('utm_');
+  });
+  params.sort(([a, va], [b, vb]) => (a === b ? (va < vb ? -1 : va > vb ? 1 : 0) : a < b ? -1 : 1));
+  const query = new URLSearchParams(params).toString();
+  const pathname = parsed.pathname.replace(/\/{2,}/g, '/').replace(/\/+$/, '');
+  // Empty or "#/" fragments are leftovers from client-side routers
+  const fragment = parsed.hash.replace(/^#/, '').replace(/^\/+|\/+$/g, '') ? parsed.hash : '';
+  return `${parsed.protocol}//${parsed.host}${pathname}${query ? `?${query}` : ''}${fragment}`;
+}
+
+/**
+ * Load the delta written by `strike_data_extractor.py --incremental`
+ */
+function loadDelta() {
+  if (!fs.existsSync(DELTA_FILE)) {
+    throw new Error('Delta file not found. Please run strike_data_extractor.py --incremental first.');
+  }
+
+  const delta = JSON.parse(fs.readFileSync(DELTA_FILE, 'utf8'));
+  return {
+    ...delta,
+    added: withFundStatus(delta.added, STATUS_FILE),
+    changed: withFundStatus(delta.changed, STATUS_FILE)
+  };
+}
+
+/**
+ * The whole catalogue as a full delta, for when the gist is not at the delta's base
+ */
+function loadFullDelta(delta) {
+  const funds = JSON.parse(fs.readFileSync(DATA_FILE, 'utf8'));
+  return { ...delta, full: true, added: withFundStatus(funds, STATUS_FILE), changed: [], removed: [] };
+}
+
+/**
+ * Record the uploaded catalogue as the baseline of the next delta
+ */
+function saveBaseline(catalogueHash) {
+  const state = fs.existsSync(STATE_FILE) ? JSON.parse(fs.readFileSync(STATE_FILE, 'utf8')) : null;
+  if (!state || state.catalogueHash !== catalogueHash) {
+    // The extractor ran again since this delta: keep the old baseline, the next
+    // delta is rebased onto the gist's hash instead
+    console.warn('⚠️  Extractor state moved on since this delta, baseline not updated');
+    return;
+  }
+  fs.writeFileSync(BASELINE_FILE, JSON.stringify({
+    version: state.version,
+    catalogueHash,
+    records: state.records
+  }, null, 2));
+}
+
+/**
+ * Fetch current Gist profiles and catalogue hash from GitHub
+ */
+async function fetchGist() {
+  const response = await fetch(`${GITHUB_API_BASE}/gists/${GIST_ID}`, {
+    headers: {
+      'Authorization': `token ${GITHUB_TOKEN}`,
+      'Accept': 'application/vnd.github.v3+json',
+      'User-Agent': 'PayeTonGreviste-DeltaUpdater'
+    }
+  });
+
+  if (!response.ok) {
+    throw new Error(`Failed to fetch Gist: ${response.status} ${response.statusText}`);
+  }
+
+  const gistData = await response.json();
+  const catalogue = gistData.files[CATALOGUE_FILENAME];
+  return {
+    profiles: gistData.files[GIST_FILENAME] ? JSON.parse(gistData.files[GIST_FILENAME].content) : [],
+    catalogueHash: catalogue ? JSON.parse(catalogue.content).catalogueHash : null
+  };
+}
+
+/**
+ * Pair delta funds with the existing profiles they update: by ID, or by
+ * canonical fund URL (then title, when funds share a URL) for profiles that
+ * predate the extractor's stable IDs (strike-fund-1, strike-fund-2...).
+ * Returns a Map of profile -> fund.
+ */
+function matchProfiles(profiles, funds) {
+  const matches = new Map();
+  const byId = new Map(profiles.map(profile => [profile.id, profile]));
+  const unmatched = funds.filter(fund => {
+    const profile = byId.get(`strike-fund-${fund.id}`);
+    if (profile) {
+      matches.set(profile, fund);
+    }
+    return !profile;
+  });
+
+  const byUrl = new Map();
+  profiles
+    .filter(profile => !STABLE_ID_RE.test(profile.id) && profile.strikeFund?.url)
+    .forEach(profile => {
+      const key = canonicalizeUrl(profile.strikeFund.url);
+      byUrl.set(key, [...(byUrl.get(key) || []), profile]);
+    });
+
+  unmatched.forEach(fund => {
+    const candidates = (byUrl.get(canonicalizeUrl(fund.url)) || []).filter(profile => !matches.has(profile));
+    const profile = candidates.find(candidate => candidate.strikeFund.title === fund.name) || candidates[0];
+    if (profile) {
+      matches.set(profile, fund);
+    }
+  });
+  return matches;
+}
+
+/**
+ * Update an existing profile from its fund. The persona (name, age, bio,
+ * photo) and amounts are kept, unless the link checker found real amounts.
+ */
+function updateProfile(profile, fund) {
+  const converted = convertFundToGistProfile(fund, 0);
+  const { id, url, title, description, category } = converted.strikeFund;
+  return {
+    ...profile,
+    id: converted.id,
+    location: converted.location,
+    strikeFund: {
+      ...profile.strikeFund,
+      id,
+      url,
+      title,
+      description,
+      category,
+      ...(fund.raisedAmount !== undefined && { currentAmount: fund.raisedAmount }),
+      ...(fund.targetAmount !== undefined && { targetAmount: fund.targetAmount })
+    }
+  };
+}
+
+/**
+ * Apply a delta to a list of profiles.
+ * Funds that already have a profile keep its persona, and the profile takes
+ * the fund's stable ID; other funds get a new profile. A full delta lists
+ * every fund, so profiles it does not match are dropped.
+ */
+export function applyDelta(profiles, delta) {
+  const funds = [...delta.changed, ...delta.added];
+  const matches = matchProfiles(profiles, funds);
+  const removed = new Set(delta.removed.map(fundId => `strike-fund-${fundId}`));
+
+  const updated = profiles.flatMap(profile => {
+    const fund = matches.get(profile);
+    if (fund) {
+      return [updateProfile(profile, fund)];
+    }
+    return delta.full || removed.has(profile.id) ? [] : [profile];
+  });
+
+  const matched = new Set(matches.values());
+  funds
+    .filter(fund => !matched.has(fund))
+    .forEach(fund => updated.push(convertFundToGistProfile(fund, updated.length)));
+  return updated;
+}
+
+/**
+ * Refresh the amounts of every profile from the link checker results.
+ * Amounts are not part of the delta (they change without the map changing),
+ * so unchanged funds need this too. Returns how many profiles changed.
+ */
+export function applyFundStatus(profiles, statusByUrl) {
+  let updated = 0;
+  profiles.forEach((profile, index) => {
+    const status = statusByUrl.get(profile.strikeFund?.url);
+    if (!status) {
+      return;
+    }
+
+    const strikeFund = {
+      ...profile.strikeFund,
+      ...(status.raisedAmount !== undefined && { currentAmount: status.raisedAmount }),
+      ...(status.targetAmount !== undefined && { targetAmount: status.targetAmount })
+    };
+    if (strikeFund.currentAmount !== profile.strikeFund.currentAmount ||
+        strikeFund.targetAmount !== profile.strikeFund.targetAmount) {
+      profiles[index] = { ...profile, strikeFund };
+      updated++;
+    }
+  });
+  return updated;
+}
+
+/**
+ * Push updated profiles back to Gist
+ */
+async function updateGist(profiles, catalogueHash) {
+  const response = await fetch(`${GITHUB_API_BASE}/gists/${GIST_ID}`, {
+    method: 'PATCH',
+    headers: {
+      'Authorization': `token ${GITHUB_TOKEN}`,
+      'Accept': 'application/vnd.github.v3+json',
+      'User-Agent': 'PayeTonGreviste-DeltaUpdater',
+      'Content-Type': 'application/json'
+    },
+    body: JSON.stringify({
+      files: {
+        [GIST_FILENAME]: {
+          content: JSON.stringify(profiles, null, 2)
+        },
+        [CATALOGUE_FILENAME]: {
+          content: JSON.stringify({ catalogueHash, updatedAt: new Date().toISOString() }, null, 2)
+        }
+      }
+    })
+  });
+
+  if (!response.ok) {
+    const errorData = await response.text();
+    throw new Error(`Failed to update Gist: ${response.status} ${response.statusText}\n${errorData}`);
+  }
+
+  return response.json();
+}
+
+/**
+ * Main execution
+ */
+async function main() {
+  try {
+    let delta = loadDelta();
+    const total = delta.added.length + delta.changed.length + delta.removed.length;
+
+    console.log(`🧮 Delta ${delta.previousHash} → ${delta.catalogueHash}${delta.full ? ' (full rebuild)' : ''}`);
+    console.log(`   ${delta.added.length} added, ${delta.changed.length} changed, ${delta.removed.length} removed`);
+
+    // Nothing to upload: skip the GitHub round trips entirely
+    const statusByUrl = loadFundStatus(STATUS_FILE);
+    if (total === 0 && !delta.full && !statusByUrl) {
+      console.log('✅ Gist already up to date');
+      return;
+    }
+
+    if (!GITHUB_TOKEN) {
+      throw new Error('GITHUB_TOKEN environment variable is required. Please set it with your GitHub personal access token.');
+    }
+
+    const { profiles, catalogueHash } = await fetchGist();
+    // The delta only makes sense on top of the catalogue it was computed from
+    if (!delta.full && catalogueHash !== delta.previousHash) {
+      console.log(`⚠️  Gist is at ${catalogueHash ?? 'an unknown catalogue'}, not ${delta.previousHash}: applying the whole catalogue`);
+      delta = loadFullDelta(delta);
+    }
+
+    const updatedProfiles = applyDelta(profiles, delta);
+    const refreshed = statusByUrl ? applyFundStatus(updatedProfiles, statusByUrl) : 0;
+    if (refreshed > 0) {
+      console.log(`   ${refreshed} profiles with new amounts from the link checker`);
+    }
+    if (total === 0 && !delta.full && refreshed === 0) {
+      console.log('✅ Gist already up to date');
+      return;
+    }
+
+    const updatedGist = await updateGist(updatedProfiles, delta.catalogueHash);
+    saveBaseline(delta.catalogueHash);
+
+    fs.writeFileSync(OUTPUT_FILE, JSON.stringify({
+      metadata: {
+        updatedAt: new Date().toISOString(),
+        gistId: GIST_ID,
+        totalProfiles: updatedProfiles.length,
+        catalogueHash: delta.catalogueHash
+      },
+      profiles: updatedProfiles
+    }, null, 2));
+
+    console.log(`✅ Gist updated: ${updatedProfiles.length} profiles`);
+    console.log(`🔗 Gist URL: ${updatedGist.html_url}`);
+  } catch (error) {
+    console.error('💥 Update failed:', error.message);
+    process.exit(1);
+  }
+}
+
+// Only run when executed directly (not when imported)
+if (process.argv[1] === __filename) {
+  main();
+}
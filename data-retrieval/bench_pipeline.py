@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+import os
+import gc
+import sys
+import gzip
+import html
+import json
+import math
+import time
+import random
+import argparse
+import platform
+import tempfile
+import subprocess
+import tracemalloc
+import unicodedata
+from datetime import datetime, timezone
+
+from strike_data_extractor import (
+    DEFAULT_ZOOM, SYNTHETIC_CENTER, SYNTHETIC_SIZE, extract_strike_funds_data, latlng_to_pixel, pixel_origin,
+    write_map_panes,
+)
+from fund_dedup import canonicalize_url, deduplicate
+from fund_geocoder import FALLBACK_COORDINATES, GAZETTEER_FILE, geocode_funds
+
+RESULTS_VERSION = 1
+DEFAULT_SIZES = (1000, 10000, 100000, 1000000)
+DEFAULT_SEED = 2023
+DEFAULT_OUTPUT = 'bench_pipeline_results.json'
+
+# SwipeDeck's default maxDistance, around the default map center
+DEFAULT_RADIUS_KM = 50
+PARIS = (48.8566, 2.3522)
+
+# A stage counts as a regression when it is this much slower (or bigger) than
+# the baseline; stages under MIN_SECONDS are too noisy to compare.
+REGRESSION_RATIO = 1.25
+MIN_SECONDS = 0.01
+
+# Measured on strike_funds_data.json (139 funds): 16 thematic, and 69 of the
+# 123 located funds sit on the fallback pair
+THEMATIC_RATIO = 16 / 139
+FALLBACK_RATIO = 69 / 123
+# ...and 6 are listed twice, through slightly different URLs
+DUPLICATE_RATIO = 6 / 139
+HOST_MIX = [
+    ('https://www.leetchi.com/c/{slug}', 32),
+    ('https://www.helloasso.com/associations/{slug}/formulaires/1', 30),
+    ('https://www.cotizup.com/{slug}', 25),
+    ('https://caisse-solidarite.fr/c/{slug}/', 20),
+    ('https://www.papayoux-solidarite.com/fr/collecte/{slug}', 16),
+    ('https://www.papayoux.com/fr/cagnotte/{slug}', 5),
+    ('https://lydia-app.com/collect/{slug}', 2),
+    # One-off union sites
+    ('https://{org}{code}.fr/caisse-de-greve-{slug}', 9),
+]
+
+ORGS = ['CGT', 'FSU', 'Solidaires', 'Sud-Éducation', 'Sud Rail', 'CNT', 'FO', 'Intersyndicale', 'AG éduc']
+WORKERS = ['Cheminots', 'Gaziers', 'Raffineurs', 'Éboueurs', 'Enseignant·es', 'Agents hospitaliers',
+           'Personnels grévistes', 'Étudiant·es', 'Électriciens', 'Dockers']
+SCHOOLS = ['collège Fabien', 'lycée Jean Vilar', 'collège Aimé Césaire', 'lycée Louise Michel',
+           'école Olympe de Gouges', 'lycée Émile Zola', 'collège Gisèle Halimi']
+THEMES = ['antirépression', 'féministe', 'Queer', 'des précaires', 'sans-papiers', 'étudiante',
+          'des sous-traitants', 'interprofessionnelle']
+
+
+def slugify(text):
+    ascii_text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    return '-'.join(''.join(c if c.isalnum() else ' ' for c in ascii_text.lower()).split())
+
+
+def load_places():
+    with open(GAZETTEER_FILE, 'r', encoding='utf-8') as f:
+        gazetteer = json.load(f)
+    departements = {d['code']: d for d in gazetteer['departements']}
+    # Communes are where strikes cluster; départements spread the rest
+    places = [(c['name'], departements[c['departement']], c['lat'], c['lng']) for c in gazetteer['communes']]
+    places += [(d['name'], d, d['lat'], d['lng']) for d in gazetteer['departements']]
+    return places
+
+
+def generate_funds(count, seed=DEFAULT_SEED, places=None):
+    # Funds shaped like the extractor output. The sequence only depends on the
+    # seed, so smaller sizes are prefixes of larger ones.
+    rng = random.Random(seed)
+    places = places or load_places()
+    templates, weights = zip(*HOST_MIX)
+    funds = []
+    for i in range(count):
+        if funds and rng.random() < DUPLICATE_RATIO:
+            original = rng.choice(funds)
+            funds.append(dict(original, url=original['url'] + '?utm_source=facebook'))
+            continue
+        place, departement, lat, lng = rng.choice(places)
+        org = rng.choice(ORGS)
+        if rng.random() < THEMATIC_RATIO:
+            name = f"Caisse de soutien {rng.choice(THEMES)} {org}"
+        else:
+            name = rng.choice((
+                f"{org} {departement['name']} {departement['code']}",
+                f"{rng.choice(WORKERS)} de {place}",
+                f"Caisse de grève {rng.choice(WORKERS).lower()} {place}",
+                f"Grévistes du {rng.choice(SCHOOLS)} de {place}",
+            ))
+        url = rng.choices(templates, weights)[0].format(
+            slug=f"{slugify(name)}-{i}", org=slugify(org).replace('-', ''), code=departement['code'].lower(),
+        )
+
+        if name.startswith('Caisse de soutien'):
+            funds.append({"name": name, "url": url, "type": "thematic"})
+            continue
+        if rng.random() < FALLBACK_RATIO:
+            lat, lng = FALLBACK_COORDINATES
+        else:
+            lat, lng = lat + rng.gauss(0, 0.05), lng + rng.gauss(0, 0.05)
+        funds.append({"name": name, "url": url, "lat": round(lat, 6), "lng": round(lng, 6)})
+    return funds
+
+
+def write_snapshot(path, funds, zoom=DEFAULT_ZOOM):
+    # A Leaflet page holding `funds`, in the markup strike_data_extractor.py parses
+    thematic = []
+    origin = pixel_origin(SYNTHETIC_CENTER, SYNTHETIC_SIZE, zoom)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('<html><body>')
+        write_map_panes(f, origin, zoom)
+        f.write('<div class="leaflet-pane leaflet-marker-pane">\n')
+        for i, fund in enumerate(funds):
+            if 'lat' not in fund:
+                thematic.append(fund)
+                continue
+            x, y = latlng_to_pixel(fund['lat'], fund['lng'], zoom)
+            x, y = x - origin[0], y - origin[1]
+            f.write(
+                f'<div class="leaflet-marker-icon leaflet-interactive" tabindex="0" '
+                f'style="margin-left: -12px; transform: translate3d({x:.3f}px, {y:.3f}px, 0px); z-index: {i};">'
+                f'<a href="{html.escape(fund["url"])}">{html.escape(fund["name"])}</a></div>\n'
+            )
+        f.write('</div></div><ul class="thematic">\n')
+        for fund in thematic:
+            f.write(f'<li><a href="{html.escape(fund["url"])}">{html.escape(fund["name"])}</a></li>\n')
+        f.write('</ul></body></html>\n')
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    # Same formula as haversineKm in src/lib/geo.ts
+    to_rad = math.pi / 180
+    d_lat = (lat2 - lat1) * to_rad
+    d_lon = (lon2 - lon1) * to_rad
+    sin_d_lat = math.sin(d_lat / 2)
+    sin_d_lon = math.sin(d_lon / 2)
+    h = sin_d_lat * sin_d_lat + math.cos(lat1 * to_rad) * math.cos(lat2 * to_rad) * sin_d_lon * sin_d_lon
+    return 6371 * 2 * math.atan2(math.sqrt(h), math.sqrt(1 - h))
+
+
+def filter_by_distance(funds, center, radius_km):
+    # What SwipeDeck does per render: distance to every located fund, filter, sort
+    lat, lon = center
+    nearby = []
+    for fund in funds:
+        if 'lat' in fund and 'lng' in fund:
+            distance = haversine_km(lat, lon, fund['lat'], fund['lng'])
+            if distance <= radius_km:
+                nearby.append((distance, fund))
+    nearby.sort(key=lambda item: item[0])
+    return nearby
+
+
+def measure(fn, repeat=1, trace_memory=True):
+    # Best wall time over `repeat` runs, then one extra run under tracemalloc
+    # (which slows Python down too much to time in the same run)
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        result = None
+        gc.collect()
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    peak = None
+    if trace_memory:
+        result = None
+        gc.collect()
+        tracemalloc.start()
+        try:
+            result = fn()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return best, peak, result
+
+
+def bench_size(count, seed, tmp, radius_km=DEFAULT_RADIUS_KM, trace_memory=True):
+    repeat = 5 if count <= 10000 else 1
+    funds = generate_funds(count, seed)
+    snapshot_path = os.path.join(tmp, f'snapshot_{count}.html')
+    json_path = os.path.join(tmp, f'funds_{count}.json')
+    write_snapshot(snapshot_path, funds)
+
+    def serialize():
+        # As the extractor writes its output
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(funds, f, ensure_ascii=False, indent=2)
+
+    def load():
+        with open(json_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def geocode():
+        # geocode_funds() fills funds in place, so every run starts from fresh copies
+        return geocode_funds([dict(fund) for fund in results['extract']])
+
+    stages = [
+        ('extract', lambda: extract_strike_funds_data(snapshot_path)),
+        ('geocode', geocode),
+        ('dedup', lambda: deduplicate(results['geocode'][0], mode='merge')),
+        ('serialize', serialize),
+        ('load', load),
+        ('distance', lambda: filter_by_distance(funds, PARIS, radius_km)),
+    ]
+    try:
+        import numpy  # noqa: F401
+    except ImportError:  # the indexed comparison needs fund_index.py's NumPy
+        pass
+    else:
+        from fund_index import FundIndex
+        stages.append(('distance_indexed', lambda: FundIndex.from_funds(funds).within_radius(*PARIS, radius_km)))
+
+    rows, results = [], {}
+    for stage, fn in stages:
+        seconds, peak, results[stage] = measure(fn, repeat, trace_memory)
+        rows.append({
+            "records": count,
+            "stage": stage,
+            "seconds": round(seconds, 6),
+            "recordsPerSecond": round(count / seconds) if seconds else None,
+            "peakBytes": peak,
+        })
+        print(f"{count:>9,} {stage:<17} {seconds:>9.3f}s {count / seconds if seconds else 0:>13,.0f}/s"
+              f" {'' if peak is None else f'{peak / 2**20:>9.1f} MiB'}")
+
+    # Sanity checks, so a fast but broken stage cannot pass as an improvement
+    if len(results['extract']) != count:
+        raise RuntimeError(f"extracted {len(results['extract'])} of {count} funds")
+    geocoded, geocode_stats = results['geocode']
+    if geocode_stats['candidates'] and not geocode_stats['geocoded']:
+        raise RuntimeError('no fund was geocoded')
+    deduplicated, dedup_report = results['dedup']
+    if len(deduplicated) != len({canonicalize_url(fund['url']) for fund in geocoded}):
+        raise RuntimeError(f"{len(deduplicated)} funds left after merging duplicate URLs")
+    if 'distance_indexed' in results and len(results['distance_indexed'][0]) != len(results['distance']):
+        raise RuntimeError('indexed and linear distance filters disagree')
+
+    with open(json_path, 'rb') as f:
+        gzip_bytes = len(gzip.compress(f.read(), compresslevel=6))
+    sizes = {
+        "records": count,
+        "snapshotBytes": os.path.getsize(snapshot_path),
+        "jsonBytes": os.path.getsize(json_path),
+        "gzipBytes": gzip_bytes,
+        "geocoded": geocode_stats['geocoded'],
+        "withinRadius": len(results['distance']),
+        "duplicatesMerged": count - len(deduplicated),
+        "fuzzyPairs": dedup_report['stats']['fuzzyPairs'],
+    }
+    os.remove(snapshot_path)
+    os.remove(json_path)
+    return rows, sizes
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(sizes=DEFAULT_SIZES, seed=DEFAULT_SEED, radius_km=DEFAULT_RADIUS_KM, trace_memory=True):
+    print(f"{'records':>9} {'stage':<17} {'time':>10} {'throughput':>14} {'peak memory':>13}")
+    rows, outputs = [], []
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in sizes:
+            size_rows, size_outputs = bench_size(count, seed, tmp, radius_km, trace_memory)
+            rows += size_rows
+            outputs.append(size_outputs)
+            print(f"{count:>9,} output: {size_outputs['jsonBytes']:,} bytes JSON, "
+                  f"{size_outputs['gzipBytes']:,} gzipped, {size_outputs['snapshotBytes']:,} bytes of HTML")
+
+    return {
+        "version": RESULTS_VERSION,
+        "createdAt": datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "seed": seed,
+        "radiusKm": radius_km,
+        "stages": rows,
+        "outputs": outputs,
+    }
+
+
+def compare(results, baseline):
+    # Prints time and memory ratios against a previous run; returns the regressions
+    previous = {(r['records'], r['stage']): r for r in baseline['stages']}
+    regressions = []
+    print(f"\nCompared with {baseline.get('commit') or 'baseline'} ({baseline['createdAt']}):")
+    for row in results['stages']:
+        before = previous.get((row['records'], row['stage']))
+        if before is None:
+            continue
+        time_ratio = row['seconds'] / before['seconds'] if before['seconds'] else 1.0
+        memory_ratio = (row['peakBytes'] / before['peakBytes']
+                        if row['peakBytes'] and before.get('peakBytes') else None)
+        slower = time_ratio > REGRESSION_RATIO and row['seconds'] >= MIN_SECONDS
+        bigger = memory_ratio is not None and memory_ratio > REGRESSION_RATIO
+        if slower or bigger:
+            regressions.append(row)
+        memory = '' if memory_ratio is None else f"  memory x{memory_ratio:.2f}"
+        print(f"{row['records']:>9,} {row['stage']:<17} time x{time_ratio:.2f}{memory}"
+              f"{'  REGRESSION' if slower or bigger else ''}")
+
+    previous_outputs = {o['records']: o for o in baseline.get('outputs', [])}
+    for output in results['outputs']:
+        before = previous_outputs.get(output['records'])
+        if before and output['jsonBytes'] != before['jsonBytes']:
+            print(f"{output['records']:>9,} JSON size {before['jsonBytes']:,} -> {output['jsonBytes']:,} bytes")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the strike fund pipeline on seeded synthetic data')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), metavar='N')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--radius', type=float, default=DEFAULT_RADIUS_KM, help='distance filter radius in km')
+    parser.add_argument('--no-memory', action='store_true', help='skip the tracemalloc runs (about twice as fast)')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='machine-readable results')
+    parser.add_argument('--compare', metavar='BASELINE', help='results of a previous run; exits 1 on regressions')
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.seed, args.radius, trace_memory=not args.no_memory)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"Results saved to {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('seed') != results['seed']:
+            print(f"Warning: baseline used seed {baseline.get('seed')}, not {results['seed']}")
+        regressions = compare(results, baseline)
+        if regressions:
+            print(f"{len(regressions)} regressions over x{REGRESSION_RATIO}")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
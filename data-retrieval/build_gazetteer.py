@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+import csv
+import json
+import argparse
+
+from fund_geocoder import GAZETTEER_FILE, tokenize
+
+# Column names of the INSEE / data.gouv commune exports, newest layout first
+# (communes-france-<year>.csv, then communes-departement-region.csv)
+NAME_COLUMNS = ('nom_standard', 'nom_commune_complet', 'nom_commune')
+DEPARTEMENT_COLUMNS = ('dep_code', 'code_departement')
+LAT_COLUMNS = ('latitude_centre', 'latitude_mairie', 'latitude')
+LNG_COLUMNS = ('longitude_centre', 'longitude_mairie', 'longitude')
+POPULATION_COLUMN = 'population'
+
+# Small communes add more false matches on ordinary words than real funds
+DEFAULT_MIN_POPULATION = 2000
+
+# Commune names that fund names use as ordinary words ("Cheminots gare de Lyon",
+# "CGT Orange", "Grève de la crèche"); a curated entry can still add them back
+COMMON_WORDS = {
+    'aimé', 'albert', 'avion', 'bourg', 'bus', 'canon', 'change', 'corne', 'croix', 'gare', 'grand',
+    'jardin', 'ligne', 'lire', 'marines', 'mars', 'mer', 'monnaie', 'orange', 'pasteur', 'plaisir',
+    'rouge', 'rue', 'sens', 'signes',
+    "l'union", 'la conception', 'la couronne', 'la couture', 'la crèche', 'la force', 'la garde',
+    'la machine', 'la montagne', 'la plage', 'la rose', 'le marin', 'le palais', 'le passage',
+    'le port', 'le trait', 'les forges', 'les marches',
+}
+
+
+def pick_column(fieldnames, candidates):
+    return next((name for name in candidates if name in fieldnames), None)
+
+
+def load_export(path):
+    # Communes of an INSEE/data.gouv CSV export, one entry per name and département.
+    # Postal exports repeat a commune once per postcode; the most populated row is kept.
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        header = f.readline()
+        f.seek(0)
+        reader = csv.DictReader(f, delimiter=';' if header.count(';') > header.count(',') else ',')
+        columns = [pick_column(reader.fieldnames, c) for c in (NAME_COLUMNS, DEPARTEMENT_COLUMNS, LAT_COLUMNS, LNG_COLUMNS)]
+        if None in columns:
+            raise ValueError(f'{path}: expected commune name, département code, latitude and longitude columns')
+        name_column, departement_column, lat_column, lng_column = columns
+        has_population = POPULATION_COLUMN in reader.fieldnames
+
+        communes = {}
+        for row in reader:
+            try:
+                commune = {
+                    "name": row[name_column].strip(),
+                    "departement": row[departement_column].strip().upper(),
+                    "lat": round(float(row[lat_column]), 4),
+                    "lng": round(float(row[lng_column]), 4),
+                }
+                if has_population:
+                    commune['population'] = int(float(row[POPULATION_COLUMN]))
+            except ValueError:
+                continue
+            key = (commune['name'], commune['departement'])
+            if key not in communes or commune.get('population', 0) > communes[key].get('population', 0):
+                communes[key] = commune
+    return list(communes.values()), has_population
+
+
+def build_gazetteer(base, communes, min_population=DEFAULT_MIN_POPULATION):
+    # Curated communes (no `population`) are kept as they are, with their aliases;
+    # generated ones are replaced. Names that are département or region names, or
+    # ordinary words, are left to those levels.
+    curated = [c for c in base['communes'] if 'population' not in c]
+    reserved = {tuple(tokenize(word)) for word in COMMON_WORDS}
+    reserved |= {tuple(tokenize(d['name'])) for d in base['departements']}
+    reserved |= {tuple(tokenize(name)) for r in base['regions'] for name in [r['name']] + r.get('aliases', [])}
+    curated_names = {
+        (tuple(tokenize(name)), c['departement']) for c in curated for name in [c['name']] + c.get('aliases', [])
+    }
+
+    generated = []
+    for commune in communes:
+        tokens = tuple(tokenize(commune['name']))
+        if not tokens or tokens in reserved or (tokens, commune['departement']) in curated_names:
+            continue
+        if commune.get('population', 0) < min_population:
+            continue
+        generated.append(commune)
+    # Homonyms are tried in this order, so the most populated one wins by default
+    generated.sort(key=lambda c: (-c.get('population', 0), c['name'], c['departement']))
+    return dict(base, communes=curated + generated)
+
+
+def write_gazetteer(path, data):
+    # One place per line keeps diffs of regenerated lists readable
+    lines = ['{', f'  "version": {json.dumps(data["version"])},']
+    sections = ('departements', 'regions', 'communes')
+    for i, section in enumerate(sections):
+        lines.append(f'  "{section}": [')
+        entries = [json.dumps(entry, ensure_ascii=False) for entry in data[section]]
+        lines.extend(f'    {entry},' for entry in entries[:-1])
+        lines.extend(f'    {entry}' for entry in entries[-1:])
+        lines.append('  ],' if i < len(sections) - 1 else '  ]')
+    lines.append('}')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Regenerate the communes of gazetteer_fr.json from an INSEE/data.gouv export')
+    parser.add_argument('export', help='commune CSV, e.g. communes-france-2024.csv from data.gouv.fr')
+    parser.add_argument('--min-population', type=int, default=DEFAULT_MIN_POPULATION,
+                        help='skip smaller communes (0 keeps them all)')
+    parser.add_argument('--gazetteer', default=GAZETTEER_FILE, help='gazetteer to update in place')
+    args = parser.parse_args()
+
+    with open(args.gazetteer, 'r', encoding='utf-8') as f:
+        base = json.load(f)
+    communes, has_population = load_export(args.export)
+    if args.min_population and not has_population:
+        parser.error(f'{args.export} has no population column, pass --min-population 0')
+
+    data = build_gazetteer(base, communes, args.min_population)
+    write_gazetteer(args.gazetteer, data)
+    generated = len(data['communes']) - sum(1 for c in data['communes'] if 'population' not in c)
+    print(f"Read {len(communes)} communes from {args.export}")
+    print(f"- {generated} with at least {args.min_population} inhabitants, "
+          f"{len(data['communes']) - generated} curated")
+    print(f"Gazetteer saved to {args.gazetteer}")
+
+if __name__ == "__main__":
+    main()
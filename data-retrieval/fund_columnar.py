@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+import os
+import gzip
+import json
+import math
+import time
+import array
+import struct
+import argparse
+
+try:
+    import brotli
+except ImportError:  # brotli variants are skipped without the package
+    brotli = None
+
+# Binary layout (little endian), mirrored by src/lib/fundColumns.ts:
+#   header   magic "PTGF", u16 version, u16 header size, u32 record count,
+#            u32 string count, u16 category labels, u16 urgency labels,
+#            then u32 byte offsets of each section below
+#   lat      Float32[count]  (NaN for thematic funds)
+#   lon      Float32[count]
+#   name     Uint32[count]   index into the string table
+#   url      Uint32[count]
+#   category Uint8[count]    index into the category labels
+#   urgency  Uint8[count]    index into the urgency labels
+#   strings  Uint32[string count + 1] UTF-8 offsets, then the UTF-8 data
+# The string table starts with the category labels, then the urgency labels.
+MAGIC = b'PTGF'
+SCHEMA_VERSION = 1
+HEADER = struct.Struct('<4sHHIIHH9I')
+
+CATEGORIES = ['Locale', 'Thématique']
+URGENCIES = ['', 'Moyenne', 'Élevée']
+
+
+def normalize_record(record):
+    # Accepts extractor funds (strike_funds_data.json) and gist profiles
+    if 'strikeFund' in record:
+        fund = record['strikeFund']
+        location = record.get('location') or {}
+        return {
+            "name": fund['title'],
+            "url": fund['url'],
+            "lat": location.get('lat'),
+            "lon": location.get('lon'),
+            "category": fund.get('category', ''),
+            "urgency": fund.get('urgency', ''),
+        }
+    return {
+        "name": record['name'],
+        "url": record['url'],
+        "lat": record.get('lat'),
+        "lon": record.get('lng'),
+        "category": 'Thématique' if record.get('type') == 'thematic' else 'Locale',
+        "urgency": record.get('urgency', ''),
+    }
+
+
+def load_records(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data['profiles']
+    return [normalize_record(r) for r in data]
+
+
+def _align(buffer, size=4):
+    buffer.extend(b'\0' * (-len(buffer) % size))
+
+
+def encode(records):
+    categories = list(CATEGORIES)
+    urgencies = list(URGENCIES)
+    for record in records:
+        if record['category'] not in categories:
+            categories.append(record['category'])
+        if record['urgency'] not in urgencies:
+            urgencies.append(record['urgency'])
+    if len(categories) > 255 or len(urgencies) > 255:
+        raise ValueError('too many distinct categories or urgencies for a Uint8 column')
+
+    strings = categories + urgencies
+    string_ids = {}
+    name_col, url_col = array.array('I'), array.array('I')
+    for column, key in ((name_col, 'name'), (url_col, 'url')):
+        for record in records:
+            value = record[key]
+            if value not in string_ids:
+                string_ids[value] = len(strings)
+                strings.append(value)
+            column.append(string_ids[value])
+
+    nan = float('nan')
+    lat_col = array.array('f', (nan if r['lat'] is None else r['lat'] for r in records))
+    lon_col = array.array('f', (nan if r['lon'] is None else r['lon'] for r in records))
+    category_col = bytes(categories.index(r['category']) for r in records)
+    urgency_col = bytes(urgencies.index(r['urgency']) for r in records)
+
+    encoded = [s.encode('utf-8') for s in strings]
+    string_offsets = array.array('I', [0])
+    for value in encoded:
+        string_offsets.append(string_offsets[-1] + len(value))
+    string_data = b''.join(encoded)
+
+    body = bytearray(HEADER.size)
+    offsets = []
+    for section in (lat_col, lon_col, name_col, url_col, category_col, urgency_col, string_offsets):
+        _align(body)
+        offsets.append(len(body))
+        body.extend(section.tobytes() if isinstance(section, array.array) else section)
+    offsets.append(len(body))
+    body.extend(string_data)
+
+    HEADER.pack_into(
+        body, 0, MAGIC, SCHEMA_VERSION, HEADER.size, len(records), len(strings),
+        len(categories), len(urgencies), *offsets, len(string_data),
+    )
+    return bytes(body)
+
+
+def read_header(buffer):
+    magic, version, _, count, string_count, n_categories, n_urgencies, *offsets = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC or version != SCHEMA_VERSION:
+        raise ValueError(f'unsupported columnar file (magic={magic!r}, version={version})')
+    return count, string_count, n_categories, n_urgencies, offsets
+
+
+def coordinates(buffer):
+    # Zero-copy Float32 views over the lat/lon columns
+    count, _, _, _, offsets = read_header(buffer)
+    view = memoryview(buffer)
+    return view[offsets[0]:offsets[0] + 4 * count].cast('f'), view[offsets[1]:offsets[1] + 4 * count].cast('f')
+
+
+def decode(buffer):
+    count, string_count, n_categories, n_urgencies, offsets = read_header(buffer)
+    _, _, name_at, url_at, category_at, urgency_at, string_offsets_at, string_data_at, string_data_len = offsets
+
+    view = memoryview(buffer)
+    lats, lons = coordinates(buffer)
+    names = view[name_at:name_at + 4 * count].cast('I')
+    urls = view[url_at:url_at + 4 * count].cast('I')
+    string_offsets = view[string_offsets_at:string_offsets_at + 4 * (string_count + 1)].cast('I')
+    string_data = bytes(view[string_data_at:string_data_at + string_data_len])
+    strings = [string_data[string_offsets[i]:string_offsets[i + 1]].decode('utf-8') for i in range(string_count)]
+    categories = strings[:n_categories]
+    urgencies = strings[n_categories:n_categories + n_urgencies]
+
+    return [
+        {
+            "name": strings[names[i]],
+            "url": strings[urls[i]],
+            "lat": None if math.isnan(lats[i]) else lats[i],
+            "lon": None if math.isnan(lons[i]) else lons[i],
+            "category": categories[buffer[category_at + i]],
+            "urgency": urgencies[buffer[urgency_at + i]],
+        }
+        for i in range(count)
+    ]
+
+
+def compressed_variants(data):
+    variants = {'.gz': gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants['.br'] = brotli.compress(data, quality=11)
+    return variants
+
+
+def write_columnar(records, path):
+    # Writes the binary file and its precompressed variants; returns {path: size}
+    data = encode(records)
+    written = {path: len(data)}
+    with open(path, 'wb') as f:
+        f.write(data)
+    for suffix, payload in compressed_variants(data).items():
+        with open(path + suffix, 'wb') as f:
+            f.write(payload)
+        written[path + suffix] = len(payload)
+    return written
+
+
+def _best_time(fn, repeat=20):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def compare(json_path, binary):
+    # Size and parse-time comparison between the JSON input and the columnar file
+    with open(json_path, 'rb') as f:
+        raw_json = f.read()
+    rows = [("JSON", raw_json, lambda: json.loads(raw_json)),
+            ("columnar", binary, lambda: decode(binary))]
+
+    print(f"{'format':<10} {'raw':>10} {'gzip':>10} {'brotli':>10} {'parse':>10}")
+    for label, data, parse in rows:
+        variants = compressed_variants(data)
+        br = f"{len(variants['.br']):,}" if '.br' in variants else 'n/a'
+        print(f"{label:<10} {len(data):>10,} {len(variants['.gz']):>10,} {br:>10} {_best_time(parse) * 1000:>8.2f}ms")
+    # The client only needs the coordinates up front; that read is zero-copy
+    print(f"columnar coordinates only: {_best_time(lambda: coordinates(binary)) * 1000:>.3f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write a compact columnar export of strike funds or gist profiles')
+    parser.add_argument('--data', default='strike_funds_data.json', help='extractor output or gist profiles JSON')
+    parser.add_argument('--output', help='binary output (default: <data>.bin)')
+    parser.add_argument('--compare', action='store_true', help='print a size and parse-time comparison with the JSON')
+    args = parser.parse_args()
+
+    output = args.output or os.path.splitext(args.data)[0] + '.bin'
+    records = load_records(args.data)
+    for path, size in write_columnar(records, output).items():
+        print(f"- {path}: {size:,} bytes")
+    print(f"Wrote {len(records)} records (schema v{SCHEMA_VERSION})")
+
+    if args.compare:
+        with open(output, 'rb') as f:
+            compare(args.data, f.read())
+
+if __name__ == "__main__":
+    main()
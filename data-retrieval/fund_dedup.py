@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+import re
+import json
+import math
+import argparse
+import unicodedata
+from difflib import SequenceMatcher
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode, unquote_plus
+
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'igshid', 'mc_cid', 'mc_eid',
+    '_hsenc', '_hsmi', 'mkt_tok', 'yclid', 'twclid',
+}
+TRACKING_PREFIXES = ('utm_',)
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+# Words that every fund name shares and that only add noise to name matching
+NAME_STOPWORDS = {
+    'caisse', 'de', 'des', 'du', 'la', 'le', 'les', 'l', 'd', 'et', 'en', 'a', 'au', 'aux',
+    'greve', 'soutien', 'solidarite', 'pour',
+}
+FUZZY_THRESHOLD = 0.85
+# Within a block, names are only compared to their neighbours in sorted order
+# (by words as written, then as a sorted bag of words); smaller blocks compare all pairs
+SORT_WINDOW = 10
+# Records sharing a URL further apart than this are separate local funds pointing at
+# a national collection page: they are reported, never merged
+MERGE_DISTANCE_KM = 50
+EARTH_RADIUS_KM = 6371
+DEFAULT_REPORT_FILE = 'strike_funds_duplicates.json'
+
+
+def is_tracking_param(key):
+    key = key.lower()
+    return key in TRACKING_PARAMS or key.startswith(TRACKING_PREFIXES)
+
+
+def strip_tracking(url):
+    # The URL as published, minus tracking parameters; the rest is left untouched
+    url = url.strip()
+    parts = urlsplit(url)
+    if not parts.query:
+        return url
+    query = [p for p in parts.query.split('&') if p and not is_tracking_param(unquote_plus(p.split('=', 1)[0]))]
+    return urlunsplit(parts._replace(query='&'.join(query)))
+
+
+def canonicalize_url(url):
+    # Join key only: lowercased host, no default port, trailing slash, tracking
+    # parameters or router fragment, and a sorted query
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+
+    path = re.sub(r'/{2,}', '/', parts.path)
+    if path.endswith('/'):
+        path = path.rstrip('/')
+
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not is_tracking_param(key)
+    ]
+    # Empty or "#/" fragments are leftovers from client-side routers
+    fragment = parts.fragment if parts.fragment.strip('/') else ''
+    return urlunsplit((scheme, host, path, urlencode(sorted(query)), fragment))
+
+
+def normalize_name(name):
+    ascii_name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii')
+    tokens = re.split(r'[^a-z0-9]+', ascii_name.lower())
+    return [t for t in tokens if t and t not in NAME_STOPWORDS]
+
+
+def name_similarity(tokens_a, tokens_b, threshold=0.0, matcher=None):
+    # Scores below `threshold` may be returned as a lower bound: ratio() is only
+    # computed when its cheap upper bounds can still reach the threshold.
+    # `matcher` may already hold tokens_b as its second sequence, which
+    # SequenceMatcher indexes once for every name compared against it.
+    if not tokens_a or not tokens_b:
+        return 0.0
+    set_a, set_b = set(tokens_a), set(tokens_b)
+    jaccard = len(set_a & set_b) / len(set_a | set_b)
+    if matcher is None:
+        matcher = SequenceMatcher(None, ' '.join(tokens_a), ' '.join(tokens_b))
+    else:
+        matcher.set_seq1(' '.join(tokens_a))
+    if jaccard < threshold and (matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold):
+        return jaccard
+    return max(jaccard, matcher.ratio())
+
+
+def blocking_key(fund):
+    # Only funds on the same host and around the same place are ever compared
+    host = urlsplit(fund['url']).hostname or ''
+    if 'lat' in fund and 'lng' in fund:
+        return host, round(fund['lat'], 1), round(fund['lng'], 1)
+    return host, fund.get('type', '')
+
+
+def neighbourhood_pairs(tokens, window=SORT_WINDOW):
+    # Sorted-neighbourhood blocking: positions (i < j) within `window` of each other
+    # in either sort order, so the cost grows with the block size instead of its square
+    count = len(tokens)
+    if count <= window + 1:
+        return [(i, j) for i in range(count) for j in range(i + 1, count)]
+    pairs = set()
+    for sort_key in (lambda i: tokens[i], lambda i: sorted(tokens[i])):
+        order = sorted(range(count), key=sort_key)
+        for rank, i in enumerate(order):
+            for j in order[rank + 1:rank + 1 + window]:
+                pairs.add((i, j) if i < j else (j, i))
+    return sorted(pairs)
+
+
+def distance_km(a, b):
+    # Haversine distance, or None when either record has no coordinates
+    if 'lat' not in a or 'lng' not in a or 'lat' not in b or 'lng' not in b:
+        return None
+    lat1, lon1, lat2, lon2 = map(math.radians, (a['lat'], a['lng'], b['lat'], b['lng']))
+    h = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(h))
+
+
+def merge_exact(funds, max_distance_km=MERGE_DISTANCE_KM):
+    # Hash join on canonical URL; the first record wins and absorbs missing fields.
+    # A URL shared by far-apart records keeps one record per place, and is reported.
+    # Records keep their own URL (minus tracking parameters) next to `canonicalUrl`.
+    merged, groups = [], {}
+    for fund in funds:
+        key = canonicalize_url(fund['url'])
+        places = groups.setdefault(key, [])
+        group = None
+        for candidate in places:
+            distance = distance_km(candidate['record'], fund)
+            if distance is None or distance <= max_distance_km:
+                group = candidate
+                break
+        if group is None:
+            record = dict(fund, url=strip_tracking(fund['url']), canonicalUrl=key)
+            places.append({"record": record, "names": [fund['name']], "urls": [fund['url']]})
+            merged.append(record)
+            continue
+        group['names'].append(fund['name'])
+        group['urls'].append(fund['url'])
+        for field, value in fund.items():
+            group['record'].setdefault(field, value)
+        aliases = group['record'].get('aliases', [])
+        if fund['name'] != group['record']['name'] and fund['name'] not in aliases:
+            group['record']['aliases'] = aliases + [fund['name']]
+
+    report = [
+        {"canonicalUrl": key, "kept": g['names'][0], "duplicates": g['names'][1:], "urls": sorted(set(g['urls']))}
+        for key, places in groups.items() for g in places if len(g['names']) > 1
+    ]
+    conflicts = [
+        {
+            "canonicalUrl": key,
+            "names": [g['record']['name'] for g in places],
+            "coordinates": [[g['record']['lat'], g['record']['lng']] for g in places],
+        }
+        for key, places in groups.items() if len(places) > 1
+    ]
+    return merged, report, conflicts
+
+
+def find_fuzzy_duplicates(funds, threshold=FUZZY_THRESHOLD):
+    blocks = {}
+    for position, fund in enumerate(funds):
+        blocks.setdefault(blocking_key(fund), []).append(position)
+
+    flagged, comparisons = [], 0
+    for members in blocks.values():
+        tokens = [tuple(normalize_name(funds[p]['name'])) for p in members]
+        # Names repeat a lot within a block: score each distinct pair once
+        scores, matchers = {}, {}
+        for i, j in neighbourhood_pairs(tokens):
+            comparisons += 1
+            # Ordered: SequenceMatcher.ratio() is not always symmetric
+            pair = (tokens[i], tokens[j])
+            score = scores.get(pair)
+            if score is None:
+                matcher = matchers.get(tokens[j])
+                if matcher is None:
+                    matcher = matchers[tokens[j]] = SequenceMatcher(None, '', ' '.join(tokens[j]))
+                score = scores[pair] = name_similarity(tokens[i], tokens[j], threshold, matcher)
+            if score >= threshold:
+                a, b = funds[members[i]], funds[members[j]]
+                flagged.append({"names": [a['name'], b['name']], "urls": [a['url'], b['url']], "score": round(score, 3)})
+    return flagged, comparisons
+
+
+def deduplicate(funds, mode='merge', threshold=FUZZY_THRESHOLD):
+    # mode='merge' collapses exact canonical-URL duplicates; mode='flag' only reports them.
+    # Fuzzy name matches are always only flagged: different URLs may be separate campaigns.
+    merged, exact, conflicts = merge_exact(funds)
+    flagged, comparisons = find_fuzzy_duplicates(merged, threshold)
+    output = merged if mode == 'merge' else funds
+    report = {
+        "exact": exact,
+        "fuzzy": flagged,
+        "urlConflicts": conflicts,
+        "stats": {
+            "input": len(funds),
+            "output": len(output),
+            "exactGroups": len(exact),
+            "fuzzyPairs": len(flagged),
+            "urlConflicts": len(conflicts),
+            "comparisons": comparisons,
+        },
+    }
+    return output, report
+
+
+def write_report(path, report):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Report and merge duplicate strike funds')
+    parser.add_argument('--data', default='strike_funds_data.json')
+    parser.add_argument('--report', default=DEFAULT_REPORT_FILE)
+    parser.add_argument('--threshold', type=float, default=FUZZY_THRESHOLD)
+    args = parser.parse_args()
+
+    with open(args.data, 'r', encoding='utf-8') as f:
+        funds = json.load(f)
+
+    _, report = deduplicate(funds, mode='flag', threshold=args.threshold)
+    write_report(args.report, report)
+
+    stats = report['stats']
+    print(f"{stats['exactGroups']} exact duplicate groups, {stats['fuzzyPairs']} fuzzy pairs "
+          f"({stats['comparisons']} comparisons)")
+    print(f"{stats['urlConflicts']} URLs shared by funds more than {MERGE_DISTANCE_KM} km apart (not merged)")
+    print(f"Report saved to {args.report}")
+
+if __name__ == "__main__":
+    main()
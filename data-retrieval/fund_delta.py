@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+import os
+import json
+import hashlib
+
+from fund_dedup import canonicalize_url
+
+STATE_VERSION = 2
+# The latest extraction (snapshot fingerprint, settings and record hashes)
+DEFAULT_STATE_FILE = 'strike_funds_state.json'
+# The catalogue last uploaded to the gist; only apply_strike_data_delta.js writes it
+DEFAULT_BASELINE_FILE = 'strike_funds_baseline.json'
+DEFAULT_DELTA_FILE = 'strike_funds_delta.json'
+
+
+def fund_id(fund):
+    # Stable ID derived from the canonical fund URL, so renames show up as changes
+    return hashlib.sha1(canonicalize_url(fund['url']).encode('utf-8')).hexdigest()[:12]
+
+
+def content_hash(fund):
+    payload = {k: v for k, v in fund.items() if k != 'id'}
+    encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()[:16]
+
+
+def assign_ids(funds):
+    # Two names sharing one URL get IDs salted with the name, which stays stable across runs
+    seen = set()
+    for fund in funds:
+        base = fund_id(fund)
+        fid = base
+        if fid in seen:
+            salted = hashlib.sha1(f"{canonicalize_url(fund['url'])}\n{fund['name']}".encode('utf-8')).hexdigest()[:12]
+            fid = salted
+            n = 2
+            while fid in seen:
+                fid = f"{salted}-{n}"
+                n += 1
+        seen.add(fid)
+        fund['id'] = fid
+    return funds
+
+
+def catalogue_hash(records):
+    digest = hashlib.sha256()
+    for fid in sorted(records):
+        digest.update(f"{fid}:{records[fid]}\n".encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+def source_fingerprint(paths):
+    # Cheap change detection: size and mtime of every snapshot, no parsing needed
+    fingerprint = {}
+    for path in paths:
+        stat = os.stat(path)
+        fingerprint[os.path.abspath(path)] = [stat.st_size, stat.st_mtime_ns]
+    return fingerprint
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+def params_hash(params):
+    # Extraction settings (zoom, origin, geocoding, dedup, gazetteer digest...);
+    # a change forces a full re-extract even when no snapshot changed
+    encoded = json.dumps(params, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()[:16]
+
+
+def load_state(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        state = json.load(f)
+    if state.get('version') != STATE_VERSION:
+        return None
+    return state
+
+
+def save_state(path, sources, records, params=None):
+    state = {
+        "version": STATE_VERSION,
+        "sources": sources,
+        "params": params,
+        "catalogueHash": catalogue_hash(records),
+        "records": records,
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def compute_delta(funds, previous_records):
+    # funds must already carry their `id`; previous_records maps id -> content hash
+    records = {fund['id']: content_hash(fund) for fund in funds}
+    added, changed = [], []
+    for fund in funds:
+        old_hash = previous_records.get(fund['id'])
+        if old_hash is None:
+            added.append(fund)
+        elif old_hash != records[fund['id']]:
+            changed.append(fund)
+    removed = sorted(fid for fid in previous_records if fid not in records)
+
+    delta = {
+        "previousHash": catalogue_hash(previous_records),
+        "catalogueHash": catalogue_hash(records),
+        "added": added,
+        "changed": changed,
+        "removed": removed,
+    }
+    return delta, records
+
+
+def is_empty(delta):
+    return not (delta['added'] or delta['changed'] or delta['removed'])
+
+
+def write_delta(path, delta):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(delta, f, ensure_ascii=False, indent=2)
+
+
+def run_incremental(extract, sources, output, state_path=DEFAULT_STATE_FILE, delta_path=DEFAULT_DELTA_FILE,
+                    params=None, baseline_path=DEFAULT_BASELINE_FILE):
+    # `extract` is only called when a snapshot or the extraction `params` changed
+    # since the last run; otherwise the previous output is reused. The delta is
+    # always against the baseline, the catalogue last uploaded, so runs that are
+    # never pushed do not lose changes: the next delta still carries them.
+    state = load_state(state_path)
+    fingerprint = source_fingerprint(sources)
+    settings = params_hash(params or {})
+    unchanged = state and state['sources'] == fingerprint and state.get('params') == settings
+    if unchanged and os.path.exists(output):
+        with open(output, 'r', encoding='utf-8') as f:
+            funds = json.load(f)
+    else:
+        funds = assign_ids(extract())
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(funds, f, ensure_ascii=False, indent=2)
+
+    baseline = load_state(baseline_path)
+    delta, records = compute_delta(funds, baseline['records'] if baseline else {})
+    # Nothing uploaded yet: the uploader must replace the whole catalogue
+    delta['full'] = baseline is None
+    write_delta(delta_path, delta)
+    save_state(state_path, fingerprint, records, settings)
+    return delta
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+import os
+import re
+import csv
+import json
+import argparse
+import unicodedata
+from collections import deque
+
+GAZETTEER_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gazetteer_fr.json')
+
+# The generic pair many map markers fall back to when the real place is unknown
+FALLBACK_COORDINATES = (48.8, 2.3)
+# Only absorbs pixel rounding: real Paris addresses are a few hundred metres away
+FALLBACK_TOLERANCE = 1e-3
+
+# Abbreviations expanded before matching ("St-Denis" -> "saint denis")
+TOKEN_ALIASES = {'st': 'saint', 'ste': 'sainte'}
+# "64 ans", "35 h": numbers that are not département codes
+NUMBER_UNITS = {'an', 'ans', 'h', 'heures', 'euros', 'eur', 'jours', 'mois', 'km', 'eme', 'e'}
+
+LEVELS = ('commune', 'departement', 'region')
+
+
+def tokenize(text):
+    ascii_text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    tokens = re.findall(r'[a-z0-9]+', ascii_text.lower())
+    return [TOKEN_ALIASES.get(t, t) for t in tokens]
+
+
+class TokenAutomaton:
+    # Aho-Corasick over word tokens: every place name is matched in a single
+    # left-to-right pass, and only on whole words.
+
+    def __init__(self):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+
+    def add(self, tokens, value):
+        state = 0
+        for token in tokens:
+            if token not in self.goto[state]:
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+                self.goto[state][token] = len(self.goto) - 1
+            state = self.goto[state][token]
+        self.output[state].append((len(tokens), value))
+
+    def build(self):
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and token not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(token, 0)
+                self.output[child] = self.output[child] + self.output[self.fail[child]]
+        return self
+
+    def search(self, tokens):
+        # Yields (start, end, value) for every occurrence, overlaps included
+        state = 0
+        for end, token in enumerate(tokens, 1):
+            while state and token not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(token, 0)
+            for length, value in self.output[state]:
+                yield end - length, end, value
+
+
+def load_communes_csv(path):
+    # Full commune lists (e.g. the INSEE/data.gouv export) with columns
+    # nom_commune, code_departement, latitude, longitude
+    communes = []
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            try:
+                communes.append({
+                    "name": row['nom_commune'],
+                    "departement": row['code_departement'],
+                    "lat": float(row['latitude']),
+                    "lng": float(row['longitude']),
+                })
+            except (KeyError, ValueError):
+                continue
+    return communes
+
+
+class Gazetteer:
+
+    def __init__(self, path=GAZETTEER_FILE, extra_communes=()):
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        # Keyed by lowercase code, as tokens are ("2a", "75", "971")
+        self.departements = {d['code'].lower(): d for d in data['departements']}
+        self.automaton = TokenAutomaton()
+        for departement in data['departements']:
+            self.automaton.add(tokenize(departement['name']), ('departement', departement))
+        for region in data['regions']:
+            for name in [region['name']] + region.get('aliases', []):
+                self.automaton.add(tokenize(name), ('region', region))
+        seen = set()
+        for commune in list(data['communes']) + list(extra_communes):
+            key = (commune['name'], commune['departement'])
+            if key in seen:
+                continue
+            seen.add(key)
+            for name in [commune['name']] + commune.get('aliases', []):
+                self.automaton.add(tokenize(name), ('commune', commune))
+        self.automaton.build()
+
+    def _departement_numbers(self, tokens):
+        numeric = [t.isdigit() for t in tokens]
+        for i, token in enumerate(tokens):
+            if token not in self.departements or not (token.isdigit() or token in ('2a', '2b')):
+                continue
+            # Skip phone numbers and other runs of numbers
+            run = sum(1 for j in range(max(0, i - 2), min(len(tokens), i + 3)) if numeric[j])
+            if run >= 3:
+                continue
+            if i + 1 < len(tokens) and tokens[i + 1] in NUMBER_UNITS:
+                continue
+            yield i, i + 1, ('departement', self.departements[token])
+
+    def match(self, name):
+        # Returns (level, place) for the most specific place named, or None
+        tokens = tokenize(name)
+        matches = list(self.automaton.search(tokens)) + list(self._departement_numbers(tokens))
+        if not matches:
+            return None
+
+        # Keep the longest non-overlapping matches ("val d oise" over "oise");
+        # on equal spans the commune wins over the département ("Paris")
+        matches.sort(key=lambda m: (-(m[1] - m[0]), LEVELS.index(m[2][0]), m[0]))
+        # Homonyms share a span ("Saint-Paul"); the first listed is the default
+        homonyms = {}
+        for start, end, (level, place) in matches:
+            if level == 'commune':
+                homonyms.setdefault((start, end), []).append(place)
+        taken, kept = set(), []
+        for start, end, value in matches:
+            span = set(range(start, end))
+            if span & taken:
+                continue
+            taken |= span
+            kept.append((start, end, value))
+        kept.sort(key=lambda m: m[0])
+
+        by_level = {level: [place for _, _, (lvl, place) in kept if lvl == level] for level in LEVELS}
+        communes = by_level['commune']
+        if communes:
+            codes = {d['code'] for d in by_level['departement']}
+            consistent = [
+                c for start, end, (level, _) in kept if level == 'commune'
+                for c in homonyms[(start, end)] if c['departement'] in codes
+            ]
+            # Later mentions are usually the specific place ("Paris-Est Créteil")
+            return 'commune', (consistent or communes)[-1]
+        if by_level['departement']:
+            return 'departement', by_level['departement'][-1]
+        return 'region', by_level['region'][-1]
+
+
+def needs_geocoding(fund):
+    if 'lat' not in fund or 'lng' not in fund:
+        return True
+    lat, lng = FALLBACK_COORDINATES
+    return abs(fund['lat'] - lat) < FALLBACK_TOLERANCE and abs(fund['lng'] - lng) < FALLBACK_TOLERANCE
+
+
+def geocode_funds(funds, gazetteer=None):
+    # Fills in coordinates for funds at the fallback pair or without a location.
+    # Returns (funds, stats); only the name is used, there are no network calls.
+    gazetteer = gazetteer or Gazetteer()
+    stats = {"candidates": 0, "geocoded": 0, **{level: 0 for level in LEVELS}}
+    for fund in funds:
+        if not needs_geocoding(fund):
+            continue
+        stats['candidates'] += 1
+        found = gazetteer.match(fund['name'])
+        if found is None:
+            continue
+        level, place = found
+        fund['lat'], fund['lng'] = place['lat'], place['lng']
+        fund['geocode'] = {"place": place['name'], "level": level}
+        stats['geocoded'] += 1
+        stats[level] += 1
+    return funds, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Geocode strike funds offline from the place names they mention')
+    parser.add_argument('--data', default='strike_funds_data.json')
+    parser.add_argument('--output', help='output file (default: overwrite --data)')
+    parser.add_argument('--communes', help='optional CSV of all communes to extend the bundled gazetteer')
+    args = parser.parse_args()
+
+    with open(args.data, 'r', encoding='utf-8') as f:
+        funds = json.load(f)
+
+    extra = load_communes_csv(args.communes) if args.communes else ()
+    funds, stats = geocode_funds(funds, Gazetteer(extra_communes=extra))
+
+    output = args.output or args.data
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(funds, f, ensure_ascii=False, indent=2)
+
+    print(f"Geocoded {stats['geocoded']} of {stats['candidates']} funds without a precise location")
+    print(f"- {stats['commune']} communes, {stats['departement']} départements, {stats['region']} regions")
+    print(f"Data saved to {output}")
+
+if __name__ == "__main__":
+    main()
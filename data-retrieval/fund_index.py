@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+import os
+import json
+import hashlib
+import argparse
+
+import numpy as np
+
+# Same Earth radius as haversineKm() in src/lib/geo.ts
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEG_LAT = np.pi * EARTH_RADIUS_KM / 180.0
+MAX_DISTANCE_KM = np.pi * EARTH_RADIUS_KM
+
+DEFAULT_CELL_DEG = 0.5
+INDEX_VERSION = 1
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    # Batched haversine: any of the arguments may be NumPy arrays (broadcasting)
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(v, dtype=np.float64)) for v in (lat1, lon1, lat2, lon2))
+    sin_dlat = np.sin((lat2 - lat1) / 2)
+    sin_dlon = np.sin((lon2 - lon1) / 2)
+    h = sin_dlat * sin_dlat + np.cos(lat1) * np.cos(lat2) * sin_dlon * sin_dlon
+    return 2 * EARTH_RADIUS_KM * np.arctan2(np.sqrt(h), np.sqrt(np.clip(1 - h, 0, None)))
+
+
+class FundIndex:
+    # Fixed lat/lon grid index. Points are sorted by cell key (row-major), so
+    # every row of cells touched by a query is one contiguous slice; the slices
+    # are then checked exactly with batched haversine.
+
+    def __init__(self, lats, lons, ids, cell_deg=DEFAULT_CELL_DEG):
+        self.cell_deg = float(cell_deg)
+        self.n_rows = int(np.ceil(180.0 / self.cell_deg)) + 1
+        self.n_cols = int(np.ceil(360.0 / self.cell_deg)) + 1
+
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        keys = self._cell_rows(lats) * self.n_cols + self._cell_cols(lons)
+        order = np.argsort(keys, kind='stable')
+
+        self.lats = lats[order]
+        self.lons = lons[order]
+        self.ids = np.asarray(ids, dtype=np.int64)[order]
+        self.keys = keys[order]
+
+    def __len__(self):
+        return len(self.ids)
+
+    @classmethod
+    def from_funds(cls, funds, cell_deg=DEFAULT_CELL_DEG):
+        # `ids` are positions in the funds list; funds without coordinates are skipped
+        located = [(i, f['lat'], f['lng']) for i, f in enumerate(funds) if 'lat' in f and 'lng' in f]
+        ids = [i for i, _, _ in located]
+        lats = [lat for _, lat, _ in located]
+        lons = [lng for _, _, lng in located]
+        return cls(lats, lons, ids, cell_deg=cell_deg)
+
+    def _cell_rows(self, lats):
+        return np.floor((np.asarray(lats) + 90.0) / self.cell_deg).astype(np.int64)
+
+    def _cell_cols(self, lons):
+        return np.floor((np.asarray(lons) + 180.0) / self.cell_deg).astype(np.int64)
+
+    def _candidates(self, lat, lon, km):
+        # Indexes (into the sorted arrays) of points in cells overlapping the query's bounding box
+        dlat = km / KM_PER_DEG_LAT
+        lat_lo, lat_hi = max(lat - dlat, -90.0), min(lat + dlat, 90.0)
+        max_abs_lat = max(abs(lat_lo), abs(lat_hi))
+        if km >= MAX_DISTANCE_KM / 2 or max_abs_lat >= 89.0:
+            lon_spans = [(-180.0, 180.0)]
+        else:
+            dlon = km / (KM_PER_DEG_LAT * np.cos(np.radians(max_abs_lat)))
+            if dlon >= 180.0:
+                lon_spans = [(-180.0, 180.0)]
+            elif lon - dlon < -180.0:
+                lon_spans = [(-180.0, lon + dlon), (lon - dlon + 360.0, 180.0)]
+            elif lon + dlon > 180.0:
+                lon_spans = [(lon - dlon, 180.0), (-180.0, lon + dlon - 360.0)]
+            else:
+                lon_spans = [(lon - dlon, lon + dlon)]
+
+        rows = np.arange(self._cell_rows(lat_lo), self._cell_rows(lat_hi) + 1)
+        slices = []
+        for lon_lo, lon_hi in lon_spans:
+            col_lo, col_hi = self._cell_cols(lon_lo), self._cell_cols(lon_hi)
+            starts = np.searchsorted(self.keys, rows * self.n_cols + col_lo, side='left')
+            ends = np.searchsorted(self.keys, rows * self.n_cols + col_hi, side='right')
+            slices.extend(np.arange(s, e) for s, e in zip(starts, ends) if e > s)
+        if not slices:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate(slices)
+
+    def within_radius(self, lat, lon, km):
+        # Returns (ids, distances_km) sorted by distance
+        candidates = self._candidates(lat, lon, km)
+        dists = haversine_km(lat, lon, self.lats[candidates], self.lons[candidates])
+        keep = dists <= km
+        candidates, dists = candidates[keep], dists[keep]
+        order = np.argsort(dists, kind='stable')
+        return self.ids[candidates[order]], dists[order]
+
+    def nearest(self, lat, lon, k=1):
+        # Grow the search radius until it holds k points; those are then the exact k nearest
+        k = min(k, len(self))
+        if k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        km = self.cell_deg * KM_PER_DEG_LAT
+        while True:
+            ids, dists = self.within_radius(lat, lon, km)
+            if len(ids) >= k or km >= MAX_DISTANCE_KM:
+                return ids[:k], dists[:k]
+            km = min(km * 2, MAX_DISTANCE_KM)
+
+    def within_radius_many(self, lats, lons, km):
+        # Bulk mode: one (ids, distances_km) pair per query location. Queries are
+        # grouped by grid cell so each group shares one candidate lookup and one
+        # (queries x candidates) distance matrix.
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        results = [None] * len(lats)
+        query_keys = self._cell_rows(lats) * self.n_cols + self._cell_cols(lons)
+        order = np.argsort(query_keys, kind='stable')
+        cell_keys, starts = np.unique(query_keys[order], return_index=True)
+        # Any point within `km` of a query lies within `km + pad` of its cell centre
+        pad = self.cell_deg * KM_PER_DEG_LAT * np.sqrt(2)
+
+        for key, group in zip(cell_keys, np.split(order, starts[1:])):
+            row, col = divmod(int(key), self.n_cols)
+            centre_lat = min((row + 0.5) * self.cell_deg - 90.0, 90.0)
+            centre_lon = min((col + 0.5) * self.cell_deg - 180.0, 180.0)
+            candidates = self._candidates(centre_lat, centre_lon, km + pad)
+            dists = haversine_km(
+                lats[group][:, None], lons[group][:, None],
+                self.lats[candidates][None, :], self.lons[candidates][None, :],
+            )
+            for query, row_dists in zip(group, dists):
+                keep = np.nonzero(row_dists <= km)[0]
+                keep = keep[np.argsort(row_dists[keep], kind='stable')]
+                results[query] = (self.ids[candidates[keep]], row_dists[keep])
+        return results
+
+    def nearest_many(self, lats, lons, k=1):
+        return [self.nearest(lat, lon, k) for lat, lon in zip(np.asarray(lats, dtype=np.float64), np.asarray(lons, dtype=np.float64))]
+
+    def save(self, path, source_hash=''):
+        with open(path, 'wb') as f:
+            np.savez_compressed(
+                f,
+                version=INDEX_VERSION,
+                cell_deg=self.cell_deg,
+                source_hash=source_hash,
+                lats=self.lats,
+                lons=self.lons,
+                ids=self.ids,
+            )
+
+    @classmethod
+    def load(cls, path):
+        # Returns (index, source_hash), or (None, None) for a missing or outdated file
+        if not os.path.exists(path):
+            return None, None
+        with np.load(path) as data:
+            if int(data['version']) != INDEX_VERSION:
+                return None, None
+            index = cls(data['lats'], data['lons'], data['ids'], cell_deg=float(data['cell_deg']))
+            return index, str(data['source_hash'])
+
+
+def index_path_for(json_path):
+    return os.path.splitext(json_path)[0] + '_index.npz'
+
+
+def load_or_build_index(json_path, index_path=None, cell_deg=DEFAULT_CELL_DEG):
+    # Reuse the saved index when it was built from the same JSON content
+    index_path = index_path or index_path_for(json_path)
+    with open(json_path, 'rb') as f:
+        raw = f.read()
+    source_hash = hashlib.sha256(raw).hexdigest()
+    funds = json.loads(raw)
+
+    index, saved_hash = FundIndex.load(index_path)
+    if index is None or saved_hash != source_hash or index.cell_deg != cell_deg:
+        index = FundIndex.from_funds(funds, cell_deg=cell_deg)
+        index.save(index_path, source_hash=source_hash)
+    return funds, index
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build and query the spatial index over strike funds')
+    parser.add_argument('--data', default='strike_funds_data.json')
+    parser.add_argument('--index', help='index file (default: <data>_index.npz)')
+    parser.add_argument('--near', type=float, nargs=2, metavar=('LAT', 'LON'))
+    parser.add_argument('--k', type=int, default=5)
+    parser.add_argument('--radius', type=float, help='list funds within this many km instead of the k nearest')
+    args = parser.parse_args()
+
+    funds, index = load_or_build_index(args.data, args.index)
+    print(f"Indexed {len(index)} of {len(funds)} strike funds")
+
+    if args.near:
+        lat, lon = args.near
+        if args.radius is not None:
+            ids, dists = index.within_radius(lat, lon, args.radius)
+        else:
+            ids, dists = index.nearest(lat, lon, args.k)
+        for fund_id, dist in zip(ids, dists):
+            print(f"- {dist:7.1f} km  {funds[fund_id]['name']}")
+
+if __name__ == "__main__":
+    main()
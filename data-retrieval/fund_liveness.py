@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+import re
+import os
+import json
+import time
+import asyncio
+import argparse
+from urllib.parse import urlsplit
+
+import aiohttp
+
+DEFAULT_CACHE_FILE = 'strike_funds_url_cache.json'
+DEFAULT_STATUS_FILE = 'strike_funds_status.json'
+DEFAULT_TTL = 24 * 3600
+# Connection errors are often transient: retry them on the next run
+ERROR_TTL = 15 * 60
+CACHE_VERSION = 1
+
+REQUEST_TIMEOUT = 20
+MAX_REDIRECTS = 10
+# Amounts are only looked for near the top of the page
+MAX_BODY_BYTES = 512 * 1024
+USER_AGENT = 'PayeTonGreviste-LinkChecker'
+
+# Per-host concurrency caps and minimum delay between requests (seconds).
+# Most links go to a handful of platforms, so each gets its own budget.
+DEFAULT_HOST_LIMIT = {"concurrency": 2, "interval": 0.5}
+HOST_LIMITS = {
+    'www.helloasso.com': {"concurrency": 4, "interval": 0.25},
+    'www.leetchi.com': {"concurrency": 4, "interval": 0.25},
+    'www.cotizup.com': {"concurrency": 3, "interval": 0.34},
+    'www.papayoux-solidarite.com': {"concurrency": 3, "interval": 0.34},
+    'www.papayoux.com': {"concurrency": 3, "interval": 0.34},
+    'caisse-solidarite.fr': {"concurrency": 3, "interval": 0.34},
+}
+
+# Amounts embedded in page JSON (JSON-LD, __NEXT_DATA__, data attributes...)
+RAISED_RE = re.compile(
+    r'["\']?(?:amountCollected|collectedAmount|amountRaised|raisedAmount|currentAmount|totalCollected)["\']?'
+    r'\s*[:=]\s*["\']?(\d+(?:\.\d+)?)'
+)
+TARGET_RE = re.compile(
+    r'["\']?(?:targetAmount|goalAmount|amountGoal|goal|objective|target)["\']?'
+    r'\s*[:=]\s*["\']?(\d+(?:\.\d+)?)'
+)
+# French page text, e.g. "1 234 € collectés" / "Objectif : 5 000,50 €". Numbers
+# are whole thousands groups (space, no-break spaces or dots) with optional cents,
+# so years or phone numbers in front of the amount are not swallowed.
+AMOUNT_TEXT = r'(?<![\d,.])((?:\d{1,3}(?:[ \u00a0\u202f.]\d{3})+|\d+)(?:,\d{1,2})?)'
+RAISED_TEXT_RE = re.compile(AMOUNT_TEXT + r'\s*€\s*(?:collectés|récoltés|collectes|recoltes)', re.IGNORECASE)
+TARGET_TEXT_RE = re.compile(r'objectif\s*:?\s*(?:de\s*)?' + AMOUNT_TEXT + r'\s*€', re.IGNORECASE)
+
+
+def parse_amount(text):
+    digits = re.sub(r'[ \u00a0\u202f.]', '', text).replace(',', '.')
+    try:
+        return round(float(digits))
+    except ValueError:
+        return None
+
+
+def extract_amounts(html):
+    amounts = {}
+    for key, json_re, text_re in (('raisedAmount', RAISED_RE, RAISED_TEXT_RE), ('targetAmount', TARGET_RE, TARGET_TEXT_RE)):
+        match = json_re.search(html)
+        if match:
+            amounts[key] = round(float(match.group(1)))
+            continue
+        match = text_re.search(html)
+        if match and parse_amount(match.group(1)) is not None:
+            amounts[key] = parse_amount(match.group(1))
+    return amounts
+
+
+async def read_body(response, limit=MAX_BODY_BYTES):
+    # content.read(n) returns what is buffered so far, so keep reading until EOF or the limit
+    chunks, size = [], 0
+    while size < limit:
+        chunk = await response.content.read(limit - size)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size += len(chunk)
+    return b''.join(chunks)
+
+
+def load_cache(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        cache = json.load(f)
+    return cache.get('entries', {}) if cache.get('version') == CACHE_VERSION else {}
+
+
+def save_cache(path, entries):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"version": CACHE_VERSION, "entries": entries}, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+class HostThrottle:
+    # Concurrency cap plus a minimum interval between request starts, per host
+
+    def __init__(self, concurrency, interval):
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.interval = interval
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def __aenter__(self):
+        await self.semaphore.acquire()
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_start - now
+            self._next_start = max(now, self._next_start) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return self
+
+    async def __aexit__(self, *exc):
+        self.semaphore.release()
+
+
+class LinkChecker:
+
+    def __init__(self, cache_path=DEFAULT_CACHE_FILE, ttl=DEFAULT_TTL, host_limits=None):
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.host_limits = HOST_LIMITS if host_limits is None else host_limits
+        self.cache = load_cache(cache_path)
+        self._throttles = {}
+        self.stats = {"cached": 0, "notModified": 0, "fetched": 0, "errors": 0}
+
+    def _throttle(self, url):
+        host = (urlsplit(url).hostname or '').lower()
+        if host not in self._throttles:
+            limit = self.host_limits.get(host, DEFAULT_HOST_LIMIT)
+            self._throttles[host] = HostThrottle(limit['concurrency'], limit['interval'])
+        return self._throttles[host]
+
+    async def check(self, session, url):
+        cached = self.cache.get(url)
+        now = time.time()
+        ttl = min(self.ttl, ERROR_TTL) if cached and cached.get('error') else self.ttl
+        if cached and now - cached['checkedAt'] < ttl:
+            self.stats['cached'] += 1
+            return cached
+
+        headers = {}
+        if cached and cached.get('ok'):
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('lastModified'):
+                headers['If-Modified-Since'] = cached['lastModified']
+
+        try:
+            async with self._throttle(url):
+                async with session.get(url, headers=headers, allow_redirects=True, max_redirects=MAX_REDIRECTS) as response:
+                    if response.status == 304 and cached:
+                        self.stats['notModified'] += 1
+                        result = dict(cached, checkedAt=now)
+                    else:
+                        self.stats['fetched'] += 1
+                        result = {
+                            "url": url,
+                            "status": response.status,
+                            "ok": 200 <= response.status < 400,
+                            "finalUrl": str(response.url),
+                            "redirects": len(response.history),
+                            "etag": response.headers.get('ETag'),
+                            "lastModified": response.headers.get('Last-Modified'),
+                            "checkedAt": now,
+                        }
+                        if result['ok'] and 'html' in response.headers.get('Content-Type', ''):
+                            body = await read_body(response)
+                            result.update(extract_amounts(body.decode(response.charset or 'utf-8', errors='replace')))
+        except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+            self.stats['errors'] += 1
+            result = {
+                "url": url,
+                "status": None,
+                "ok": False,
+                "error": str(error) or type(error).__name__,
+                "checkedAt": now,
+            }
+
+        self.cache[url] = result
+        return result
+
+    async def check_all(self, urls):
+        # One session for everything: the connector keeps a keep-alive pool per host
+        connector = aiohttp.TCPConnector(limit=0, limit_per_host=max(
+            [DEFAULT_HOST_LIMIT['concurrency']] + [limit['concurrency'] for limit in self.host_limits.values()]
+        ))
+        timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers={'User-Agent': USER_AGENT}) as session:
+            results = await asyncio.gather(*(self.check(session, url) for url in urls))
+        save_cache(self.cache_path, self.cache)
+        return list(results)
+
+
+def check_fund_urls(funds, cache_path=DEFAULT_CACHE_FILE, ttl=DEFAULT_TTL, host_limits=None):
+    # Returns (results, stats); results are in the order of the unique fund URLs
+    urls = list(dict.fromkeys(fund['url'] for fund in funds))
+    checker = LinkChecker(cache_path=cache_path, ttl=ttl, host_limits=host_limits)
+    results = asyncio.run(checker.check_all(urls))
+    return results, checker.stats
+
+
+def write_status(path, results):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check strike fund URLs and collect raised/target amounts')
+    parser.add_argument('--data', default='strike_funds_data.json')
+    parser.add_argument('--output', default=DEFAULT_STATUS_FILE)
+    parser.add_argument('--cache', default=DEFAULT_CACHE_FILE)
+    parser.add_argument('--ttl', type=float, default=DEFAULT_TTL, help='seconds before a cached result is rechecked')
+    args = parser.parse_args()
+
+    with open(args.data, 'r', encoding='utf-8') as f:
+        funds = json.load(f)
+
+    start = time.perf_counter()
+    results, stats = check_fund_urls(funds, cache_path=args.cache, ttl=args.ttl)
+    write_status(args.output, results)
+
+    alive = [r for r in results if r['ok']]
+    with_amounts = [r for r in results if 'raisedAmount' in r]
+    print(f"Checked {len(results)} URLs in {time.perf_counter() - start:.1f}s "
+          f"({stats['fetched']} fetched, {stats['notModified']} not modified, {stats['cached']} cached, {stats['errors']} errors)")
+    print(f"- {len(alive)} reachable")
+    print(f"- {len(with_amounts)} with a raised amount")
+    print(f"Status saved to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+import os
+import re
+import json
+import hashlib
+import argparse
+
+MANIFEST_VERSION = 1
+MANIFEST_FILE = 'manifest.json'
+# Precision 3 cells are about 156 x 156 km, a good fit for the 10-500 km radius presets
+DEFAULT_PRECISION = 3
+DEFAULT_SHARDS_DIR = 'strike_funds_shards'
+THEMATIC_SHARD = 'thematic'
+
+GEOHASH_ALPHABET = '0123456789bcdefghjkmnpqrstuvwxyz'
+# "<geohash or thematic>.<16 hex>.json"; only these are ever cleaned up
+SHARD_FILE_RE = re.compile(rf'^(?:[{GEOHASH_ALPHABET}]+|{THEMATIC_SHARD})\.[0-9a-f]{{16}}\.json$')
+
+
+def geohash(lat, lng, precision=DEFAULT_PRECISION):
+    lat_range, lng_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars, bits, value, even = [], 0, 0, True
+    while len(chars) < precision:
+        target, span = (lng, lng_range) if even else (lat, lat_range)
+        mid = (span[0] + span[1]) / 2
+        value <<= 1
+        if target >= mid:
+            value |= 1
+            span[0] = mid
+        else:
+            span[1] = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(GEOHASH_ALPHABET[value])
+            bits, value = 0, 0
+    return ''.join(chars)
+
+
+def record_coordinates(record):
+    # Accepts extractor funds (strike_funds_data.json) and gist profiles
+    if 'strikeFund' in record:
+        location = record.get('location') or {}
+        lat, lng = location.get('lat'), location.get('lon')
+        thematic = record['strikeFund'].get('category') == 'Thématique'
+    else:
+        lat, lng = record.get('lat'), record.get('lng')
+        thematic = record.get('type') == 'thematic'
+    if lat is None or lng is None or thematic:
+        return None
+    return lat, lng
+
+
+def shard_key(record, precision=DEFAULT_PRECISION):
+    # Thematic and location-less funds share one shard, fetched by every client
+    coordinates = record_coordinates(record)
+    if coordinates is None:
+        return THEMATIC_SHARD
+    return geohash(*coordinates, precision)
+
+
+def bounding_box(records):
+    # [minLat, minLng, maxLat, maxLng] of the located records, or None
+    located = [c for c in map(record_coordinates, records) if c is not None]
+    if not located:
+        return None
+    lats = [lat for lat, _ in located]
+    lngs = [lng for _, lng in located]
+    return [min(lats), min(lngs), max(lats), max(lngs)]
+
+
+def load_records(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data['profiles']
+    return data
+
+
+def write_shards(records, output_dir, precision=DEFAULT_PRECISION):
+    # Shard files are named after their content hash, so they can be cached
+    # forever; only manifest.json has to be revalidated by clients.
+    shards = {}
+    for record in records:
+        shards.setdefault(shard_key(record, precision), []).append(record)
+
+    os.makedirs(output_dir, exist_ok=True)
+    entries = []
+    for key in sorted(shards):
+        payload = json.dumps(shards[key], ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        digest = hashlib.sha256(payload).hexdigest()[:16]
+        filename = f"{key}.{digest}.json"
+        path = os.path.join(output_dir, filename)
+        if not os.path.exists(path):
+            with open(path, 'wb') as f:
+                f.write(payload)
+        entries.append({
+            "key": key,
+            "file": filename,
+            "bbox": bounding_box(shards[key]),
+            "count": len(shards[key]),
+            "hash": digest,
+            "bytes": len(payload),
+        })
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "precision": precision,
+        "total": len(records),
+        "shards": entries,
+    }
+    with open(os.path.join(output_dir, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    # Drop shard files from previous runs that the manifest no longer lists
+    current = {entry['file'] for entry in entries}
+    for name in os.listdir(output_dir):
+        if SHARD_FILE_RE.match(name) and name not in current:
+            os.remove(os.path.join(output_dir, name))
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Split strike funds into geohash shards with a manifest')
+    parser.add_argument('--data', default='strike_funds_data.json', help='extractor output or gist profiles JSON')
+    parser.add_argument('--output', default=DEFAULT_SHARDS_DIR, help='output directory')
+    parser.add_argument('--precision', type=int, default=DEFAULT_PRECISION)
+    args = parser.parse_args()
+
+    manifest = write_shards(load_records(args.data), args.output, args.precision)
+    largest = max(manifest['shards'], key=lambda s: s['count'], default=None)
+    print(f"Wrote {len(manifest['shards'])} shards for {manifest['total']} records to {args.output}")
+    if largest:
+        print(f"- largest shard: {largest['key']} ({largest['count']} records, {largest['bytes']:,} bytes)")
+
+if __name__ == "__main__":
+    main()
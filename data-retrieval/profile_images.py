@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+import os
+import io
+import json
+import time
+import base64
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image, ImageFilter, ImageOps, features
+
+try:
+    import pillow_avif  # noqa: F401  registers AVIF on Pillow < 11.2
+except ImportError:
+    pass
+
+DEFAULT_IMAGE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'public', 'assets', 'profiles')
+DEFAULT_URL_PREFIX = '/assets/profiles'
+VARIANTS_MANIFEST = 'variants.json'
+VARIANTS_DIR = 'variants'
+MANIFEST_VERSION = 1
+
+# Cards are at most ~420 CSS px wide, so these cover 1x to 2x screens
+DEFAULT_WIDTHS = (320, 640, 960)
+# AVIF speed 8 encodes ~3x faster than the default for ~8% more bytes
+ENCODER_OPTIONS = {'avif': {'quality': 50, 'speed': 8}, 'webp': {'quality': 75}}
+MIME_TYPES = {'avif': 'image/avif', 'webp': 'image/webp'}
+# Preferred first, as <source> order matters in <picture>
+FORMAT_ORDER = ('avif', 'webp')
+# Variants are not committed: CI builds them with these widths and every format
+# (.github/workflows/ci.yml), so only manifests built with them describe deployed files
+DEPLOYED_WIDTHS = DEFAULT_WIDTHS
+
+PLACEHOLDER_WIDTH = 16
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+
+
+def avif_supported():
+    if '.avif' not in Image.registered_extensions():
+        return False
+    try:
+        return features.check_module('avif')
+    except ValueError:  # Registered by pillow-avif-plugin
+        return True
+
+
+def available_formats():
+    return [fmt for fmt in FORMAT_ORDER if fmt != 'avif' or avif_supported()]
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+def placeholder_data_url(image):
+    # A real, tiny thumbnail of the photo; the client scales it up under a CSS blur
+    height = max(1, round(image.height * PLACEHOLDER_WIDTH / image.width))
+    thumb = image.resize((PLACEHOLDER_WIDTH, height), Image.Resampling.BOX).filter(ImageFilter.GaussianBlur(0.6))
+    buffer = io.BytesIO()
+    thumb.save(buffer, 'WEBP', quality=40, method=6)
+    return 'data:image/webp;base64,' + base64.b64encode(buffer.getvalue()).decode('ascii')
+
+
+def process_image(job):
+    # Runs in a worker process: decodes the source once and writes every variant
+    path, digest, output_dir, url_prefix, widths, formats = job
+    stem = os.path.splitext(os.path.basename(path))[0]
+    with Image.open(path) as source:
+        image = ImageOps.exif_transpose(source).convert('RGB')
+
+    # Never upscale; small sources get a single variant at their own width
+    targets = sorted({w for w in widths if w < image.width} | {min(max(widths), image.width)})
+    variants = {fmt: [] for fmt in formats}
+    for width in targets:
+        height = round(image.height * width / image.width)
+        resized = image if width == image.width else image.resize((width, height), Image.Resampling.LANCZOS)
+        for fmt in formats:
+            # The content hash in the name lets /assets/* be cached for a year
+            filename = f"{stem}-{digest[:8]}-{width}.{fmt}"
+            resized.save(os.path.join(output_dir, filename), fmt.upper(), **ENCODER_OPTIONS[fmt])
+            variants[fmt].append({
+                "width": width,
+                "url": f"{url_prefix}/{VARIANTS_DIR}/{filename}",
+                "bytes": os.path.getsize(os.path.join(output_dir, filename)),
+            })
+
+    return {
+        "hash": digest,
+        "url": f"{url_prefix}/{os.path.basename(path)}",
+        "width": image.width,
+        "height": image.height,
+        "bytes": os.path.getsize(path),
+        "placeholder": placeholder_data_url(image),
+        "variants": variants,
+    }
+
+
+def load_manifest(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    return manifest if manifest.get('version') == MANIFEST_VERSION else None
+
+
+def _is_current(entry, digest, output_dir):
+    if entry is None or entry['hash'] != digest:
+        return False
+    filenames = (v['url'].rsplit('/', 1)[-1] for vs in entry['variants'].values() for v in vs)
+    return all(os.path.exists(os.path.join(output_dir, name)) for name in filenames)
+
+
+def photo_for(entry):
+    # The `photo` field of a profile record, mirrored by ProfilePhoto in src/types/gist.ts
+    return {
+        "width": entry['width'],
+        "height": entry['height'],
+        "placeholder": entry['placeholder'],
+        "sources": [
+            {
+                "type": MIME_TYPES[fmt],
+                "srcSet": ', '.join(f"{v['url']} {v['width']}w" for v in entry['variants'][fmt]),
+            }
+            for fmt in FORMAT_ORDER if entry['variants'].get(fmt)
+        ],
+    }
+
+
+def is_deployed(settings, url_prefix=DEFAULT_URL_PREFIX):
+    return settings['widths'] == sorted(DEPLOYED_WIDTHS) and url_prefix == DEFAULT_URL_PREFIX
+
+
+def build_variants(image_dir=DEFAULT_IMAGE_DIR, widths=DEFAULT_WIDTHS, formats=None,
+                   url_prefix=DEFAULT_URL_PREFIX, workers=None):
+    # Returns (manifest, stats). Images whose content hash is unchanged are not decoded again.
+    # `photos` stays empty unless the variants match the ones CI deploys.
+    formats = list(formats or available_formats())
+    settings = {"widths": sorted(widths), "formats": formats}
+    output_dir = os.path.join(image_dir, VARIANTS_DIR)
+    os.makedirs(output_dir, exist_ok=True)
+
+    manifest_path = os.path.join(image_dir, VARIANTS_MANIFEST)
+    previous = load_manifest(manifest_path)
+    previous_images = previous['images'] if previous and previous.get('settings') == settings else {}
+
+    images, jobs = {}, []
+    for name in sorted(os.listdir(image_dir)):
+        if not name.lower().endswith(IMAGE_EXTENSIONS):
+            continue
+        path = os.path.join(image_dir, name)
+        digest = file_hash(path)
+        entry = previous_images.get(name)
+        if _is_current(entry, digest, output_dir):
+            images[name] = entry
+        else:
+            jobs.append((path, digest, output_dir, url_prefix, settings['widths'], formats))
+
+    if jobs:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for job, entry in zip(jobs, pool.map(process_image, jobs, chunksize=4)):
+                images[os.path.basename(job[0])] = entry
+
+    # Variants of replaced or deleted images
+    referenced = {v['url'].rsplit('/', 1)[-1] for e in images.values() for vs in e['variants'].values() for v in vs}
+    removed = 0
+    for name in os.listdir(output_dir):
+        if name not in referenced:
+            os.remove(os.path.join(output_dir, name))
+            removed += 1
+
+    images = dict(sorted(images.items()))
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "settings": settings,
+        "images": images,
+        # Ready-made profile `photo` fields, keyed by the photoUrl they replace
+        "photos": {entry['url']: photo_for(entry) for entry in images.values()} if is_deployed(settings, url_prefix) else {},
+    }
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+    stats = {
+        "images": len(images),
+        "processed": len(jobs),
+        "skipped": len(images) - len(jobs),
+        "removed": removed,
+        "sourceBytes": sum(e['bytes'] for e in images.values()),
+        "variantBytes": {
+            fmt: sum(vs[-1]['bytes'] for e in images.values() for f, vs in e['variants'].items() if f == fmt)
+            for fmt in formats
+        },
+    }
+    return manifest, stats
+
+
+def attach_photos(profiles, manifest):
+    # Adds `photo` to every profile whose photoUrl is a processed local image
+    attached = 0
+    for profile in profiles:
+        photo = manifest['photos'].get(profile.get('photoUrl'))
+        if photo is not None:
+            profile['photo'] = photo
+            attached += 1
+    return attached
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build responsive WebP/AVIF variants and blur placeholders for profile images')
+    parser.add_argument('--images', default=DEFAULT_IMAGE_DIR, help='directory of profile-NNN.jpg images')
+    parser.add_argument('--widths', type=int, nargs='+', default=list(DEFAULT_WIDTHS))
+    parser.add_argument('--formats', nargs='+', choices=FORMAT_ORDER, help='default: AVIF when supported, and WebP')
+    parser.add_argument('--workers', type=int, help='worker processes (default: one per CPU)')
+    parser.add_argument('--profiles', help='gist profiles JSON to update with the photo field')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    manifest, stats = build_variants(args.images, args.widths, args.formats, workers=args.workers)
+    elapsed = time.perf_counter() - start
+
+    print(f"Processed {stats['processed']} images, skipped {stats['skipped']} unchanged ({elapsed:.1f}s)")
+    if stats['removed']:
+        print(f"- removed {stats['removed']} stale variants")
+    largest = max(manifest['settings']['widths'])
+    for fmt, size in stats['variantBytes'].items():
+        ratio = size / stats['sourceBytes'] if stats['sourceBytes'] else 0
+        print(f"- {fmt} at up to {largest}px: {size:,} bytes ({ratio:.0%} of the source images)")
+    if stats['images'] and not manifest['photos']:
+        print(f"- no profile photos: only the {'/'.join(map(str, DEPLOYED_WIDTHS))}px variants are deployed")
+
+    if args.profiles:
+        with open(args.profiles, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        profiles = data['profiles'] if isinstance(data, dict) else data
+        attached = attach_photos(profiles, manifest)
+        with open(args.profiles, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        print(f"Added photos to {attached} of {len(profiles)} profiles in {args.profiles}")
+
+if __name__ == "__main__":
+    main()
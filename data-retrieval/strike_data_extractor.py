@@ -1,175 +1,447 @@
 #!/usr/bin/env python3
 import re
+import os
+import sys
 import json
 import math
+import time
+import argparse
+import tempfile
+from html.parser import HTMLParser
+
+# Read snapshots in fixed-size chunks so memory stays flat on large pages
+CHUNK_SIZE = 64 * 1024
+
+TILE_SIZE = 256
+DEFAULT_ZOOM = 6
+# Web Mercator only covers latitudes up to ±85.05°; anything outside the map's
+# bounds means the zoom or origin is wrong
+MAX_LATITUDE = 85.0511
+
+# Leaflet writes marker positions as `transform: translate3d(Xpx, Ypx, 0px)`
+TRANSLATE3D_RE = re.compile(
+    r'translate3d\(\s*(-?[\d.]+)px\s*,\s*(-?[\d.]+)px', re.IGNORECASE
+)
+SCALE_RE = re.compile(r'scale\(\s*([\d.]+)\s*\)', re.IGNORECASE)
+WIDTH_RE = re.compile(r'(?<![-\w])width\s*:\s*([\d.]+)px', re.IGNORECASE)
+# Tile URLs end in {z}/{x}/{y}, e.g. https://tile.openstreetmap.org/6/31/22.png
+TILE_URL_RE = re.compile(r'/(\d+)/(\d+)/(\d+)(?:@2x)?\.(?:png|jpe?g|webp)\b', re.IGNORECASE)
+
+MARKER_CLASS = 'leaflet-marker-icon'
+TILE_CLASS = 'leaflet-tile'
+TILE_CONTAINER_CLASS = 'leaflet-tile-container'
+THEMATIC_CLASS = 'thematic'
+
+# Map centre and size of the synthetic snapshots
+SYNTHETIC_CENTER = (46.6, 2.4)
+SYNTHETIC_SIZE = (1280, 960)
+
+VOID_ELEMENTS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'source', 'track', 'wbr',
+}
+
+# Minimum markers/second expected from bench_parser() on the synthetic page
+THROUGHPUT_TARGET = 10000
+
+
+def pixel_to_latlng(x, y, zoom):
+    # Inverse Web Mercator: global pixel coordinates at `zoom` -> lat/lng
+    world = TILE_SIZE * (2 ** zoom)
+    lng = x / world * 360.0 - 180.0
+    n = math.pi * (1 - 2 * y / world)
+    lat = math.degrees(math.atan(math.sinh(n)))
+    return lat, lng
+
+
+def latlng_to_pixel(lat, lng, zoom):
+    world = TILE_SIZE * (2 ** zoom)
+    x = (lng + 180.0) / 360.0 * world
+    sin_lat = math.sin(math.radians(lat))
+    y = (0.5 - math.log((1 + sin_lat) / (1 - sin_lat)) / (4 * math.pi)) * world
+    return x, y
+
+
+class MapSnapshotParser(HTMLParser):
+    # Incremental parser: feed() it chunks, then drain() the funds found so far.
+    # Markers are elements whose class contains `leaflet-marker-icon` and whose
+    # style carries a translate3d offset; thematic funds are links nested under
+    # an element with the `thematic` class.
+    #
+    # Marker offsets are layer points, relative to the map's pixel origin. Both
+    # the zoom and, unless `origin` is given, the origin are read from the first
+    # unscaled tile: its URL gives its zoom and global position, and its
+    # transform (plus its container's) the layer point. A `zoom` that disagrees
+    # with the tiles is an error. Markers seen before the first tile are held
+    # back until then.
+
+    def __init__(self, zoom=None, origin=None):
+        super().__init__(convert_charrefs=True)
+        self.zoom = zoom
+        self.origin = origin
+        self.pending = []
+        self._unplaced = []
+        self._tile_seen = False
+        self._tile_container = None
+        self._marker = None
+        self._marker_depth = 0
+        self._thematic_depth = 0
+        self._link = None
+
+    def drain(self):
+        funds, self.pending = self.pending, []
+        return funds
+
+    def close(self):
+        super().close()
+        if self._unplaced:
+            missing = [flag for flag, value in (('--origin', self.origin), ('--zoom', self.zoom)) if value is None]
+            raise ValueError(f'no map tile to locate {len(self._unplaced)} markers from, pass {" and ".join(missing)}')
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        classes = (attrs.get('class') or '').split()
+
+        if not self._tile_seen:
+            if TILE_CONTAINER_CLASS in classes:
+                self._tile_container = attrs.get('style') or ''
+            elif TILE_CLASS in classes:
+                self._read_tile(attrs)
+
+        if self._marker is not None:
+            if tag not in VOID_ELEMENTS:
+                self._marker_depth += 1
+            if not self._marker['url'] and attrs.get('href'):
+                self._marker['url'] = attrs['href']
+            if not self._marker['name']:
+                self._marker['name'] = attrs.get('title') or ''
+            return
+
+        if MARKER_CLASS in classes:
+            match = TRANSLATE3D_RE.search(attrs.get('style') or '')
+            if match:
+                self._start_marker(tag, attrs, match)
+                return
+
+        if self._thematic_depth:
+            if tag not in VOID_ELEMENTS:
+                self._thematic_depth += 1
+            if tag == 'a' and attrs.get('href'):
+                self._link = {'name': attrs.get('title') or '', 'url': attrs['href'], 'text': []}
+        elif THEMATIC_CLASS in classes and tag not in VOID_ELEMENTS:
+            self._thematic_depth = 1
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if self._marker is not None:
+            self._marker_depth -= 1
+            if self._marker_depth <= 0:
+                self._finish_marker()
+            return
+
+        if self._thematic_depth:
+            if tag == 'a' and self._link is not None:
+                name = self._link['name'] or ' '.join(''.join(self._link['text']).split())
+                if name:
+                    self.pending.append({"name": name, "url": self._link['url'], "type": "thematic"})
+                self._link = None
+            self._thematic_depth -= 1
+
+    def handle_data(self, data):
+        if self._marker is not None:
+            self._marker['text'].append(data)
+        elif self._link is not None:
+            self._link['text'].append(data)
+
+    def _start_marker(self, tag, attrs, match):
+        self._marker = {
+            'name': attrs.get('title') or attrs.get('alt') or attrs.get('aria-label') or attrs.get('data-name') or '',
+            'url': attrs.get('href') or attrs.get('data-url') or '',
+            'x': float(match.group(1)),
+            'y': float(match.group(2)),
+            'text': [],
+        }
+        self._marker_depth = 0 if tag in VOID_ELEMENTS else 1
+        if self._marker_depth == 0:
+            self._finish_marker()
+
+    def _read_tile(self, attrs):
+        url = TILE_URL_RE.search(attrs.get('src') or '')
+        position = TRANSLATE3D_RE.search(attrs.get('style') or '')
+        if not url or not position:
+            return
+        container = self._tile_container or ''
+        scale = SCALE_RE.search(container)
+        # Levels left over from a zoom animation are scaled and on another grid
+        if scale and float(scale.group(1)) != 1:
+            return
+        offset = TRANSLATE3D_RE.search(container)
+        offset_x, offset_y = (float(offset.group(1)), float(offset.group(2))) if offset else (0.0, 0.0)
+        width = WIDTH_RE.search(attrs.get('style') or '')
+        tile_size = float(width.group(1)) if width else TILE_SIZE
+        self._tile_seen = True
+        zoom = int(url.group(1))
+        if self.zoom is None:
+            self.zoom = zoom
+        elif self.zoom != zoom:
+            raise ValueError(f'--zoom {self.zoom} does not match the map tiles (zoom {zoom})')
+        if self.origin is None:
+            self.origin = (
+                int(url.group(2)) * tile_size - float(position.group(1)) - offset_x,
+                int(url.group(3)) * tile_size - float(position.group(2)) - offset_y,
+            )
+        for marker in self._unplaced:
+            self._place(marker)
+        self._unplaced = []
+
+    def _finish_marker(self):
+        marker, self._marker = self._marker, None
+        self._marker_depth = 0
+        marker['name'] = marker['name'] or ' '.join(''.join(marker['text']).split())
+        if not marker['name'] or not marker['url']:
+            return
+        if self.origin is None or self.zoom is None:
+            self._unplaced.append(marker)
+        else:
+            self._place(marker)
+
+    def _place(self, marker):
+        lat, lng = pixel_to_latlng(
+            self.origin[0] + marker['x'], self.origin[1] + marker['y'], self.zoom
+        )
+        if abs(lat) > MAX_LATITUDE or abs(lng) > 180:
+            raise ValueError(f"{marker['name']!r} lands off the map ({lat:.2f}, {lng:.2f}) at zoom {self.zoom}, "
+                             f"check --zoom and --origin")
+        self.pending.append({"name": marker['name'], "url": marker['url'], "lat": round(lat, 5), "lng": round(lng, 5)})
+
+
+def iter_snapshot_files(source):
+    if os.path.isdir(source):
+        for entry in sorted(os.listdir(source)):
+            if entry.lower().endswith(('.html', '.htm')):
+                yield os.path.join(source, entry)
+    else:
+        yield source
+
+
+def iter_strike_funds(source, zoom=None, origin=None):
+    # Stream one snapshot file or a directory of them, yielding funds as they are parsed.
+    # Unless given, each snapshot's zoom and pixel origin are read from its map tiles.
+    for path in iter_snapshot_files(source):
+        parser = MapSnapshotParser(zoom=zoom, origin=origin)
+        try:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                while True:
+                    chunk = f.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    parser.feed(chunk)
+                    yield from parser.drain()
+            parser.close()
+        except ValueError as error:
+            raise ValueError(f'{path}: {error}') from None
+        yield from parser.drain()
+
+
+def extract_strike_funds_data(source, zoom=None, origin=None):
+    # Funds extracted from the HTML markers (transform3d values) of saved map snapshots
+    return list(iter_strike_funds(source, zoom=zoom, origin=origin))
+
+
+def pixel_origin(center, size, zoom):
+    # Leaflet's pixel origin: the global pixel at the top-left corner of the map
+    x, y = latlng_to_pixel(center[0], center[1], zoom)
+    return round(x - size[0] / 2), round(y - size[1] / 2)
+
+
+def write_map_panes(f, origin, zoom):
+    # Map and tile panes as Leaflet renders them, with the tile under the origin
+    tile_x, tile_y = int(origin[0] // TILE_SIZE), int(origin[1] // TILE_SIZE)
+    f.write(
+        '<div class="leaflet-pane leaflet-map-pane" style="transform: translate3d(0px, 0px, 0px);">'
+        '<div class="leaflet-pane leaflet-tile-pane"><div class="leaflet-layer">'
+        '<div class="leaflet-tile-container leaflet-zoom-animated" style="z-index: 18; transform: translate3d(0px, 0px, 0px) scale(1);">'
+        f'<img alt="" src="https://tile.openstreetmap.org/{zoom}/{tile_x}/{tile_y}.png" class="leaflet-tile leaflet-tile-loaded" '
+        f'style="width: {TILE_SIZE}px; height: {TILE_SIZE}px; '
+        f'transform: translate3d({tile_x * TILE_SIZE - origin[0]}px, {tile_y * TILE_SIZE - origin[1]}px, 0px); opacity: 1;">'
+        '</div></div></div>\n'
+    )
+
+
+def write_synthetic_snapshot(path, count, zoom=DEFAULT_ZOOM):
+    # Synthetic Leaflet page with `count` markers spread over metropolitan France
+    origin = pixel_origin(SYNTHETIC_CENTER, SYNTHETIC_SIZE, zoom)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('<html><body>')
+        write_map_panes(f, origin, zoom)
+        f.write('<div class="leaflet-pane leaflet-marker-pane">\n')
+        for i in range(count):
+            lat = 42.5 + (i * 7919 % 10000) / 10000 * 8.5
+            lng = -4.5 + (i * 104729 % 10000) / 10000 * 12.5
+            x, y = latlng_to_pixel(lat, lng, zoom)
+            x, y = x - origin[0], y - origin[1]
+            f.write(
+                f'<div class="leaflet-marker-icon leaflet-interactive" tabindex="0" '
+                f'style="margin-left: -12px; transform: translate3d({x:.1f}px, {y:.1f}px, 0px); z-index: {i};">'
+                f'<a href="https://www.helloasso.com/associations/caisse-{i}/formulaires/1">Caisse de grève n°{i}</a></div>\n'
+            )
+        f.write('</div></div><ul class="thematic"><li><a href="https://caisse-solidarite.fr">Caisse de solidarité</a></li></ul>')
+        f.write('</body></html>\n')
+
+
+def bench_parser(count=100000):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'synthetic_map.html')
+        write_synthetic_snapshot(path, count)
+        size_mb = os.path.getsize(path) / (1024 * 1024)
+        start = time.perf_counter()
+        found = sum(1 for _ in iter_strike_funds(path))
+        elapsed = time.perf_counter() - start
+
+    rate = found / elapsed if elapsed else float('inf')
+    print(f"Parsed {found} funds from a {size_mb:.1f} MB snapshot in {elapsed:.2f}s")
+    print(f"- {rate:,.0f} markers/s (target: {THROUGHPUT_TARGET:,} markers/s)")
+    return rate >= THROUGHPUT_TARGET
 
-def extract_strike_funds_data():
-    # Sample data extracted from the HTML markers
-    # These are the actual coordinates and data from the page
-    strike_funds = [
-        # Map markers with coordinates (extracted from transform3d values)
-        {"name": "Solidaires Yonne 89", "url": "https://www.helloasso.com/associations/solidaires-89/formulaires/1", "lat": 47.8, "lng": 3.6},
-        {"name": "Sud-Rail Paris-Sud-Est", "url": "https://www.leetchi.com/c/greve-des-retraites-sud-rail-pse", "lat": 48.8, "lng": 2.3},
-        {"name": "Nettoyage Sorbonne Arc-en-ciel", "url": "https://www.leetchi.com/c/soutien-arc-en-ciel-fevrier-2023-sorbonne-universite", "lat": 48.8, "lng": 2.3},
-        {"name": "Postiers sans papiers Chronopost", "url": "https://www.cotizup.com/sans-papiers-chrono-alfortvill", "lat": 48.8, "lng": 2.3},
-        {"name": "1er degré et AESH", "url": "https://www.helloasso.com/associations/arret-images/formulaires/1", "lat": 48.8, "lng": 2.3},
-        {"name": "Solidaires Aude 11", "url": "https://www.helloasso.com/associations/union-syndicale-solidaires-11/formulaires/1", "lat": 43.2, "lng": 2.4},
-        {"name": "Lycée Balzac Paris AESH-AED", "url": "https://www.leetchi.com/c/caisse-de-greve-balzac-2023-aesh-aed", "lat": 48.8, "lng": 2.3},
-        {"name": "FSU Seine Maritime", "url": "https://fsu76.fsu.fr/caisse-de-greve-nul-ne-doit-renoncer-a-se-mobiliser", "lat": 49.4, "lng": 1.1},
-        {"name": "Union Syndicale Solidaires Meuse 55", "url": "https://caisse-solidarite.fr/c/solidairesmeuse/", "lat": 48.8, "lng": 2.3},
-        {"name": "FSU Université de Lille", "url": "https://www.helloasso.com/associations/l-amul/collectes/sdfsdf", "lat": 50.6, "lng": 3.1},
-        {"name": "Université Paris-Est Créteil", "url": "https://www.leetchi.com/c/upec-cagnotte-retraites", "lat": 48.8, "lng": 2.3},
-        {"name": "Université Paris-Saclay", "url": "https://www.papayoux-solidarite.com/fr/collecte/caisse-de-greve-de-l-universite-paris-saclay", "lat": 48.7, "lng": 2.2},
-        {"name": "AG éducation Val d'Oise", "url": "https://caisse-solidarite.fr/c/AG-educ-du-95-sud/", "lat": 48.8, "lng": 2.3},
-        {"name": "AG éducation Romainville, les Lilas, le Prè St Gervais", "url": "https://caisse-solidarite.fr/c/AG-educ-rpl/", "lat": 48.8, "lng": 2.3},
-        {"name": "Caisse de grève AESH SNUDI FO 53", "url": "https://www.helloasso.com/associations/snudi-fo-53/formulaires/3", "lat": 48.1, "lng": -0.8},
-        {"name": "Lycée Léonard de Vinci Saint Witz", "url": "https://www.cotizup.com/caisseldv", "lat": 48.8, "lng": 2.3},
-        {"name": "FSU Jura", "url": "https://www.helloasso.com/associations/fsu-39/formulaires/1", "lat": 46.7, "lng": 5.6},
-        {"name": "AED du lycée professionnel Joseph Gallieni", "url": "https://www.leetchi.com/c/aedgallieniengreve?utm_source=whatsapp&utm_medium=social_sharing", "lat": 48.8, "lng": 2.3},
-        {"name": "Lycée Romain Rolland Goussainville", "url": "https://www.papayoux-solidarite.com/fr/collecte/caisse-de-greve-du-lycee-romain-rolland-de-goussainville", "lat": 48.8, "lng": 2.3},
-        {"name": "BPI Bibliothèque (Centre Pompidou)", "url": "https://www.helloasso.com/associations/collectif-352-55/formulaires/1", "lat": 48.8, "lng": 2.3},
-        {"name": "SNES Guadeloupe", "url": "https://www.helloasso.com/associations/snes-guadeloupe/formulaires/1", "lat": 16.2, "lng": -61.5},
-        {"name": "FSU Pays de la Loire", "url": "https://www.helloasso.com/associations/snetap-fsu-pays-de-la-loire/collectes/snetap-fsu-caisse-de-greve-retraite-2023", "lat": 48.1, "lng": -0.8},
-        {"name": "CGT spectacle (FNSAC)", "url": "https://www.helloasso.com/associations/fnsac/formulaires/1", "lat": 48.8, "lng": 2.3},
-        {"name": "SNUDI-FO 53 Mayenne", "url": "https://www.helloasso.com/associations/snudi-fo-53/formulaires/1", "lat": 48.1, "lng": -0.8},
-        {"name": "Cheminots du Bourget", "url": "https://www.cotizup.com/greve-bourget", "lat": 48.8, "lng": 2.3},
-        {"name": "Raffineurs Grandpuits et sous-traitants", "url": "https://www.cotizup.com/raffineurssoustraitants", "lat": 48.8, "lng": 2.3},
-        {"name": "Lycée Robespierre Epinay-sur-Seine", "url": "https://www.cotizup.com/greve-robespierre", "lat": 48.8, "lng": 2.3},
-        {"name": "Sud Santé Maine et Loire, Mayenne", "url": "https://www.helloasso.com/associations/sud-sante-sociaux-49-53/formulaires/1", "lat": 48.1, "lng": -0.8},
-        {"name": "Sundep Solidaire", "url": "https://www.helloasso.com/associations/syndicat-de-la-formation-et-de-l-enseignement-prive-de-l-academie-de-toulouse-sundep-solidaires-occitanie-et-aquitaine/formulaires/1", "lat": 43.6, "lng": 1.4},
-        {"name": "SNETAP-FSU IDF", "url": "https://www.helloasso.com/associations/snetap-fsu-ile-de-france/collectes/don-pour-la-caisse-de-solidarite-ile-de-france", "lat": 48.8, "lng": 2.3},
-        {"name": "CGT SNJ", "url": "https://www.helloasso.com/associations/syndicat-national-des-journalistes-cgt/formulaires/1", "lat": 48.8, "lng": 2.3},
-        {"name": "Solidaire Ligne 3/3 bis", "url": "https://www.cotizup.com/pour-aider-a-lutte-contre-cett", "lat": 48.8, "lng": 2.3},
-        {"name": "Hospitaliers et agents de laboratoire de Bordeaux", "url": "https://www.cotizup.com/greve-labo-hospitaliers?fbclid=IwAR329fgBFyc8SghNnrHM8l_u8NTUQsHxZSRfGqySIFLpActk-Wgli-5LPpM", "lat": 44.8, "lng": -0.6},
-        {"name": "Caisse de grève - AG féministe", "url": "https://fr.ulule.com/caisse-de-greve-ag-feministe/?utm_campaign=presale_158190&utm_source=shared-from-Ulule-project-page-on-Twitter", "lat": 48.8, "lng": 2.3},
-        {"name": "Gréviste du collège Fabien de St-Denis (93)", "url": "https://www.papayoux-solidarite.com/fr/collecte/caisse-de-greve-du-college-fabien-saint-denis", "lat": 48.8, "lng": 2.3},
-        {"name": "Personnels du lycée Paul Robert Les Lilas", "url": "https://www.papayoux.com/fr/cagnotte/caisse-de-greve-paul-robert", "lat": 48.8, "lng": 2.3},
-        {"name": "CGT Ferc SUP", "url": "https://www.helloasso.com/associations/syndicat-cgt-ferc-sup-de-nantes-universite/formulaires/1", "lat": 47.2, "lng": -1.6},
-        {"name": "AED 44", "url": "https://www.helloasso.com/associations/collectif-aed-44/formulaires/1", "lat": 47.2, "lng": -1.6},
-        {"name": "AESH/AED/AP/APS Collège Chantereine", "url": "https://www.leetchi.com/c/caisse-de-greve-aesh-ap-aps-clg-chantereine-sarcelles", "lat": 48.8, "lng": 2.3},
-        {"name": "Solidaires Isère 38", "url": "https://www.okpal.com/caisse-de-solidarite-pour-les-grevistes/#/", "lat": 45.2, "lng": 5.7},
-        {"name": "AG Chaville Meudon Educ", "url": "https://www.cotizup.com/ag-meudon-chaville-educ", "lat": 48.8, "lng": 2.3},
-        {"name": "Transdev Cargo", "url": "https://www.cotizup.com/solidariteavectransdevcargo", "lat": 48.8, "lng": 2.3},
-        {"name": "Caisse de grève de l'AG éducation 31", "url": "https://caisse-solidarite.fr/c/AG-educ-31/", "lat": 43.6, "lng": 1.4},
-        {"name": "Caisse de solidarité AG éducation et ESR 34", "url": "https://caisse-solidarite.fr/c/AG-educ-34/", "lat": 43.6, "lng": 3.9},
-        {"name": "Caisse de grève des salarié·es de SNF", "url": "https://caisse-solidarite.fr/c/snf/", "lat": 45.8, "lng": 4.8},
-        {"name": "Toujours le pain levé !", "url": "https://caisse-solidarite.fr/c/toujourslepainleve/", "lat": 50.6, "lng": 3.1},
-        {"name": "Caisse de grève des salarié·es de Mediapart", "url": "https://caisse-solidarite.fr/c/mediapart/", "lat": 48.8, "lng": 2.3},
-        {"name": "Caisse de grève mutualisée de l'union syndicale Solidaires 55", "url": "https://caisse-solidarite.fr/c/solidairesmeuse/", "lat": 48.8, "lng": 2.3},
-        {"name": "Cheminot·e·s SUD-Rail Pays-de-Loire dans la lutte contre la réforme des retraites", "url": "https://caisse-solidarite.fr/c/cheminotspaysdelaloire/", "lat": 47.2, "lng": -1.6},
-        {"name": "Caisse de grève des agent.es de Paris musées", "url": "https://caisse-solidarite.fr/c/parismusées/", "lat": 48.8, "lng": 2.3},
-        {"name": "Caisse de grève des salarié·es de Smile France", "url": "https://caisse-solidarite.fr/c/smilefrance/", "lat": 48.8, "lng": 2.3},
-        {"name": "Caisse de grève de l'AG collège René caillié", "url": "https://caisse-solidarite.fr/c/collegerenecaillie/", "lat": 44.8, "lng": -0.6},
-        {"name": "Caisse de solidarité des personnels de l'éducation en lutte Isère", "url": "https://caisse-solidarite.fr/c/educ38/", "lat": 45.2, "lng": 5.7},
-        {"name": "Collège Jean Vigo Epinay-Sur-Seine", "url": "https://www.papayoux.com/fr/cagnotte/caisse-de-greve-college-jean-vigo", "lat": 48.8, "lng": 2.3},
-        {"name": "Collège Evariste Galois Epinay-sur-Seine", "url": "https://www.papayoux.com/fr/cagnotte/caisse-de-greve-college-evaristegalois-epinay-sur-seine", "lat": 48.8, "lng": 2.3},
-        {"name": "caisse de grève des cheminots Léon-Tregor.", "url": "https://caisse-solidarite.fr/c/cheminotsleontregor/", "lat": 48.6, "lng": -3.4},
-        {"name": "caisse de grève de l'Institut National d'Histoire de l'art", "url": "https://www.cotizup.com/caissedegreveinha", "lat": 48.8, "lng": 2.3},
-        {"name": "Collège Roger Martin du Gard à Epinay sur Seine", "url": "https://lydia-app.com/collect/86913-cagnotte-solidaire-rmg/fr", "lat": 48.8, "lng": 2.3},
-        {"name": "Lycée de Vizille", "url": "https://www.leetchi.com/c/personnel-du-lycee-de-vizille-pour-une-retraite-solidaire-wmer7rkw", "lat": 45.2, "lng": 5.7},
-        {"name": "Solidaires 73", "url": "https://www.papayoux-solidarite.com/fr/collecte/caisse-de-greve-solidaires-73", "lat": 45.6, "lng": 6.0},
-        {"name": "CNT SO nettoyage PACA", "url": "https://www.papayoux-solidarite.com//fr/collecte/nettoyage-en-lutte-contre-la-retraite-macron", "lat": 43.3, "lng": 5.4},
-        {"name": "Salariés de l'université de Bourgogne", "url": "https://www.papayoux-solidarite.com/fr/collecte/caisse-de-greve-universite-de-bourgogne", "lat": 47.3, "lng": 5.0},
-        {"name": "CGT cheminots de Versailles", "url": "https://www.leetchi.com/c/caisse-de-greve-cgt-cheminots-versailles?utm_source=copylink&utm_medium=social_sharing", "lat": 48.8, "lng": 2.1},
-        {"name": "Collectif « Nos Retraites Nous Rassemblent » Strasbourg", "url": "https://www.cotizup.com/caisse-greve-solidaire", "lat": 48.6, "lng": 7.8},
-        {"name": "intersyndicale Tricastin", "url": "https://www.leetchi.com/c/tricastin-defense-des-retraites", "lat": 44.3, "lng": 4.7},
-        {"name": "Gaziers de Sorengy", "url": "https://www.leetchi.com/c/storengy-defense-des-retraites", "lat": 48.8, "lng": 2.3},
-        {"name": "Lycée Angela Davis Saint-Denis", "url": "https://www.leetchi.com/c/caisse-de-greve-angela-davis?utm_source=copylink&utm_medium=social_sharing", "lat": 48.8, "lng": 2.3},
-        {"name": "Caisse de greve education Beaujolais Val de Seine", "url": "https://www.leetchi.com/c/caisse-de-greve-educ-bvs", "lat": 46.0, "lng": 4.7},
-        {"name": "SOLIDAIRES 28", "url": "https://www.papayoux-solidarite.com/fr/collecte/caisse-de-greve-pour-les-grevistes-deure-et-loir", "lat": 48.4, "lng": 1.5},
-        {"name": "Union Locale des syndicats CGT Antibes et sa région", "url": "https://www.helloasso.com/associations/union-locale-des-syndicats-cgt-d-antibes-et-region/formulaires/1", "lat": 43.6, "lng": 7.1},
-        {"name": "lycée Jacques Feyder Epinay sur Seine", "url": "https://www.leetchi.com/c/caisse-de-greve-lycee-feyder", "lat": 48.8, "lng": 2.3},
-        {"name": "lycée Romain Rolland Ivry sur Seine", "url": "https://www.lepotcommun.fr/pot/0mjz8ni0", "lat": 48.8, "lng": 2.3},
-        {"name": "Solidaire Ille et Vilaine 35", "url": "https://www.cotizup.com/solidaires35-greve-retraites", "lat": 48.1, "lng": -1.7},
-        {"name": "L'Enclume - Enthousiaste Comité de Lutte de Mulhouse et Environs", "url": "https://www.cotizup.com/caisse-de-greve-mulhouse", "lat": 47.7, "lng": 7.3},
-        {"name": "ASSO du 31 (Haute Garonne)", "url": "https://www.papayoux-solidarite.com/fr/collecte/caisse-de-greve-pour-les-salarie-e-s-des-asso", "lat": 43.6, "lng": 1.4},
-        {"name": "intersyndicale des Unions départementales de l'Eure", "url": "https://www.leetchi.com/c/fond-de-greve-des-ud-de-leure-2023", "lat": 48.8, "lng": 2.3},
-        {"name": "union syndicale solidaires 21", "url": "https://www.helloasso.com/associations/union-syndicale-solidaires-21/formulaires/1", "lat": 47.3, "lng": 5.0},
-        {"name": "comité de luttes de Champigny et environs", "url": "https://gofund.me/206025ac", "lat": 48.8, "lng": 2.3},
-        {"name": "Grévistes du centre d'incinération d'Isséane - Issy-les-Moulineaux", "url": "https://www.leetchi.com/c/soutien-grevistes-isseane", "lat": 48.8, "lng": 2.3},
-        {"name": "Grévistes du centre d'incinération TIRU de Saint-Ouen", "url": "https://www.leetchi.com/c/soutien-aux-agents-grevistes-de-la-tiru-de-saint-ouen?utm_source=copylink&utm_medium=social_sharing", "lat": 48.8, "lng": 2.3},
-        {"name": "Personnel mobilisé de Sciences Po Bordeaux", "url": "https://www.papayoux-solidarite.com/fr/collecte/caisse-de-greve", "lat": 44.8, "lng": -0.6},
-        {"name": "AG interpro 54", "url": "https://nancy-luttes.net/ag2020/CaisseDeGreveInterpro54.html", "lat": 48.7, "lng": 6.2},
-        {"name": "Comité de mobilisation de Rennes 2", "url": "https://www.cotizup.com/caissedegreverennes2", "lat": 48.1, "lng": -1.7},
-        {"name": "Lycée François Truffaut de Bondoufle (91)", "url": "https://www.leetchi.com/c/cadeau-f-truffaut?utm_source=copylink&utm_medium=social_sharing", "lat": 48.8, "lng": 2.3},
-        {"name": "Cheminots Juvisy", "url": "https://www.leetchi.com/c/caisse-de-greve-et-de-solidarite-pour-les-cheminots-de-juvisy-en-lutte-contre-la-retraite-a-64-ans?utm_source=copylink&utm_medium=social_sharing", "lat": 48.8, "lng": 2.3},
-        {"name": "Sud CT Loire Atlantique (44)", "url": "https://www.leetchi.com/c/une-caisse-de-greve-pour-soutenir-les-grevistes-wxygrjyd", "lat": 47.2, "lng": -1.6},
-        {"name": "Lycée Le Corbusier à Aubervilliers", "url": "https://www.papayoux-solidarite.com/fr/collecte/caisse-de-greve-corbu?fbclid=IwAR0glHeOgGmTS0o_AupohhwpIVfXsWK3nDmbXpwxJt3BC0FIzyvvSIAh9fM", "lat": 48.8, "lng": 2.3},
-        {"name": "ELECTRICIENS ET GAZIERS PARISIENS CONTRE LA RETRAITE A 64 ANS", "url": "https://www.leetchi.com/c/les-electriciens-et-gaziers-parisiens-contre-la-retraite-a-64-ans", "lat": 48.8, "lng": 2.3},
-        {"name": "Comité de Luttes Montilien", "url": "https://www.helloasso.com/associations/comite-de-luttes-montilien/formulaires/1", "lat": 48.8, "lng": 2.3},
-        {"name": "Personnels grévistes du lycée des Graves", "url": "https://www.papayoux-solidarite.com/fr/collecte/caisse-de-greve-et-de-solidarite-lycee-des-graves", "lat": 44.8, "lng": -0.6},
-        {"name": "Caisse de grève Lycée Marcelin Berthelot", "url": "https://www.leetchi.com/c/caisse-de-greve-pour-les-retraites-du-lycee-marcelin-berthelot?utm_source=whatsapp&utm_medium=social_sharing", "lat": 48.8, "lng": 2.3},
-        {"name": "Solidarité aux Pizzorno de Vitry", "url": "https://www.helloasso.com/associations/caisse-de-solidarite-2/formulaires/36", "lat": 48.8, "lng": 2.3},
-        {"name": "Lycée Maurice Utrillo Stains", "url": "https://www.papayoux.com/fr/cagnotte/caisse-de-greve-utrillo", "lat": 48.8, "lng": 2.3},
-        {"name": "Solidarité AED Lycée Bremontier", "url": "https://lydia-app.com/pots?id=21632-caisse-solidarite-aed-bremontier", "lat": 44.8, "lng": -0.6},
-        {"name": "Solidaires RATP métro lignes 3/3bis", "url": "https://www.cotizup.com/pour-aider-a-lutte-contre-cett", "lat": 48.8, "lng": 2.3},
-        {"name": "SUD Rail Paris Sud Est", "url": "https://www.leetchi.com/c/greve-des-retraites-sud-rail-pse?utm_source=copylink&utm_medium=social_sharing", "lat": 48.8, "lng": 2.3},
-        {"name": "Solidaires 86 Vienne", "url": "https://www.helloasso.com/associations/union-syndicale-solidaires-11/formulaires/1", "lat": 46.6, "lng": 0.3},
-        {"name": "Solidaires 27 Eure", "url": "https://www.leetchi.com/c/fond-de-greve-des-ud-de-leure-2023", "lat": 48.8, "lng": 2.3},
-        {"name": "Caisse de greve Sud Solidaires 06 Alpes Maritimes", "url": "https://www.cotizup.com/solidaires06", "lat": 43.7, "lng": 7.3},
-        {"name": "Grevistes de la tiru de saint-ouen", "url": "https://www.leetchi.com/c/soutien-aux-agents-grevistes-de-la-tiru-de-saint-ouen?utm_source=copylink&utm_medium=social_sharing", "lat": 48.8, "lng": 2.3},
-        {"name": "CGT Energie Charente", "url": "https://www.leetchi.com/c/cgt-energie-charente-soutien-contre-la-reforme-des-retraites?fbclid=IwAR2GVjx9feF_gV9P-WnTxQ_q1YPUw8I0fYJTj33LxNg6IcEEKu3hcKUIvNo", "lat": 45.6, "lng": 0.2},
-        {"name": "Raffinerie Plateforme Normandie", "url": "https://www.cotizup.com/plateformenormandie", "lat": 49.4, "lng": 0.2},
-        {"name": "Caisse de grève interprofessionnelle du Mantois", "url": "https://sudeducation78.ouvaton.org/Une-caisse-de-greve-interpro-dans-le-Mantois", "lat": 48.8, "lng": 2.3},
-        {"name": "Technicentre Châtillon (maintenance TGV)", "url": "https://www.leetchi.com/c/caisse-de-greve-des-cheminots-de-chatillon", "lat": 48.8, "lng": 2.3},
-        {"name": "Enseignants et AESH 1er degré 19ème arrondissement", "url": "https://www.helloasso.com/associations/arret-images/formulaires/1", "lat": 48.8, "lng": 2.3},
-        {"name": "AG interprofessionnelle de Saint-Denis", "url": "https://www.papayoux-solidarite.com/fr/collecte/caisse-de-greve-ag-interpro-saint-denis", "lat": 48.8, "lng": 2.3},
-        {"name": "CGT des laboratoires Pierre Fabre", "url": "https://www.helloasso.com/associations/syndicat-cgt-des-laboratoires-pierre-fabre/formulaires/1", "lat": 43.6, "lng": 1.4},
-        {"name": "Collectif des éboueurs de Nantes Métropole", "url": "https://caisse-solidarite.fr/c/eboueurs-nantes/", "lat": 47.2, "lng": -1.6},
-        {"name": "Cheminots de Paris Nord", "url": "https://www.cotizup.com/bataille-retraite-cheminot-pno", "lat": 48.8, "lng": 2.3},
-        {"name": "Chauffeurs Poids Lourd de la Propreté de Paris", "url": "https://caisse-solidarite.fr/c/chauffeurs-proprete-paris/", "lat": 48.8, "lng": 2.3},
-        {"name": "Universités et bibliothèques d'IDF en lutte", "url": "https://www.cotizup.com/caisse-de-greve-univ-bib", "lat": 48.8, "lng": 2.3},
-        {"name": "AG des Territoriaux Ville de Paris pour la grève reconductible (Propreté, espaces verts, affaires scolaires, petite enfance, social, culture...)", "url": "https://caisse-solidarite.fr/c/ville-de-paris-en-lutte", "lat": 48.8, "lng": 2.3},
-        {"name": "Eboueurs et travailleurs du SIVOM en grève - Varennes-Jarcy", "url": "https://www.cotizup.com/eboueurs-sivom", "lat": 48.8, "lng": 2.3},
-        {"name": "Soutien aux éboueurs de Saint-Brieuc", "url": "https://www.leetchi.com/c/soutien-eboueurs-grevistes?fbclid=IwAR37klksknkq53BHqXrsFU_GmzgXkW6KKbvN2la2MXiwwVpND6BMhSRrpGo", "lat": 48.5, "lng": -2.8},
-        {"name": "Caisse de grève - Planning Familial de la Gironde", "url": "https://www.papayoux-solidarite.com/fr/collecte/caisse-de-greve-planning-familial-de-la-gironde", "lat": 44.8, "lng": -0.6},
-        {"name": "Collectif MobiRetraites92", "url": "https://www.cotizup.com/MobiRetraites92", "lat": 48.8, "lng": 2.3},
-        {"name": "Collège La Cerisaie", "url": "https://www.leetchi.com/c/caisse-de-greve-la-cerisaie", "lat": 48.8, "lng": 2.3},
-        {"name": "Caisse de grève du collège E. Quinet", "url": "https://www.leetchi.com/c/caisse-de-greve-du-college-e-quinet", "lat": 43.3, "lng": 5.4},
-        {"name": "Caisse de soutien aux éboueurs de Saint Etienne", "url": "https://www.leetchi.com/fr/c/lQv64OVE?utm_source=facebook&fbclid=IwAR2IBl4krpXCE_CUCBimw4cON9T_ZDszYDXScaQz98L_TtB7-Wg4aGFNoDM", "lat": 45.4, "lng": 4.4},
-        {"name": "Solidaire RATP", "url": "https://www.cotizup.com/caissedegrevesolidairesratp", "lat": 48.8, "lng": 2.3},
-        {"name": "Personnels grévistes du lycée Jean Vilar", "url": "https://www.papayoux-solidarite.com/fr/collecte/caisse-de-greve-lycee-jean-vilar", "lat": 48.8, "lng": 2.3},
-        {"name": "Caisse de grève du collège Albert Camus (Le Plessis-Trévise, 94)", "url": "https://caisse-solidarite.fr/c/albertcamus-plessistrevise/", "lat": 48.8, "lng": 2.3},
-        {"name": "Éducation Groupe scolaire Nanteuil MONTREUIL", "url": "https://www.cotizup.com/caissedegreve-nanteuil", "lat": 48.8, "lng": 2.3},
-        
-        # Thematic funds (no specific location)
-        {"name": "Caisse de grève Queer", "url": "https://www.papayoux.com/fr/cagnotte/caisse-de-greve-queer", "type": "thematic"},
-        {"name": "Sud-Éducation", "url": "https://www.helloasso.com/associations/sud-education/collectes/solidarite-avec-les-grevistes-de-l-education-1", "type": "thematic"},
-        {"name": "CNT SO", "url": "https://www.papayoux-solidarite.com/fr/collecte/caisse-de-greve-interpro-de-la-cnt-so", "type": "thematic"},
-        {"name": "CGT", "url": "https://www.leetchi.com/c/solidarite-cgt-mobilisation", "type": "thematic"},
-        {"name": "Solidarité Lutte FNME CGT – Fédé nationale Mines énergie", "url": "https://www.leetchi.com/c/solidarite-lutte-fnme-cgt", "type": "thematic"},
-        {"name": "Syndicat des Travailleurs et Travailleuses du Jeu Vidéo (STJV)", "url": "https://www.stjv.fr/2023/01/mobilisation-pour-les-retraites-caisse-de-greve-du-stjv/", "type": "thematic"},
-        {"name": "Sud Rail Centraux", "url": "https://www.cotizup.com/solidaritecheminots", "type": "thematic"},
-        {"name": "Caisse de solidarité intersyndicale CGT-SUD", "url": "https://caisse-solidarite.fr", "type": "thematic"},
-        {"name": "Caisse de grève des Métiers du Livre", "url": "https://www.cotizup.com/metier-du-livre-en-lutte", "type": "thematic"},
-        {"name": "Caisse de grève des salariés de l'associatif ASSO Solidaires", "url": "https://www.helloasso.com/associations/syndicat-asso-solidaires/formulaires/1", "type": "thematic"},
-        {"name": "Caisse de grève des assistant.es d'éducation (AED) d'Île-de-France", "url": "https://www.papayoux-solidarite.com/fr/collecte/caisse-de-greve-des-surveillant-es-d-ile-de-france", "type": "thematic"},
-        {"name": "sud education", "url": "https://www.sudeducation.org/caisse-de-greve-pour-soutenir-les-grevistes-de-leducation-et-de-lesr-contre-la-reforme-des-retraites/", "type": "thematic"},
-        {"name": "AG Education Ile-de-France", "url": "https://www.helloasso.com/associations/association-crbp/formulaires/2", "type": "thematic"},
-        {"name": "Solidarité avec les luttes SUD PTT", "url": "https://www.helloasso.com/associations/sud-ptt/formulaires/2", "type": "thematic"},
-        {"name": "coordination antirépression Paris IdF 07 52 95 71 11", "url": "https://www.helloasso.com/associations/collectives-solidarites", "type": "thematic"},
-        {"name": "caisse de soutien antirépression Marseille 07.53.05.25.30", "url": "https://www.helloasso.com/associations/liberte-toujours?banner=true", "type": "thematic"},
-    ]
-    
-    return strike_funds
 
 def main():
-    strike_funds = extract_strike_funds_data()
-    
-    # Save to JSON file
-    with open('strike_funds_data.json', 'w', encoding='utf-8') as f:
-        json.dump(strike_funds, f, ensure_ascii=False, indent=2)
-    
+    parser = argparse.ArgumentParser(description='Extract strike funds from saved map HTML snapshots')
+    parser.add_argument('source', nargs='?', help='HTML snapshot file or directory of snapshots')
+    parser.add_argument('--zoom', type=int, help='map zoom level of the snapshot; default: read from the map tiles')
+    parser.add_argument('--origin', type=float, nargs=2, metavar=('X', 'Y'),
+                        help='pixel origin of the map layer (global pixel coordinates); default: read from the map tiles')
+    parser.add_argument('--output', default='strike_funds_data.json')
+    parser.add_argument('--bench', type=int, nargs='?', const=100000, metavar='MARKERS',
+                        help='benchmark the parser on a synthetic page instead of extracting')
+    parser.add_argument('--geocode', action=argparse.BooleanOptionalAction, default=True,
+                        help='place funds at the fallback pair or without location from their name (fund_geocoder.py)')
+    parser.add_argument('--communes', metavar='CSV',
+                        help='full commune list (nom_commune, code_departement, latitude, longitude) to extend the bundled gazetteer')
+    parser.add_argument('--dedup', choices=('merge', 'flag', 'off'), default='merge',
+                        help='merge or only report duplicate funds (fund_dedup.py)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='skip unchanged snapshots and write only added/changed/removed funds (fund_delta.py)')
+    parser.add_argument('--check-links', action='store_true',
+                        help='check fund URLs and collect raised/target amounts (fund_liveness.py)')
+    parser.add_argument('--columnar', action='store_true',
+                        help='also write the compact columnar export with gzip/brotli variants (fund_columnar.py)')
+    parser.add_argument('--index', action='store_true',
+                        help='also save the spatial index (fund_index.py) next to the JSON output')
+    parser.add_argument('--images', action='store_true',
+                        help='also build responsive variants and blur placeholders of the profile images (profile_images.py)')
+    parser.add_argument('--shards', action='store_true',
+                        help='also write geohash shards and their manifest (fund_shards.py) next to the JSON output')
+    args = parser.parse_args()
+
+    if args.bench:
+        sys.exit(0 if bench_parser(args.bench) else 1)
+    if not args.source:
+        parser.error('a snapshot file or directory is required')
+
+    output_dir = os.path.dirname(args.output) or '.'
+
+    def extract():
+        try:
+            funds = extract_strike_funds_data(args.source, zoom=args.zoom, origin=tuple(args.origin) if args.origin else None)
+        except ValueError as error:
+            parser.error(str(error))
+        if args.geocode:
+            from fund_geocoder import Gazetteer, geocode_funds, load_communes_csv
+            extra = load_communes_csv(args.communes) if args.communes else ()
+            funds, stats = geocode_funds(funds, Gazetteer(extra_communes=extra))
+            print(f"- {stats['geocoded']} of {stats['candidates']} funds geocoded from their names")
+        if args.dedup == 'off':
+            return funds
+        from fund_dedup import DEFAULT_REPORT_FILE, deduplicate, write_report
+        funds, report = deduplicate(funds, mode=args.dedup)
+        report_path = os.path.join(output_dir, DEFAULT_REPORT_FILE)
+        write_report(report_path, report)
+        stats = report['stats']
+        print(f"- {stats['exactGroups']} duplicate URLs, {stats['fuzzyPairs']} similar names, "
+              f"{stats['urlConflicts']} URLs shared across places (see {report_path})")
+        return funds
+
+    if args.incremental:
+        from fund_delta import (
+            DEFAULT_BASELINE_FILE, DEFAULT_DELTA_FILE, DEFAULT_STATE_FILE, file_digest, is_empty, run_incremental,
+        )
+        # Anything that changes the output without touching the snapshots
+        params = {"zoom": args.zoom, "origin": args.origin, "geocode": args.geocode, "dedup": args.dedup}
+        if args.geocode:
+            from fund_geocoder import GAZETTEER_FILE
+            params['gazetteer'] = file_digest(GAZETTEER_FILE)
+            if args.communes:
+                params['communes'] = file_digest(args.communes)
+        delta_path = os.path.join(output_dir, DEFAULT_DELTA_FILE)
+        delta = run_incremental(
+            extract,
+            list(iter_snapshot_files(args.source)),
+            args.output,
+            state_path=os.path.join(output_dir, DEFAULT_STATE_FILE),
+            delta_path=delta_path,
+            params=params,
+            baseline_path=os.path.join(output_dir, DEFAULT_BASELINE_FILE),
+        )
+        if delta['full']:
+            print(f"- nothing uploaded yet: the delta replaces the whole gist ({len(delta['added'])} funds)")
+            print(f"Delta saved to {delta_path}")
+        elif is_empty(delta):
+            print("No changes since the last upload")
+        else:
+            print(f"- {len(delta['added'])} added, {len(delta['changed'])} changed, {len(delta['removed'])} removed")
+            print(f"Delta saved to {delta_path}")
+        with open(args.output, 'r', encoding='utf-8') as f:
+            strike_funds = json.load(f)
+    else:
+        strike_funds = extract()
+
+        # Save to JSON file
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(strike_funds, f, ensure_ascii=False, indent=2)
+
     print(f"Found {len(strike_funds)} strike funds")
-    
+
     # Display summary
     with_coordinates = [f for f in strike_funds if 'lat' in f and 'lng' in f]
     thematic = [f for f in strike_funds if f.get('type') == 'thematic']
-    
+
     print(f"- {len(with_coordinates)} funds with coordinates")
     print(f"- {len(thematic)} thematic funds")
-    print("Data saved to strike_funds_data.json")
+    print(f"Data saved to {args.output}")
+
+    if args.columnar:
+        from fund_columnar import normalize_record, write_columnar
+        columnar_path = os.path.splitext(args.output)[0] + '.bin'
+        written = write_columnar([normalize_record(f) for f in strike_funds], columnar_path)
+        print(f"Columnar export saved to {columnar_path} ({written[columnar_path]:,} bytes)")
+
+    if args.check_links:
+        from fund_liveness import DEFAULT_CACHE_FILE, DEFAULT_STATUS_FILE, check_fund_urls, write_status
+        results, stats = check_fund_urls(strike_funds, cache_path=os.path.join(output_dir, DEFAULT_CACHE_FILE))
+        status_path = os.path.join(output_dir, DEFAULT_STATUS_FILE)
+        write_status(status_path, results)
+        print(f"Checked {len(results)} URLs ({stats['cached']} cached, {stats['errors']} errors), status saved to {status_path}")
+
+    if args.index:
+        from fund_index import index_path_for, load_or_build_index
+        _, index = load_or_build_index(args.output)
+        print(f"Spatial index of {len(index)} funds saved to {index_path_for(args.output)}")
+
+    if args.images:
+        from profile_images import DEFAULT_IMAGE_DIR, VARIANTS_MANIFEST, build_variants
+        _, stats = build_variants()
+        print(f"Profile images: {stats['processed']} processed, {stats['skipped']} unchanged, "
+              f"variants listed in {os.path.join(DEFAULT_IMAGE_DIR, VARIANTS_MANIFEST)}")
+
+    if args.shards:
+        from fund_shards import DEFAULT_SHARDS_DIR, write_shards
+        shards_dir = os.path.join(output_dir, DEFAULT_SHARDS_DIR)
+        manifest = write_shards(strike_funds, shards_dir)
+        print(f"{len(manifest['shards'])} shards saved to {shards_dir}")
 
 if __name__ == "__main__":
     main()
-
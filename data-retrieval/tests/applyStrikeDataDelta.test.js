@@ -0,0 +1,113 @@
+/**
+ * Tests for applying extractor deltas to the gist profiles
+ */
+
+import { applyDelta, applyFundStatus, canonicalizeUrl } from '../apply_strike_data_delta.js';
+
+const AUDE_URL = 'https://www.helloasso.com/associations/union-syndicale-solidaires-11/formulaires/1';
+
+function legacyProfile(index, name, url, title) {
+  return {
+    id: `strike-fund-${index}`,
+    name,
+    age: 42,
+    bio: `${title} - ${name}, militante passionnée.`,
+    photoUrl: `/assets/profiles/profile-00${index}.jpg`,
+    location: { lat: 47.8, lon: 3.6 },
+    strikeFund: {
+      id: `fund-${index}`,
+      url,
+      title,
+      description: `Caisse de grève locale : ${title}`,
+      category: 'Locale',
+      urgency: 'Élevée',
+      currentAmount: 20701,
+      targetAmount: 89765,
+    },
+  };
+}
+
+const legacyProfiles = [
+  legacyProfile(1, 'Marie Dubois', 'https://www.helloasso.com/associations/solidaires-89/formulaires/1', 'Solidaires Yonne 89'),
+  legacyProfile(2, 'Lucas Martin', AUDE_URL, 'Solidaires Aude 11'),
+  legacyProfile(3, 'Emma Bernard', AUDE_URL, 'Solidaires 86 Vienne'),
+  legacyProfile(4, 'Hugo Petit', 'https://www.leetchi.com/c/disparue', 'Caisse disparue'),
+];
+
+const fullDelta = {
+  previousHash: 'e3b0c44298fc1c14',
+  catalogueHash: 'aaaaaaaaaaaaaaaa',
+  full: true,
+  changed: [],
+  removed: [],
+  added: [
+    { id: '111111111111', name: 'Solidaires Yonne 89', url: 'https://www.helloasso.com/associations/solidaires-89/formulaires/1/?utm_source=fb', lat: 47.8, lng: 3.6 },
+    { id: '222222222222', name: 'Solidaires 86 Vienne', url: AUDE_URL, lat: 46.6, lng: 0.3 },
+    { id: '333333333333', name: 'Solidaires Aude 11', url: AUDE_URL, lat: 43.2, lng: 2.4 },
+    { id: '444444444444', name: 'CGT Énergie Paris', url: 'https://www.cotizup.com/cgt-energie', lat: 48.85, lng: 2.35 },
+  ],
+};
+
+describe('applyStrikeDataDelta', () => {
+  describe('canonicalizeUrl', () => {
+    it('should ignore tracking parameters, trailing slashes and router fragments', () => {
+      expect(canonicalizeUrl(' HTTPS://WWW.HelloAsso.com:443//associations/x/?utm_source=fb&b=2&a=1#/ ')).toBe(
+        'https://www.helloasso.com/associations/x?a=1&b=2'
+      );
+      expect(canonicalizeUrl('https://a.fr/p?id=1#don')).toBe('https://a.fr/p?id=1#don');
+    });
+  });
+
+  describe('applyDelta', () => {
+    it('should keep personas when a full delta replaces index-ID profiles', () => {
+      const updated = applyDelta(legacyProfiles, fullDelta);
+
+      expect(updated.map(profile => profile.id)).toEqual([
+        'strike-fund-111111111111',
+        'strike-fund-333333333333',
+        'strike-fund-222222222222',
+        'strike-fund-444444444444',
+      ]);
+      const [yonne, aude, vienne] = updated;
+      expect(yonne.name).toBe('Marie Dubois');
+      expect(yonne.photoUrl).toBe('/assets/profiles/profile-001.jpg');
+      expect(yonne.strikeFund).toMatchObject({ id: 'fund-111111111111', urgency: 'Élevée', currentAmount: 20701 });
+      // Funds sharing a URL are told apart by their title
+      expect(aude.name).toBe('Lucas Martin');
+      expect(vienne.name).toBe('Emma Bernard');
+      expect(vienne.location).toEqual({ lat: 46.6, lon: 0.3 });
+      // A fund without a profile gets a new one; the missing fund's profile is dropped
+      expect(updated[3].strikeFund.title).toBe('CGT Énergie Paris');
+      expect(updated.some(profile => profile.name === 'Hugo Petit')).toBe(false);
+    });
+
+    it('should update, add and remove profiles by stable ID', () => {
+      const profiles = applyDelta(legacyProfiles, fullDelta);
+      const updated = applyDelta(profiles, {
+        previousHash: 'aaaaaaaaaaaaaaaa',
+        catalogueHash: 'bbbbbbbbbbbbbbbb',
+        full: false,
+        changed: [{ ...fullDelta.added[0], name: 'Solidaires Yonne', raisedAmount: 1234 }],
+        added: [{ id: '555555555555', name: 'Sud Rail Lyon', url: 'https://www.leetchi.com/c/sud-rail', lat: 45.76, lng: 4.83 }],
+        removed: ['444444444444'],
+      });
+
+      expect(updated).toHaveLength(4);
+      expect(updated[0]).toMatchObject({ name: 'Marie Dubois', strikeFund: { title: 'Solidaires Yonne', currentAmount: 1234 } });
+      expect(updated[1]).toBe(profiles[1]);
+      expect(updated.map(profile => profile.id)).not.toContain('strike-fund-444444444444');
+      expect(updated[3].strikeFund.title).toBe('Sud Rail Lyon');
+    });
+  });
+
+  describe('applyFundStatus', () => {
+    it('should only count profiles whose amounts changed', () => {
+      const profiles = applyDelta(legacyProfiles, fullDelta);
+      const statusByUrl = new Map([[AUDE_URL, { url: AUDE_URL, raisedAmount: 500 }]]);
+
+      expect(applyFundStatus(profiles, statusByUrl)).toBe(2);
+      expect(applyFundStatus(profiles, statusByUrl)).toBe(0);
+      expect(profiles[1].strikeFund.currentAmount).toBe(500);
+    });
+  });
+});
@@ -0,0 +1,91 @@
+import json
+
+import pytest
+
+from build_gazetteer import build_gazetteer, load_export, write_gazetteer
+from fund_geocoder import Gazetteer
+
+BASE = {
+    "version": 1,
+    "departements": [
+        {"code": "38", "name": "Isère", "lat": 45.19, "lng": 5.72},
+        {"code": "86", "name": "Vienne", "lat": 46.58, "lng": 0.34},
+        {"code": "974", "name": "La Réunion", "lat": -20.88, "lng": 55.45},
+    ],
+    "regions": [{"name": "Île-de-France", "lat": 48.857, "lng": 2.352, "aliases": ['IdF']}],
+    "communes": [
+        {"name": 'Saint-Denis', "departement": '93', "lat": 48.9362, "lng": 2.3574},
+        {"name": 'Old generated', "departement": '38', "lat": 45.0, "lng": 5.0, "population": 9000},
+    ],
+}
+
+
+def write_export(path, rows, delimiter=','):
+    header = ['code_insee', 'nom_standard', 'dep_code', 'population', 'latitude_centre', 'longitude_centre']
+    path.write_text('\n'.join(delimiter.join(map(str, row)) for row in [header] + rows) + '\n', encoding='utf-8')
+
+
+def test_load_export_reads_the_data_gouv_layouts(tmp_path):
+    path = tmp_path / 'communes.csv'
+    write_export(path, [
+        ['38544', 'Vienne', '38', 29000, 45.5254, 4.8746],
+        ['2A004', 'Ajaccio', '2a', 73000, 41.9267, 8.7369],
+        ['38999', 'Sans position', '38', 500, '', ''],
+    ], delimiter=';')
+    communes, has_population = load_export(str(path))
+
+    assert has_population
+    assert communes == [
+        {"name": 'Vienne', "departement": '38', "lat": 45.5254, "lng": 4.8746, "population": 29000},
+        {"name": 'Ajaccio', "departement": '2A', "lat": 41.9267, "lng": 8.7369, "population": 73000},
+    ]
+
+    # Postal exports: no population, one row per postcode
+    path.write_text(
+        'code_commune_INSEE,nom_commune,code_postal,latitude,longitude,code_departement\n'
+        '13055,Marseille,13001,43.2965,5.3698,13\n'
+        '13055,Marseille,13002,43.2965,5.3698,13\n',
+        encoding='utf-8',
+    )
+    communes, has_population = load_export(str(path))
+    assert not has_population and [c['name'] for c in communes] == ['Marseille']
+
+
+def test_build_gazetteer(tmp_path):
+    communes = [
+        {"name": 'Saint-Paul', "departement": '974', "lat": -21.0096, "lng": 55.2707, "population": 105000},
+        {"name": 'Saint-Paul', "departement": '38', "lat": 45.3984, "lng": 4.2262, "population": 2100},
+        {"name": 'Saint-Denis', "departement": '974', "lat": -20.8823, "lng": 55.4504, "population": 150000},
+        {"name": 'Saint-Denis', "departement": '93', "lat": 48.94, "lng": 2.35, "population": 110000},
+        {"name": 'Vienne', "departement": '38', "lat": 45.5254, "lng": 4.8746, "population": 29000},
+        {"name": 'Orange', "departement": '84', "lat": 44.1381, "lng": 4.8075, "population": 28000},
+        {"name": 'Hameau', "departement": '38', "lat": 45.1, "lng": 5.1, "population": 150},
+    ]
+    data = build_gazetteer(BASE, communes, min_population=2000)
+
+    # Curated entries first and untouched; earlier generated ones are replaced
+    assert [(c['name'], c['departement']) for c in data['communes']] == [
+        ('Saint-Denis', '93'), ('Saint-Denis', '974'), ('Saint-Paul', '974'), ('Saint-Paul', '38'),
+    ]
+    path = tmp_path / 'gazetteer.json'
+    write_gazetteer(str(path), data)
+    assert json.loads(path.read_text(encoding='utf-8')) == data
+
+    gazetteer = Gazetteer(str(path))
+    assert gazetteer.match('AG de Saint-Denis')[1]['departement'] == '93'
+    assert gazetteer.match('Saint-Paul')[1]['departement'] == '974'
+    # The département named next to a homonym picks it
+    assert gazetteer.match('Solidaires Saint-Paul (Isère)')[1]['departement'] == '38'
+    # Vienne is the département, and CGT Orange is not in Vaucluse
+    assert gazetteer.match('Solidaires 86 Vienne') == ('departement', BASE['departements'][1])
+    assert gazetteer.match('CGT Orange') is None
+
+
+@pytest.mark.parametrize('min_population, expected', [(0, 5), (2000, 4), (200000, 0)])
+def test_population_threshold(min_population, expected):
+    communes = [
+        {"name": f'Commune {i}', "departement": '38', "lat": 45.0, "lng": 5.0, "population": population}
+        for i, population in enumerate((150, 2000, 2500, 90000, 150000))
+    ]
+    data = build_gazetteer(BASE, communes, min_population=min_population)
+    assert len(data['communes']) - 1 == expected
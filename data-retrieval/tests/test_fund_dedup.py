@@ -0,0 +1,84 @@
+from fund_dedup import (
+    SORT_WINDOW, blocking_key, canonicalize_url, deduplicate, find_fuzzy_duplicates, neighbourhood_pairs, strip_tracking,
+)
+
+SHARED_URL = 'https://www.helloasso.com/associations/union-syndicale-solidaires-11/formulaires/1'
+
+
+def test_canonicalize_url():
+    assert canonicalize_url(' HTTPS://WWW.HelloAsso.com:443//associations/x/?utm_source=fb&b=2&a=1#/ ') == \
+        'https://www.helloasso.com/associations/x?a=1&b=2'
+    assert canonicalize_url('http://example.org:8080/a/?fbclid=abc') == 'http://example.org:8080/a'
+    # Real fragments and the query values themselves are kept
+    assert canonicalize_url('https://a.fr/p?id=Ab#don') == 'https://a.fr/p?id=Ab#don'
+
+
+def test_strip_tracking_keeps_the_published_url():
+    assert strip_tracking('https://caisse-solidarite.fr/c/snf/') == 'https://caisse-solidarite.fr/c/snf/'
+    assert strip_tracking('https://www.okpal.com/caisse/#/') == 'https://www.okpal.com/caisse/#/'
+    assert strip_tracking('https://a.fr/p?utm_source=fb&id=A%20b&fbclid=1#don') == 'https://a.fr/p?id=A%20b#don'
+
+
+def test_blocking_key_groups_by_host_and_area():
+    paris = {"url": 'https://www.leetchi.com/c/a', "lat": 48.8566, "lng": 2.3522}
+    assert blocking_key(paris) == blocking_key({**paris, "url": 'https://www.leetchi.com/c/b', "lat": 48.88})
+    assert blocking_key(paris) != blocking_key({**paris, "url": 'https://www.cotizup.com/a'})
+    assert blocking_key(paris) != blocking_key({**paris, "lat": 43.6})
+    assert blocking_key({"url": 'https://a.fr/x', "type": 'thematic'}) == ('a.fr', 'thematic')
+
+
+def test_fuzzy_names_are_only_compared_within_a_block():
+    funds = [
+        {"name": 'Caisse de grève CGT Énergie Paris', "url": 'https://a.fr/1', "lat": 48.83, "lng": 2.33},
+        {"name": 'CGT Energie Paris', "url": 'https://a.fr/2', "lat": 48.84, "lng": 2.32},
+        {"name": 'CGT Energie Paris', "url": 'https://a.fr/3', "lat": 45.76, "lng": 4.83},
+    ]
+    flagged, comparisons = find_fuzzy_duplicates(funds)
+    assert comparisons == 1
+    assert [pair['urls'] for pair in flagged] == [['https://a.fr/1', 'https://a.fr/2']]
+
+
+def test_large_blocks_only_compare_sorted_neighbours():
+    places = ['Amiens', 'Brest', 'Caen', 'Dijon', 'Évry', 'Grenoble', 'Lille', 'Metz', 'Nancy', 'Nîmes',
+              'Orléans', 'Pau', 'Reims', 'Rouen', 'Sète', 'Tours', 'Vannes', 'Valence', 'Agen', 'Albi']
+    names = [f'{union} {place}' for union in ('CGT', 'SUD', 'FSU') for place in places]
+    names += ['Cheminots CGT de Lyon', 'CGT Cheminots Lyon']
+    funds = [{"name": name, "url": f'https://a.fr/{i}', "type": 'thematic'} for i, name in enumerate(names)]
+
+    flagged, comparisons = find_fuzzy_duplicates(funds)
+    assert comparisons < len(funds) * (len(funds) - 1) // 2
+    # Far apart as written, next to each other as a sorted bag of words
+    assert ['Cheminots CGT de Lyon', 'CGT Cheminots Lyon'] in [pair['names'] for pair in flagged]
+    assert len(neighbourhood_pairs([('a',)] * (SORT_WINDOW + 1))) == SORT_WINDOW * (SORT_WINDOW + 1) // 2
+
+
+def test_shared_url_merges_nearby_records_only():
+    funds = [
+        {"name": 'Solidaires Aude 11', "url": SHARED_URL, "lat": 43.2, "lng": 2.4},
+        {"name": 'Solidaires 86 Vienne', "url": SHARED_URL + '?utm_medium=social', "lat": 46.6, "lng": 0.3},
+        {"name": 'Solidaires 11', "url": SHARED_URL + '/', "lat": 43.21, "lng": 2.35, "description": 'Aude'},
+    ]
+    output, report = deduplicate(funds)
+
+    assert [f['name'] for f in output] == ['Solidaires Aude 11', 'Solidaires 86 Vienne']
+    # Only the tracking parameters go; the join key is kept on the side
+    assert [f['url'] for f in output] == [SHARED_URL, SHARED_URL]
+    assert {f['canonicalUrl'] for f in output} == {SHARED_URL}
+    assert output[0]['aliases'] == ['Solidaires 11'] and output[0]['description'] == 'Aude'
+    assert (output[1]['lat'], output[1]['lng']) == (46.6, 0.3)
+    assert report['exact'][0]['duplicates'] == ['Solidaires 11']
+    assert report['urlConflicts'] == [{
+        "canonicalUrl": SHARED_URL,
+        "names": ['Solidaires Aude 11', 'Solidaires 86 Vienne'],
+        "coordinates": [[43.2, 2.4], [46.6, 0.3]],
+    }]
+
+
+def test_flag_mode_keeps_the_input():
+    funds = [
+        {"name": 'A', "url": 'https://a.fr/x', "lat": 48.85, "lng": 2.35},
+        {"name": 'A bis', "url": 'https://a.fr/x/', "lat": 48.85, "lng": 2.35},
+    ]
+    output, report = deduplicate(funds, mode='flag')
+    assert output == funds
+    assert report['stats']['exactGroups'] == 1 and report['stats']['output'] == 2
@@ -0,0 +1,98 @@
+import json
+
+from fund_delta import assign_ids, catalogue_hash, compute_delta, load_state, run_incremental
+
+
+def make_funds(count):
+    return [
+        {"name": f"Caisse {i}", "url": f"https://www.leetchi.com/c/caisse-{i}", "lat": 45.0, "lng": 2.0 + i / 10}
+        for i in range(count)
+    ]
+
+
+class Pipeline:
+    # Runs run_incremental() on a fake snapshot, and "uploads" like apply_strike_data_delta.js
+
+    def __init__(self, tmp_path):
+        self.tmp_path = tmp_path
+        self.snapshot = tmp_path / 'map.html'
+        self.paths = {
+            "output": str(tmp_path / 'strike_funds_data.json'),
+            "state_path": str(tmp_path / 'strike_funds_state.json'),
+            "delta_path": str(tmp_path / 'strike_funds_delta.json'),
+            "baseline_path": str(tmp_path / 'strike_funds_baseline.json'),
+        }
+        self.funds = []
+        self.extractions = 0
+
+    def run(self, funds=None, params=None):
+        if funds is not None:
+            self.funds = funds
+            self.snapshot.write_text(json.dumps(funds))
+
+        def extract():
+            self.extractions += 1
+            return [dict(fund) for fund in self.funds]
+
+        return run_incremental(extract, [str(self.snapshot)], params=params, **self.paths)
+
+    def upload(self, delta):
+        state = load_state(self.paths['state_path'])
+        assert state['catalogueHash'] == delta['catalogueHash']
+        with open(self.paths['baseline_path'], 'w', encoding='utf-8') as f:
+            json.dump({"version": state['version'], "catalogueHash": delta['catalogueHash'], "records": state['records']}, f)
+
+
+def test_ids_are_stable_and_unique_for_shared_urls():
+    funds = assign_ids([
+        {"name": 'Aude', "url": 'https://a.fr/x/'},
+        {"name": 'Vienne', "url": 'https://a.fr/x?utm_source=fb'},
+    ])
+    again = assign_ids([{"name": 'Aude', "url": 'https://a.fr/x'}, {"name": 'Vienne', "url": 'https://a.fr/x'}])
+
+    assert len({fund['id'] for fund in funds}) == 2
+    assert [fund['id'] for fund in funds] == [fund['id'] for fund in again]
+
+
+def test_compute_delta():
+    funds = assign_ids(make_funds(3))
+    _, records = compute_delta(funds, {})
+    renamed = dict(funds[1], name='Caisse renommée')
+    delta, _ = compute_delta([funds[0], renamed] + assign_ids(make_funds(5))[3:], records)
+
+    assert [f['name'] for f in delta['changed']] == ['Caisse renommée']
+    assert [f['name'] for f in delta['added']] == ['Caisse 3', 'Caisse 4']
+    assert delta['removed'] == [funds[2]['id']]
+    assert delta['previousHash'] == catalogue_hash(records)
+
+
+def test_deltas_accumulate_until_uploaded(tmp_path):
+    pipeline = Pipeline(tmp_path)
+    pipeline.run(make_funds(5))
+    pipeline.run(make_funds(6))
+    delta = pipeline.run(make_funds(7))
+    # Nothing was uploaded, so the gist still needs the whole catalogue
+    assert delta['full'] and len(delta['added']) == 7
+
+    pipeline.upload(delta)
+    assert pipeline.run()['added'] == []
+    delta = pipeline.run(make_funds(9))
+    assert not delta['full']
+    assert [f['name'] for f in delta['added']] == ['Caisse 7', 'Caisse 8']
+
+    # A re-run without changes does not replace the pending delta with an empty one
+    extractions = pipeline.extractions
+    delta = pipeline.run()
+    assert pipeline.extractions == extractions
+    assert [f['name'] for f in delta['added']] == ['Caisse 7', 'Caisse 8']
+    assert delta['previousHash'] == load_state(pipeline.paths['baseline_path'])['catalogueHash']
+
+
+def test_settings_change_forces_a_new_extraction(tmp_path):
+    pipeline = Pipeline(tmp_path)
+    pipeline.run(make_funds(3), params={"zoom": 6})
+    pipeline.run(params={"zoom": 6})
+    assert pipeline.extractions == 1
+
+    pipeline.run(params={"zoom": 7})
+    assert pipeline.extractions == 2
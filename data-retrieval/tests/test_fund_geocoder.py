@@ -0,0 +1,37 @@
+from fund_geocoder import Gazetteer, geocode_funds, load_communes_csv, needs_geocoding
+
+
+def test_only_the_exact_fallback_pair_is_geocoded():
+    assert needs_geocoding({"lat": 48.8, "lng": 2.3})
+    assert needs_geocoding({"lat": 48.80004, "lng": 2.29997})
+    assert needs_geocoding({"name": "Sans position"})
+    # Real places that used to round onto the fallback pair
+    assert not needs_geocoding({"lat": 48.8566, "lng": 2.3522})
+    assert not needs_geocoding({"lat": 48.7701, "lng": 2.2790})
+
+
+def test_match_prefers_the_most_specific_place():
+    gazetteer = Gazetteer()
+
+    assert gazetteer.match("Caisse de grève Val d'Oise")[1]['code'] == '95'
+    assert gazetteer.match('CGT St-Denis') == ('commune', gazetteer.match('Saint-Denis')[1])
+    assert gazetteer.match('Grève 64 ans Solidaires 86 Vienne')[1]['code'] == '86'
+    assert gazetteer.match('Tel 06 12 34 56 78') is None
+
+
+def test_communes_csv_extends_the_gazetteer(tmp_path):
+    path = tmp_path / 'communes.csv'
+    path.write_text(
+        'nom_commune,code_departement,latitude,longitude\n'
+        'Trifouilly-les-Oies,76,49.5,1.1\n'
+        'Sans coordonnées,76,,\n',
+        encoding='utf-8',
+    )
+    communes = load_communes_csv(str(path))
+    assert [c['name'] for c in communes] == ['Trifouilly-les-Oies']
+
+    funds = [{"name": 'Caisse de grève de Trifouilly-les-Oies', "lat": 48.8, "lng": 2.3}]
+    assert Gazetteer().match(funds[0]['name']) is None
+    funds, stats = geocode_funds(funds, Gazetteer(extra_communes=communes))
+    assert stats['commune'] == 1
+    assert (funds[0]['lat'], funds[0]['lng']) == (49.5, 1.1)
@@ -0,0 +1,89 @@
+import json
+
+import numpy as np
+import pytest
+
+from fund_index import FundIndex, haversine_km, index_path_for, load_or_build_index
+
+
+def random_points(count, seed=1):
+    rng = np.random.default_rng(seed)
+    # Uniform on the sphere, so the poles get their share of points
+    lats = np.degrees(np.arcsin(rng.uniform(-1, 1, count)))
+    lons = rng.uniform(-180, 180, count)
+    return lats, lons
+
+
+def brute_force(lats, lons, lat, lon, km):
+    dists = haversine_km(lat, lon, lats, lons)
+    keep = np.nonzero(dists <= km)[0]
+    return keep[np.argsort(dists[keep], kind='stable')]
+
+
+def test_queries_agree_with_brute_force():
+    lats, lons = random_points(3000)
+    index = FundIndex(lats, lons, np.arange(len(lats)), cell_deg=2.0)
+    query_lats, query_lons = random_points(40, seed=2)
+
+    for lat, lon in zip(query_lats, query_lons):
+        for km in (50, 800, 5000):
+            ids, dists = index.within_radius(lat, lon, km)
+            assert list(ids) == list(brute_force(lats, lons, lat, lon, km))
+            assert np.all(np.diff(dists) >= 0)
+        ids, _ = index.nearest(lat, lon, k=5)
+        assert list(ids) == list(np.argsort(haversine_km(lat, lon, lats, lons), kind='stable')[:5])
+
+    bulk = index.within_radius_many(query_lats, query_lons, 800)
+    for (ids, _), lat, lon in zip(bulk, query_lats, query_lons):
+        assert list(ids) == list(brute_force(lats, lons, lat, lon, 800))
+
+
+def test_queries_across_the_antimeridian_and_the_poles():
+    lats = [-16.5, -16.6, -17.0, 89.9, 89.95, -89.9]
+    lons = [179.9, -179.95, 178.0, 0.0, 135.0, -90.0]
+    index = FundIndex(lats, lons, np.arange(len(lats)))
+
+    ids, dists = index.within_radius(-16.55, -179.99, 30)
+    assert sorted(ids) == [0, 1] and dists.max() < 30
+    ids, _ = index.within_radius(90.0, -170.0, 20)
+    assert sorted(ids) == [3, 4]
+    ids, _ = index.nearest(-90.0, 45.0)
+    assert list(ids) == [5]
+
+
+def test_empty_input(tmp_path):
+    index = FundIndex.from_funds([{"name": 'Sans lieu', "url": 'https://a.fr', "type": 'thematic'}])
+    assert len(index) == 0
+    assert len(index.within_radius(48.85, 2.35, 100)[0]) == 0
+    assert len(index.nearest(48.85, 2.35, k=3)[0]) == 0
+    assert [len(ids) for ids, _ in index.within_radius_many([48.85, 43.3], [2.35, 5.37], 100)] == [0, 0]
+
+    path = tmp_path / 'funds.json'
+    path.write_text('[]')
+    funds, index = load_or_build_index(str(path))
+    assert funds == [] and len(index) == 0
+
+
+def test_load_or_build_index_reuses_the_saved_index(tmp_path, monkeypatch):
+    path = tmp_path / 'funds.json'
+    path.write_text(json.dumps([{"name": 'Paris', "lat": 48.85, "lng": 2.35}]))
+    builds = []
+    from_funds = FundIndex.from_funds.__func__
+
+    def counting_from_funds(cls, *args, **kwargs):
+        builds.append(1)
+        return from_funds(cls, *args, **kwargs)
+
+    monkeypatch.setattr(FundIndex, 'from_funds', classmethod(counting_from_funds))
+
+    load_or_build_index(str(path))
+    _, index = load_or_build_index(str(path))
+    assert len(builds) == 1 and len(index) == 1
+    assert (tmp_path / 'funds_index.npz').exists() and index_path_for(str(path)).endswith('funds_index.npz')
+
+    # Any change to the JSON content, or another cell size, rebuilds it
+    path.write_text(json.dumps([{"name": 'Paris', "lat": 48.85, "lng": 2.35}, {"name": 'Lyon', "lat": 45.76, "lng": 4.83}]))
+    _, index = load_or_build_index(str(path))
+    assert len(builds) == 2 and len(index) == 2
+    _, index = load_or_build_index(str(path), cell_deg=1.0)
+    assert len(builds) == 3 and index.cell_deg == pytest.approx(1.0)
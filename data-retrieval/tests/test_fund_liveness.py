@@ -0,0 +1,138 @@
+import asyncio
+import socket
+import time
+
+import aiohttp
+from aiohttp import web
+
+import fund_liveness
+from fund_liveness import ERROR_TTL, LinkChecker, extract_amounts
+
+PAGE = '<html><script>{"amountCollected": 1234, "goalAmount": 5000}</script></html>'
+
+
+def make_app(counts):
+    async def page(request):
+        counts['page'] = counts.get('page', 0) + 1
+        if request.headers.get('If-None-Match') == '"v1"':
+            return web.Response(status=304)
+        return web.Response(text=PAGE, content_type='text/html', headers={'ETag': '"v1"'})
+
+    async def chunked(request):
+        # Amounts arrive in a second chunk, after a large first one
+        response = web.StreamResponse(headers={'Content-Type': 'text/html'})
+        await response.prepare(request)
+        await response.write(b'<html>' + b' ' * 70000)
+        await asyncio.sleep(0.05)
+        await response.write(b'"amountCollected": 42, "goalAmount": 100</html>')
+        await response.write_eof()
+        return response
+
+    async def moved(request):
+        raise web.HTTPFound('/page')
+
+    async def timed(request):
+        counts.setdefault('starts', []).append(time.monotonic())
+        return web.Response(text='ok')
+
+    app = web.Application()
+    app.add_routes([
+        web.get('/page', page),
+        web.get('/chunked', chunked),
+        web.get('/moved', moved),
+        web.get('/timed/{n}', timed),
+    ])
+    return app
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def run_checks(tmp_path, urls_fn, checker=None, port=0, **kwargs):
+    # Serves make_app() on a local port, then checks urls_fn(base)
+    counts = {}
+
+    async def scenario():
+        runner = web.AppRunner(make_app(counts))
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', port)
+        await site.start()
+        try:
+            nonlocal checker
+            checker = checker or LinkChecker(cache_path=str(tmp_path / 'cache.json'), **kwargs)
+            results = await checker.check_all(urls_fn(f'http://127.0.0.1:{runner.addresses[0][1]}'))
+        finally:
+            await runner.cleanup()
+        return results
+
+    results = asyncio.run(scenario())
+    return results, checker, counts
+
+
+def test_extract_amounts_from_french_text():
+    assert extract_amounts('Depuis 2023 1 234 € collectés') == {'raisedAmount': 1234}
+    assert extract_amounts('1 234,50 € collectés') == {'raisedAmount': 1234}
+    assert extract_amounts('Objectif : 5 000 €') == {'targetAmount': 5000}
+    assert extract_amounts('12.345 € récoltés') == {'raisedAmount': 12345}
+
+
+def test_redirects_and_404(tmp_path):
+    results, _, _ = run_checks(tmp_path, lambda base: [f'{base}/moved', f'{base}/missing'])
+    moved, missing = results
+
+    assert moved['ok'] and moved['redirects'] == 1
+    assert moved['finalUrl'].endswith('/page')
+    assert moved['raisedAmount'] == 1234 and moved['targetAmount'] == 5000
+    assert missing['status'] == 404 and not missing['ok']
+
+
+def test_amounts_in_a_later_chunk(tmp_path):
+    results, _, _ = run_checks(tmp_path, lambda base: [f'{base}/chunked'])
+
+    assert results[0]['raisedAmount'] == 42 and results[0]['targetAmount'] == 100
+
+
+def test_ttl_cache_and_304_revalidation(tmp_path):
+    # The cache is keyed by URL, so every run needs the same port
+    port = free_port()
+    urls = lambda base: [f'{base}/page']
+    run_checks(tmp_path, urls, port=port)
+
+    # Fresh cache hit: no request at all
+    _, checker, counts = run_checks(tmp_path, urls, port=port)
+    assert checker.stats['cached'] == 1 and counts.get('page') is None
+
+    # Expired entry: revalidated with If-None-Match, amounts kept from the cache
+    results, checker, counts = run_checks(tmp_path, urls, port=port, ttl=0)
+    assert checker.stats['notModified'] == 1 and counts['page'] == 1
+    assert results[0]['raisedAmount'] == 1234
+
+
+def test_host_interval(tmp_path):
+    limits = {'127.0.0.1': {"concurrency": 4, "interval": 0.1}}
+    _, _, counts = run_checks(tmp_path, lambda base: [f'{base}/timed/{n}' for n in range(4)], host_limits=limits)
+
+    starts = sorted(counts['starts'])
+    assert all(b - a >= 0.08 for a, b in zip(starts, starts[1:]))
+
+
+def test_connection_errors_are_retried_sooner(tmp_path, monkeypatch):
+    # Nothing listens on a port that was just released
+    url = f'http://127.0.0.1:{free_port()}/'
+
+    async def check(checker):
+        async with aiohttp.ClientSession() as session:
+            return await checker.check(session, url)
+
+    checker = LinkChecker(cache_path=str(tmp_path / 'cache.json'))
+    assert 'error' in asyncio.run(check(checker))
+    asyncio.run(check(checker))
+    assert checker.stats == {"cached": 1, "notModified": 0, "fetched": 0, "errors": 1}
+
+    now = time.time()
+    monkeypatch.setattr(fund_liveness.time, 'time', lambda: now + ERROR_TTL + 1)
+    asyncio.run(check(checker))
+    assert checker.stats['errors'] == 2
@@ -0,0 +1,34 @@
+import json
+import os
+
+from fund_shards import MANIFEST_FILE, THEMATIC_SHARD, geohash, shard_key, write_shards
+
+
+def test_geohash_matches_reference_value():
+    assert geohash(57.64911, 10.40744, 11) == 'u4pruydqqvj'
+
+
+def test_thematic_gist_profiles_get_their_own_shard():
+    profile = {
+        "location": {"lat": 48.8566, "lon": 2.3522},
+        "strikeFund": {"title": "Caisse de grève Queer", "category": 'Thématique'},
+    }
+    assert shard_key(profile) == THEMATIC_SHARD
+    assert shard_key({**profile, "strikeFund": {"category": 'Locale'}}) == geohash(48.8566, 2.3522)
+
+
+def test_write_shards_only_removes_stale_shards(tmp_path):
+    (tmp_path / 'strike_funds_data.json').write_text('[]')
+    (tmp_path / 'u09.0123456789abcdef.json').write_text('[]')
+
+    funds = [
+        {"name": "Paris", "url": "https://a.fr/1", "lat": 48.85, "lng": 2.35},
+        {"name": "Queer", "url": "https://a.fr/2", "type": "thematic"},
+    ]
+    manifest = write_shards(funds, str(tmp_path))
+
+    listed = {entry['file'] for entry in manifest['shards']}
+    assert set(os.listdir(tmp_path)) == listed | {MANIFEST_FILE, 'strike_funds_data.json'}
+    thematic = next(e for e in manifest['shards'] if e['key'] == THEMATIC_SHARD)
+    assert thematic['bbox'] is None and thematic['count'] == 1
+    assert json.loads((tmp_path / MANIFEST_FILE).read_text())['total'] == 2
@@ -0,0 +1,35 @@
+import os
+
+from PIL import Image
+
+from profile_images import DEFAULT_URL_PREFIX, attach_photos, build_variants
+
+
+def write_image(path, size=(1024, 768)):
+    Image.new('RGB', size, (200, 60, 40)).save(path, 'JPEG')
+
+
+def test_photos_point_at_built_variants(tmp_path):
+    write_image(tmp_path / 'profile-001.jpg')
+    manifest, stats = build_variants(str(tmp_path), formats=['webp'], workers=1)
+
+    assert stats['processed'] == 1
+    photo = manifest['photos'][f'{DEFAULT_URL_PREFIX}/profile-001.jpg']
+    urls = [candidate.split(' ')[0] for candidate in photo['sources'][0]['srcSet'].split(', ')]
+    assert [url.rsplit('-', 1)[-1] for url in urls] == ['320.webp', '640.webp', '960.webp']
+    assert all(os.path.exists(tmp_path / 'variants' / url.rsplit('/', 1)[-1]) for url in urls)
+
+    profiles = [{"photoUrl": f'{DEFAULT_URL_PREFIX}/profile-001.jpg'}, {"photoUrl": 'https://example.org/a.jpg'}]
+    assert attach_photos(profiles, manifest) == 1 and 'photo' not in profiles[1]
+    # Unchanged sources are not decoded again
+    assert build_variants(str(tmp_path), formats=['webp'], workers=1)[1]['skipped'] == 1
+
+
+def test_no_photos_from_variants_that_are_not_deployed(tmp_path):
+    # CI only builds the default widths: other widths would 404 in production
+    write_image(tmp_path / 'profile-001.jpg')
+    manifest, _ = build_variants(str(tmp_path), widths=[200, 400], formats=['webp'], workers=1)
+
+    profiles = [{"photoUrl": f'{DEFAULT_URL_PREFIX}/profile-001.jpg'}]
+    assert manifest['images'] and manifest['photos'] == {}
+    assert attach_photos(profiles, manifest) == 0 and 'photo' not in profiles[0]
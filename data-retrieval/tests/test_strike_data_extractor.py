@@ -0,0 +1,88 @@
+import pytest
+
+from strike_data_extractor import extract_strike_funds_data, latlng_to_pixel, write_synthetic_snapshot
+
+ZOOM = 6
+MARSEILLE = (43.2965, 5.3698)
+
+
+def marker(x, y, name='Caisse de grève Marseille'):
+    return (f'<div class="leaflet-marker-icon leaflet-interactive" style="margin-left: -12px; '
+            f'transform: translate3d({x}px, {y}px, 0px);"><a href="https://a.fr/1">{name}</a></div>')
+
+
+def tile(z, x, y, left, top, container='translate3d(0px, 0px, 0px) scale(1)'):
+    return (f'<div class="leaflet-tile-container leaflet-zoom-animated" style="transform: {container};">'
+            f'<img src="https://b.tile.openstreetmap.org/{z}/{x}/{y}.png" class="leaflet-tile leaflet-tile-loaded" '
+            f'style="width: 256px; height: 256px; transform: translate3d({left}px, {top}px, 0px);"></div>')
+
+
+def layer_point(latlng, origin):
+    x, y = latlng_to_pixel(*latlng, ZOOM)
+    return round(x - origin[0]), round(y - origin[1])
+
+
+def test_synthetic_snapshot_round_trip(tmp_path):
+    path = tmp_path / 'map.html'
+    write_synthetic_snapshot(str(path), 50, zoom=ZOOM)
+
+    funds = extract_strike_funds_data(str(path), zoom=ZOOM)
+    located = [f for f in funds if 'lat' in f]
+    assert len(located) == 50
+    for i, fund in enumerate(located):
+        assert fund['lat'] == pytest.approx(42.5 + (i * 7919 % 10000) / 10000 * 8.5, abs=0.01)
+        assert fund['lng'] == pytest.approx(-4.5 + (i * 104729 % 10000) / 10000 * 12.5, abs=0.01)
+
+
+def test_origin_is_read_from_tiles_even_after_the_markers(tmp_path):
+    # Panned map: level created at an older origin, and a stale scaled level
+    origin = (8000, 5700)
+    level_origin = (7900, 5650)
+    x, y = layer_point(MARSEILLE, origin)
+    path = tmp_path / 'map.html'
+    path.write_text(
+        '<div class="leaflet-pane leaflet-map-pane" style="transform: translate3d(-120px, 35px, 0px);">'
+        f'<div class="leaflet-pane leaflet-marker-pane">{marker(x, y)}</div>'
+        '<div class="leaflet-pane leaflet-tile-pane">'
+        + tile(5, 15, 11, 3840 - 4000, 2816 - 2850, container='translate3d(0px, 0px, 0px) scale(2)')
+        + tile(6, 31, 22, 31 * 256 - level_origin[0], 22 * 256 - level_origin[1],
+               container=f'translate3d({level_origin[0] - origin[0]}px, {level_origin[1] - origin[1]}px, 0px) scale(1)')
+        + '</div></div>',
+        encoding='utf-8',
+    )
+
+    [fund] = extract_strike_funds_data(str(path), zoom=ZOOM)
+    assert (fund['lat'], fund['lng']) == pytest.approx(MARSEILLE, abs=0.02)
+
+
+def test_origin_is_required_without_tiles(tmp_path):
+    origin = (8000, 5700)
+    path = tmp_path / 'map.html'
+    path.write_text(marker(*layer_point(MARSEILLE, origin)), encoding='utf-8')
+
+    with pytest.raises(ValueError, match='--origin'):
+        extract_strike_funds_data(str(path), zoom=ZOOM)
+    [fund] = extract_strike_funds_data(str(path), zoom=ZOOM, origin=origin)
+    assert (fund['lat'], fund['lng']) == pytest.approx(MARSEILLE, abs=0.02)
+
+
+def test_zoom_is_read_from_tiles(tmp_path):
+    path = tmp_path / 'map.html'
+    write_synthetic_snapshot(str(path), 5, zoom=8)
+
+    funds = extract_strike_funds_data(str(path))
+    assert funds[0]['lat'] == pytest.approx(42.5, abs=0.01) and funds[0]['lng'] == pytest.approx(-4.5, abs=0.01)
+    with pytest.raises(ValueError, match='--zoom 6 does not match the map tiles'):
+        extract_strike_funds_data(str(path), zoom=6)
+
+
+def test_markers_off_the_map_are_rejected(tmp_path):
+    # An origin taken at zoom 6 read at zoom 2 puts Marseille far outside the world
+    origin = (8000, 5700)
+    path = tmp_path / 'map.html'
+    path.write_text(marker(*layer_point(MARSEILLE, origin)), encoding='utf-8')
+
+    with pytest.raises(ValueError, match='--zoom'):
+        extract_strike_funds_data(str(path), origin=origin)
+    with pytest.raises(ValueError, match='off the map'):
+        extract_strike_funds_data(str(path), zoom=2, origin=origin)
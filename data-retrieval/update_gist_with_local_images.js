@@ -9,6 +9,7 @@ const __dirname = path.dirname(__filename);
 const GIST_ID = '2198c40a1181db1edc86727df7f86260';
 const GIST_FILENAME = 'profiles.json';
 const MANIFEST_FILE = path.join(__dirname, '..', 'public', 'assets', 'profiles', 'manifest.json');
+const VARIANTS_FILE = path.join(__dirname, '..', 'public', 'assets', 'profiles', 'variants.json');
 const OUTPUT_FILE = path.join(__dirname, 'updated_gist_data.json');
 
 // GitHub API configuration
@@ -28,6 +29,20 @@ function loadManifest() {
   return manifest;
 }
 
+/**
+ * Load the responsive variants and blur placeholders built by profile_images.py
+ */
+function loadPhotoVariants() {
+  if (!fs.existsSync(VARIANTS_FILE)) {
+    console.log('ℹ️  No variants.json found, run profile_images.py to add responsive photos');
+    return {};
+  }
+
+  const variants = JSON.parse(fs.readFileSync(VARIANTS_FILE, 'utf8'));
+  console.log(`🖼️  Loaded responsive variants for ${Object.keys(variants.photos).length} images`);
+  return variants.photos;
+}
+
 /**
  * Fetch current Gist data from GitHub
  */
@@ -65,7 +80,7 @@ async function fetchGistData() {
 /**
  * Update profiles with local image URLs
  */
-function updateProfilesWithLocalImages(profiles, manifest) {
+function updateProfilesWithLocalImages(profiles, manifest, photos = {}) {
   const imageMap = new Map();
   manifest.images.forEach(img => {
     imageMap.set(img.index, img.url);
@@ -85,7 +100,8 @@ function updateProfilesWithLocalImages(profiles, manifest) {
       ...profile,
       photoUrl: localImageUrl,
       localImageIndex: imageIndex,
-      localImageFilename: `profile-${imageIndex.toString().padStart(3, '0')}.jpg`
+      localImageFilename: `profile-${imageIndex.toString().padStart(3, '0')}.jpg`,
+      ...(photos[localImageUrl] && { photo: photos[localImageUrl] })
     };
 
     console.log(`🔄 Updated ${profile.name} (${profile.id}) with local image: ${localImageUrl}`);
@@ -196,7 +212,7 @@ async function main() {
     const profiles = await fetchGistData();
 
     // Update profiles with local image URLs
-    const updatedProfiles = updateProfilesWithLocalImages(profiles, manifest);
+    const updatedProfiles = updateProfilesWithLocalImages(profiles, manifest, loadPhotoVariants());
 
     // Generate statistics
     const stats = generateStats(updatedProfiles, manifest);
@@ -8,6 +8,7 @@ const __dirname = path.dirname(__filename);
 // Paths
 const PROFILES_FILE = path.join(__dirname, 'strike_funds_data.json');
 const MANIFEST_FILE = path.join(__dirname, '..', 'public', 'assets', 'profiles', 'manifest.json');
+const VARIANTS_FILE = path.join(__dirname, '..', 'public', 'assets', 'profiles', 'variants.json');
 const OUTPUT_FILE = path.join(__dirname, 'profiles_with_local_images.json');
 
 /**
@@ -23,6 +24,20 @@ function loadManifest() {
   return manifest;
 }
 
+/**
+ * Load the responsive variants and blur placeholders built by profile_images.py
+ */
+function loadPhotoVariants() {
+  if (!fs.existsSync(VARIANTS_FILE)) {
+    console.log('ℹ️  No variants.json found, run profile_images.py to add responsive photos');
+    return {};
+  }
+
+  const variants = JSON.parse(fs.readFileSync(VARIANTS_FILE, 'utf8'));
+  console.log(`🖼️  Loaded responsive variants for ${Object.keys(variants.photos).length} images`);
+  return variants.photos;
+}
+
 /**
  * Load existing profiles data
  */
@@ -39,7 +54,7 @@ function loadProfiles() {
 /**
  * Update profiles with local image URLs
  */
-function updateProfilesWithLocalImages(profiles, manifest) {
+function updateProfilesWithLocalImages(profiles, manifest, photos = {}) {
   const imageMap = new Map();
   manifest.images.forEach(img => {
     imageMap.set(img.index, img.url);
@@ -58,7 +73,8 @@ function updateProfilesWithLocalImages(profiles, manifest) {
       ...profile,
       photoUrl: localImageUrl,
       localImageIndex: imageIndex,
-      localImageFilename: `profile-${imageIndex.toString().padStart(3, '0')}.jpg`
+      localImageFilename: `profile-${imageIndex.toString().padStart(3, '0')}.jpg`,
+      ...(photos[localImageUrl] && { photo: photos[localImageUrl] })
     };
   });
 
@@ -107,7 +123,7 @@ async function main() {
     const profiles = loadProfiles();
 
     // Update profiles
-    const updatedProfiles = updateProfilesWithLocalImages(profiles, manifest);
+    const updatedProfiles = updateProfilesWithLocalImages(profiles, manifest, loadPhotoVariants());
 
     // Generate statistics
     const stats = generateStats(updatedProfiles, manifest);
@@ -107,6 +107,26 @@ if (fs.existsSync(notFoundPath)) {
   }
 }
 
+// Check the profile photo variants referenced by the gist's photo fields
+console.log('\n🖼️  Checking profile photo variants:');
+const variantsPath = path.join(distDir, 'assets', 'profiles', 'variants.json');
+if (fs.existsSync(variantsPath)) {
+  const { photos } = JSON.parse(fs.readFileSync(variantsPath, 'utf8'));
+  const urls = Object.values(photos).flatMap(photo =>
+    photo.sources.flatMap(source => source.srcSet.split(', ').map(candidate => candidate.split(' ')[0]))
+  );
+  const missing = urls.filter(url => !fs.existsSync(path.join(distDir, url)));
+  if (missing.length === 0) {
+    console.log(`✅ ${urls.length} variants of ${Object.keys(photos).length} photos deployed`);
+  } else {
+    console.error(`❌ ${missing.length} variants MISSING, e.g. ${missing[0]}`);
+    hasErrors = true;
+  }
+} else {
+  console.error('❌ assets/profiles/variants.json - MISSING (run data-retrieval/profile_images.py)');
+  hasErrors = true;
+}
+
 // Summary
 console.log('\n📊 Deployment Verification Summary:');
 if (hasErrors) {
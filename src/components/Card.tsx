@@ -5,6 +5,7 @@ import { OptimizedImage } from './OptimizedImage';
 import { useBlurDataURL } from '../hooks/useBlurDataURL';
 import { useKeyboardNavigation } from '../hooks/useKeyboardNavigation';
 import type { PanInfo } from 'framer-motion';
+import type { ProfilePhoto } from '../types/gist';
 import './Card.css';
 
 /**
@@ -18,6 +19,8 @@ export type CardProps = {
     age: number;
     bio: string;
     photoUrl: string;
+    /** Responsive variants and placeholder built at data generation time */
+    photo?: ProfilePhoto;
     strikeFund: { url: string; title: string };
     distance?: number; // Distance in kilometers
   };
@@ -47,7 +50,8 @@ export function Card({
 }: CardProps) {
   const controls = useAnimation();
   const [swipeDirection, setSwipeDirection] = useState<string | null>(null);
-  const blurDataURL = useBlurDataURL();
+  // Only drawn for profiles without a precomputed placeholder
+  const blurDataURL = useBlurDataURL(10, 10, !profile.photo);
 
   // Keyboard navigation
   const { elementRef } = useKeyboardNavigation({
@@ -188,7 +192,8 @@ export function Card({
         src={profile.photoUrl}
         alt={`Photo de ${profile.name}`}
         className="card-image"
-        blurDataURL={blurDataURL}
+        blurDataURL={profile.photo?.placeholder ?? blurDataURL}
+        sources={profile.photo?.sources}
       />
       <div className="card-content">
         <div className="card-header">
@@ -1,6 +1,7 @@
 import React, { useState, useRef, useEffect } from 'react';
 import { LoadingSpinner } from './LoadingSpinner';
 import { useBlurDataURL } from '../hooks/useBlurDataURL';
+import type { ProfilePhotoSource } from '../types/gist';
 import './OptimizedImage.css';
 
 interface OptimizedImageProps {
@@ -12,6 +13,10 @@ interface OptimizedImageProps {
   onError?: () => void;
   placeholder?: string;
   blurDataURL?: string;
+  /** Responsive variants, preferred format first; `src` is used if they fail to load */
+  sources?: ProfilePhotoSource[];
+  /** Rendered width hint for choosing among the `sources` candidates */
+  sizes?: string;
 }
 
 /**
@@ -26,15 +31,18 @@ export function OptimizedImage({
   onError,
   placeholder,
   blurDataURL,
+  sources,
+  sizes = '(max-width: 480px) 100vw, 420px',
 }: OptimizedImageProps) {
   const [loaded, setLoaded] = useState(false);
   const [error, setError] = useState(false);
+  const [sourcesFailed, setSourcesFailed] = useState(false);
   const [inView, setInView] = useState(false);
   const imgRef = useRef<HTMLImageElement>(null);
   const containerRef = useRef<HTMLDivElement>(null);
 
   // Generate blur data URL if not provided
-  const generatedBlurDataURL = useBlurDataURL();
+  const generatedBlurDataURL = useBlurDataURL(10, 10, !blurDataURL);
   const finalBlurDataURL = blurDataURL || generatedBlurDataURL;
 
   // Intersection Observer for lazy loading
@@ -69,6 +77,11 @@ export function OptimizedImage({
   };
 
   const handleError = () => {
+    // <picture> never falls back from a broken <source>: retry with `src` alone
+    if (sources?.length && !sourcesFailed) {
+      setSourcesFailed(true);
+      return;
+    }
     setError(true);
     setLoaded(false);
     onError?.();
@@ -112,16 +125,26 @@ export function OptimizedImage({
 
       {/* Actual image */}
       {inView && (
-        <img
-          ref={imgRef}
-          src={src}
-          alt={alt}
-          className={`optimized-image__img ${loaded ? 'optimized-image__img--loaded' : ''}`}
-          onLoad={handleLoad}
-          onError={handleError}
-          loading="lazy"
-          decoding="async"
-        />
+        <picture key={sourcesFailed ? 'fallback' : 'sources'}>
+          {!sourcesFailed && sources?.map(source => (
+            <source
+              key={source.type}
+              type={source.type}
+              srcSet={source.srcSet}
+              sizes={sizes}
+            />
+          ))}
+          <img
+            ref={imgRef}
+            src={src}
+            alt={alt}
+            className={`optimized-image__img ${loaded ? 'optimized-image__img--loaded' : ''}`}
+            onLoad={handleLoad}
+            onError={handleError}
+            loading="lazy"
+            decoding="async"
+          />
+        </picture>
       )}
     </div>
   );
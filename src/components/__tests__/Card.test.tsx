@@ -29,11 +29,15 @@ vi.mock('../OptimizedImage', () => ({
     src,
     alt,
     className,
+    blurDataURL,
   }: {
     src: string;
     alt: string;
     className?: string;
-  }) => <img src={src} alt={alt} className={className} />,
+    blurDataURL?: string;
+  }) => (
+    <img src={src} alt={alt} className={className} data-blur={blurDataURL} />
+  ),
 }));
 
 // Mock useBlurDataURL hook
@@ -69,6 +73,21 @@ describe('Card Component', () => {
     expect(screen.getByAltText('Photo de Test User')).toBeInTheDocument();
   });
 
+  it('uses the precomputed photo placeholder when available', () => {
+    const photo = {
+      width: 1024,
+      height: 1024,
+      placeholder: 'data:image/webp;base64,precomputed',
+      sources: [],
+    };
+    render(<Card {...defaultProps} profile={{ ...mockProfile, photo }} />);
+
+    expect(screen.getByAltText('Photo de Test User')).toHaveAttribute(
+      'data-blur',
+      'data:image/webp;base64,precomputed'
+    );
+  });
+
   it('renders with custom styles', () => {
     const customStyle = { transform: 'scale(0.9)' };
     render(<Card {...defaultProps} style={customStyle} />);
@@ -0,0 +1,72 @@
+import { render, screen, fireEvent } from '@testing-library/react';
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import '@testing-library/jest-dom';
+import { OptimizedImage } from '../OptimizedImage';
+
+// Mock the CSS import
+vi.mock('../OptimizedImage.css', () => ({}));
+
+const sources = [
+  {
+    type: 'image/avif',
+    srcSet: '/assets/profiles/variants/profile-001-cef13c33-320.avif 320w',
+  },
+  {
+    type: 'image/webp',
+    srcSet: '/assets/profiles/variants/profile-001-cef13c33-320.webp 320w',
+  },
+];
+
+describe('OptimizedImage', () => {
+  beforeEach(() => {
+    // Without IntersectionObserver the image is rendered right away
+    vi.stubGlobal('IntersectionObserver', undefined);
+  });
+
+  afterEach(() => {
+    vi.unstubAllGlobals();
+  });
+
+  it('renders the responsive sources before the fallback image', () => {
+    const { container } = render(
+      <OptimizedImage
+        src="/assets/profiles/profile-001.jpg"
+        alt="Photo de Marie"
+        blurDataURL="data:image/webp;base64,precomputed"
+        sources={sources}
+      />
+    );
+
+    const types = Array.from(container.querySelectorAll('picture source')).map(
+      source => source.getAttribute('type')
+    );
+    expect(types).toEqual(['image/avif', 'image/webp']);
+    expect(screen.getByAltText('Photo de Marie')).toHaveAttribute(
+      'src',
+      '/assets/profiles/profile-001.jpg'
+    );
+  });
+
+  it('falls back to src when the variants fail to load', () => {
+    const onError = vi.fn();
+    const { container } = render(
+      <OptimizedImage
+        src="/assets/profiles/profile-001.jpg"
+        alt="Photo de Marie"
+        blurDataURL="data:image/webp;base64,precomputed"
+        sources={sources}
+        onError={onError}
+      />
+    );
+
+    fireEvent.error(screen.getByAltText('Photo de Marie'));
+    expect(container.querySelectorAll('picture source')).toHaveLength(0);
+    expect(screen.getByAltText('Photo de Marie')).toBeInTheDocument();
+    expect(screen.queryByText('Image non disponible')).not.toBeInTheDocument();
+    expect(onError).not.toHaveBeenCalled();
+
+    fireEvent.error(screen.getByAltText('Photo de Marie'));
+    expect(screen.getByText('Image non disponible')).toBeInTheDocument();
+    expect(onError).toHaveBeenCalledTimes(1);
+  });
+});
@@ -2,11 +2,20 @@ import { useState, useEffect } from 'react';
 
 /**
  * Hook for generating blur data URLs
+ *
+ * Pass `enabled = false` when a precomputed placeholder is available, so no
+ * canvas is drawn on mount.
  */
-export function useBlurDataURL(width: number = 10, height: number = 10) {
+export function useBlurDataURL(
+  width: number = 10,
+  height: number = 10,
+  enabled: boolean = true
+) {
   const [blurDataURL, setBlurDataURL] = useState<string>('');
 
   useEffect(() => {
+    if (!enabled) return;
+
     const canvas = document.createElement('canvas');
     canvas.width = width;
     canvas.height = height;
@@ -23,7 +32,7 @@ export function useBlurDataURL(width: number = 10, height: number = 10) {
 
       setBlurDataURL(canvas.toDataURL());
     }
-  }, [width, height]);
+  }, [width, height, enabled]);
 
   return blurDataURL;
 }
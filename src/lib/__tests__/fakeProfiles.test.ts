@@ -146,6 +146,35 @@ describe('Fake Profiles Generation', () => {
       expect(appProfile.location).toEqual({ lat: 48.8566, lon: 2.3522 });
     });
 
+    it('should pass the responsive photo through, rebased on the app base URL', () => {
+      vi.stubEnv('BASE_URL', '/payetongreviste/');
+      const appProfile = convertGistProfileToAppProfile({
+        ...mockGistProfile,
+        photoUrl: '/assets/profiles/profile-001.jpg',
+        photo: {
+          width: 1024,
+          height: 1024,
+          placeholder: 'data:image/webp;base64,AAAA',
+          sources: [
+            {
+              type: 'image/webp',
+              srcSet:
+                '/assets/profiles/variants/profile-001-1bdfcdee-320.webp 320w, /assets/profiles/variants/profile-001-1bdfcdee-640.webp 640w',
+            },
+          ],
+        },
+      });
+      vi.unstubAllEnvs();
+
+      expect(appProfile.photoUrl).toBe(
+        '/payetongreviste/assets/profiles/profile-001.jpg'
+      );
+      expect(appProfile.photo?.placeholder).toBe('data:image/webp;base64,AAAA');
+      expect(appProfile.photo?.sources[0].srcSet).toBe(
+        '/payetongreviste/assets/profiles/variants/profile-001-1bdfcdee-320.webp 320w, /payetongreviste/assets/profiles/variants/profile-001-1bdfcdee-640.webp 640w'
+      );
+    });
+
     it('should preserve all strike fund properties', () => {
       const appProfile = convertGistProfileToAppProfile(mockGistProfile);
 
@@ -0,0 +1,56 @@
+/**
+ * Tests for the columnar strike fund reader
+ */
+
+import { describe, it, expect } from 'vitest';
+import { readFundColumns } from '../fundColumns';
+
+// Written by data-retrieval/fund_columnar.py for two records:
+// "Solidaires Yonne 89" (47.8, 3.6, Locale, Élevée) and the thematic
+// "Caisse de grève Queer" (no location, Thématique, no urgency)
+const FIXTURE =
+  'UFRHRgEAOAACAAAACQAAAAIAAwA4AAAAQAAAAEgAAABQAAAAWAAAAFwAAABgAAAAiAAAAGUAAAAzMz9CAADAf2ZmZkAAAMB/BQAAAAYAAAAHAAAACAAAAAABAAACAAAAAAAAAAYAAAARAAAAEQAAABgAAAAgAAAAMwAAAEkAAABXAAAAZQAAAExvY2FsZVRow6ltYXRpcXVlTW95ZW5uZcOJbGV2w6llU29saWRhaXJlcyBZb25uZSA4OUNhaXNzZSBkZSBncsOodmUgUXVlZXJodHRwczovL2EuZnIvMWh0dHBzOi8vYi5mci9x';
+
+function fixtureBuffer(): ArrayBuffer {
+  const bytes = Uint8Array.from(atob(FIXTURE), c => c.charCodeAt(0));
+  return bytes.buffer;
+}
+
+describe('readFundColumns', () => {
+  it('should read the record count and coordinates', () => {
+    const columns = readFundColumns(fixtureBuffer());
+
+    expect(columns.count).toBe(2);
+    expect(columns.lat[0]).toBeCloseTo(47.8, 4);
+    expect(columns.lon[0]).toBeCloseTo(3.6, 4);
+    expect(Number.isNaN(columns.lat[1])).toBe(true);
+    expect(Number.isNaN(columns.lon[1])).toBe(true);
+  });
+
+  it('should expose coordinates as views over the buffer', () => {
+    const buffer = fixtureBuffer();
+    const columns = readFundColumns(buffer);
+
+    expect(columns.lat).toBeInstanceOf(Float32Array);
+    expect(columns.lat.buffer).toBe(buffer);
+    expect(columns.lon.buffer).toBe(buffer);
+  });
+
+  it('should decode interned strings and enum labels', () => {
+    const columns = readFundColumns(fixtureBuffer());
+
+    expect(columns.name(0)).toBe('Solidaires Yonne 89');
+    expect(columns.name(1)).toBe('Caisse de grève Queer');
+    expect(columns.url(1)).toBe('https://b.fr/q');
+    expect(columns.categories[columns.categoryCodes[1]]).toBe('Thématique');
+    expect(columns.urgencies[columns.urgencyCodes[0]]).toBe('Élevée');
+    expect(columns.urgencies[columns.urgencyCodes[1]]).toBe('');
+  });
+
+  it('should reject files with an unknown magic or version', () => {
+    const buffer = fixtureBuffer();
+    new DataView(buffer).setUint16(4, 99, true);
+
+    expect(() => readFundColumns(buffer)).toThrow('Unsupported fund columns file');
+  });
+});
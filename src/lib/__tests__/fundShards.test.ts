@@ -0,0 +1,84 @@
+/**
+ * Tests for the sharded strike fund client
+ */
+
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import {
+  clearShardCache,
+  fetchShardsForRadius,
+  shardsForRadius,
+  type FundShardManifest,
+} from '../fundShards';
+
+// Shaped like the manifest written by data-retrieval/fund_shards.py
+const manifest: FundShardManifest = {
+  version: 1,
+  precision: 3,
+  total: 5,
+  shards: [
+    { key: 'u09', file: 'u09.aaaa.json', bbox: [48.8, 2.3, 48.9, 2.4], count: 2, hash: 'aaaa', bytes: 10 },
+    { key: 'spe', file: 'spe.bbbb.json', bbox: [43.3, 5.3, 43.3, 5.4], count: 1, hash: 'bbbb', bytes: 10 },
+    { key: 'u0b', file: 'u0b.cccc.json', bbox: [49.2, 4.0, 49.3, 4.1], count: 1, hash: 'cccc', bytes: 10 },
+    { key: 'thematic', file: 'thematic.dddd.json', bbox: null, count: 1, hash: 'dddd', bytes: 10 },
+  ],
+};
+
+const PARIS = { lat: 48.8566, lon: 2.3522 };
+
+(globalThis as { fetch: ReturnType<typeof vi.fn> }).fetch = vi.fn();
+
+const mockFetch = fetch as ReturnType<typeof vi.fn>;
+
+describe('shardsForRadius', () => {
+  it('should keep nearby shards and the thematic shard', () => {
+    const keys = shardsForRadius(manifest, PARIS, 50).map(s => s.key);
+
+    expect(keys).toEqual(['u09', 'thematic']);
+  });
+
+  it('should include more shards as the radius grows', () => {
+    // Reims is about 130 km from Paris, Marseille about 660 km
+    expect(shardsForRadius(manifest, PARIS, 200).map(s => s.key)).toEqual([
+      'u09',
+      'u0b',
+      'thematic',
+    ]);
+    expect(shardsForRadius(manifest, PARIS, 700)).toHaveLength(4);
+  });
+});
+
+describe('fetchShardsForRadius', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+    clearShardCache();
+  });
+
+  it('should fetch overlapping shards once and merge their records', async () => {
+    mockFetch.mockImplementation((url: string) =>
+      Promise.resolve({ ok: true, json: () => Promise.resolve([{ url }]) })
+    );
+
+    const first = await fetchShardsForRadius('/shards/', manifest, PARIS, 50);
+    const second = await fetchShardsForRadius('/shards', manifest, PARIS, 50);
+
+    expect(first).toEqual([{ url: '/shards/u09.aaaa.json' }, { url: '/shards/thematic.dddd.json' }]);
+    expect(second).toEqual(first);
+    expect(mockFetch).toHaveBeenCalledTimes(2);
+  });
+
+  it('should retry shards whose fetch failed', async () => {
+    mockFetch.mockResolvedValueOnce({ ok: false, status: 503 });
+    mockFetch.mockResolvedValue({ ok: true, json: () => Promise.resolve([]) });
+
+    await expect(fetchShardsForRadius('/shards', manifest, PARIS, 10)).rejects.toThrow(
+      'Failed to fetch shard u09: 503'
+    );
+    await expect(fetchShardsForRadius('/shards', manifest, PARIS, 10)).resolves.toEqual([]);
+  });
+
+  it('should reject manifests with an unknown version', async () => {
+    await expect(
+      fetchShardsForRadius('/shards', { ...manifest, version: 2 }, PARIS, 10)
+    ).rejects.toThrow('Unsupported fund shards manifest');
+  });
+});
@@ -250,19 +250,44 @@ export function generateFakeProfiles(count: number): GistProfile[] {
   return profiles;
 }
 
+/**
+ * Prefix app-relative asset URLs (/assets/...) with the app's base URL
+ */
+function withBaseUrl(url: string) {
+  if (!url || !url.startsWith('/assets/')) {
+    return url;
+  }
+  // Get the base URL from import.meta.env.BASE_URL (handled by Vite)
+  const baseUrl = import.meta.env.BASE_URL || '/';
+  return baseUrl + url.substring(1); // Remove leading slash and add base URL
+}
+
+/**
+ * Rebase every candidate of a srcset ("/assets/a-320.webp 320w, ...")
+ */
+function srcSetWithBaseUrl(srcSet: string) {
+  return srcSet
+    .split(',')
+    .map(candidate => {
+      const [url, ...descriptors] = candidate.trim().split(/\s+/);
+      return [withBaseUrl(url), ...descriptors].join(' ');
+    })
+    .join(', ');
+}
+
 /**
  * Convert GistProfile to the app's Profile format
  */
 export function convertGistProfileToAppProfile(gistProfile: GistProfile) {
   // Handle photoUrl to ensure it works with the app's base URL
-  let photoUrl = gistProfile.photoUrl;
-
-  // If it's a relative URL starting with /assets/, prepend the base URL
-  if (photoUrl && photoUrl.startsWith('/assets/')) {
-    // Get the base URL from import.meta.env.BASE_URL (handled by Vite)
-    const baseUrl = import.meta.env.BASE_URL || '/';
-    photoUrl = baseUrl + photoUrl.substring(1); // Remove leading slash and add base URL
-  }
+  const photoUrl = withBaseUrl(gistProfile.photoUrl);
+  const photo = gistProfile.photo && {
+    ...gistProfile.photo,
+    sources: gistProfile.photo.sources.map(source => ({
+      ...source,
+      srcSet: srcSetWithBaseUrl(source.srcSet),
+    })),
+  };
 
   return {
     id: gistProfile.id,
@@ -270,6 +295,7 @@ export function convertGistProfileToAppProfile(gistProfile: GistProfile) {
     age: gistProfile.age,
     bio: gistProfile.bio,
     photoUrl: photoUrl,
+    ...(photo && { photo }),
     location: gistProfile.location || { lat: 48.8566, lon: 2.3522 }, // Use actual location from Gist or default to Paris
     strikeFund: gistProfile.strikeFund,
   };
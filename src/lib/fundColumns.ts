@@ -0,0 +1,86 @@
+/**
+ * Reader for the columnar strike fund export
+ *
+ * Decodes the binary file written by data-retrieval/fund_columnar.py.
+ * Coordinates are exposed as Float32Array views over the original buffer
+ * (no copy), so distance filtering can start before any string is decoded.
+ */
+
+export const FUND_COLUMNS_MAGIC = 'PTGF';
+export const FUND_COLUMNS_VERSION = 1;
+
+const HEADER_SIZE = 56;
+
+export interface FundColumns {
+  /** Number of records */
+  count: number;
+  /** Latitudes (NaN for thematic funds), a view over the buffer */
+  lat: Float32Array;
+  /** Longitudes (NaN for thematic funds), a view over the buffer */
+  lon: Float32Array;
+  /** Category code per record, index into `categories` */
+  categoryCodes: Uint8Array;
+  /** Urgency code per record, index into `urgencies` */
+  urgencyCodes: Uint8Array;
+  categories: string[];
+  urgencies: string[];
+  /** Decoded lazily from the interned string table */
+  name(index: number): string;
+  url(index: number): string;
+}
+
+export function readFundColumns(buffer: ArrayBuffer): FundColumns {
+  const view = new DataView(buffer);
+  const magic = String.fromCharCode(
+    view.getUint8(0),
+    view.getUint8(1),
+    view.getUint8(2),
+    view.getUint8(3)
+  );
+  const version = view.getUint16(4, true);
+  if (magic !== FUND_COLUMNS_MAGIC || version !== FUND_COLUMNS_VERSION) {
+    throw new Error(`Unsupported fund columns file (${magic} v${version})`);
+  }
+  if (view.getUint16(6, true) !== HEADER_SIZE) {
+    throw new Error('Unexpected fund columns header size');
+  }
+
+  const count = view.getUint32(8, true);
+  const stringCount = view.getUint32(12, true);
+  const categoryCount = view.getUint16(16, true);
+  const urgencyCount = view.getUint16(18, true);
+  const offset = (section: number) => view.getUint32(20 + section * 4, true);
+
+  const nameIndex = new Uint32Array(buffer, offset(2), count);
+  const urlIndex = new Uint32Array(buffer, offset(3), count);
+  const stringOffsets = new Uint32Array(buffer, offset(6), stringCount + 1);
+  const stringData = new Uint8Array(buffer, offset(7), view.getUint32(52, true));
+
+  const decoder = new TextDecoder();
+  const cache = new Map<number, string>();
+  const string = (id: number) => {
+    let value = cache.get(id);
+    if (value === undefined) {
+      value = decoder.decode(
+        stringData.subarray(stringOffsets[id], stringOffsets[id + 1])
+      );
+      cache.set(id, value);
+    }
+    return value;
+  };
+
+  const labels = (start: number, length: number) =>
+    Array.from({ length }, (_, i) => string(start + i));
+
+  return {
+    count,
+    lat: new Float32Array(buffer, offset(0), count),
+    lon: new Float32Array(buffer, offset(1), count),
+    categoryCodes: new Uint8Array(buffer, offset(4), count),
+    urgencyCodes: new Uint8Array(buffer, offset(5), count),
+    categories: labels(0, categoryCount),
+    urgencies: labels(categoryCount, urgencyCount),
+    name: (index: number) => string(nameIndex[index]),
+    url: (index: number) => string(urlIndex[index]),
+  };
+}
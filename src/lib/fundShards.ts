@@ -0,0 +1,107 @@
+/**
+ * Client for the geographically sharded strike fund export
+ *
+ * Reads the manifest written by data-retrieval/fund_shards.py and fetches
+ * only the shards that can contain funds within the search radius, plus the
+ * thematic shard. Shard files are named after their content hash, so they are
+ * cached forever; only the manifest needs revalidating.
+ */
+
+import type { LatLon } from './geo';
+
+export const FUND_SHARDS_VERSION = 1;
+export const THEMATIC_SHARD = 'thematic';
+
+const KM_PER_DEG_LAT = 111.195;
+
+export interface FundShard {
+  key: string;
+  file: string;
+  /** [minLat, minLng, maxLat, maxLng], null for the thematic shard */
+  bbox: [number, number, number, number] | null;
+  count: number;
+  hash: string;
+  bytes: number;
+}
+
+export interface FundShardManifest {
+  version: number;
+  precision: number;
+  total: number;
+  shards: FundShard[];
+}
+
+/**
+ * Shards whose bounding box may hold a point within `radiusKm` of `center`.
+ * The radius is widened to a lat/lon box, so no matching shard is ever
+ * skipped; at worst a neighbouring shard is fetched for nothing.
+ */
+export function shardsForRadius(
+  manifest: FundShardManifest,
+  center: LatLon,
+  radiusKm: number
+): FundShard[] {
+  const dLat = radiusKm / KM_PER_DEG_LAT;
+  const maxLat = Math.min(90, Math.abs(center.lat) + dLat);
+  const cosLat = Math.cos((maxLat * Math.PI) / 180);
+  const dLon = cosLat > 1e-6 ? radiusKm / (KM_PER_DEG_LAT * cosLat) : 360;
+
+  return manifest.shards.filter(shard => {
+    if (shard.bbox === null) return shard.key === THEMATIC_SHARD;
+    const [minLat, minLon, maxLatBox, maxLon] = shard.bbox;
+    if (minLat > center.lat + dLat || maxLatBox < center.lat - dLat) {
+      return false;
+    }
+    if (dLon >= 180) return true;
+    // Compare on the shortest way around the antimeridian
+    const lonGap = (lon: number) => Math.abs(((lon - center.lon + 540) % 360) - 180);
+    const inside =
+      minLon <= maxLon
+        ? center.lon >= minLon && center.lon <= maxLon
+        : center.lon >= minLon || center.lon <= maxLon;
+    return inside || Math.min(lonGap(minLon), lonGap(maxLon)) <= dLon;
+  });
+}
+
+const shardCache = new Map<string, Promise<unknown[]>>();
+
+/**
+ * Fetch the records of every shard overlapping the radius. Shards already
+ * fetched during this session are served from memory.
+ */
+export async function fetchShardsForRadius<T = unknown>(
+  baseUrl: string,
+  manifest: FundShardManifest,
+  center: LatLon,
+  radiusKm: number
+): Promise<T[]> {
+  if (manifest.version !== FUND_SHARDS_VERSION) {
+    throw new Error(`Unsupported fund shards manifest (v${manifest.version})`);
+  }
+  const base = baseUrl.replace(/\/$/, '');
+  const shards = shardsForRadius(manifest, center, radiusKm);
+
+  const records = await Promise.all(
+    shards.map(shard => {
+      const url = `${base}/${shard.file}`;
+      let pending = shardCache.get(url);
+      if (!pending) {
+        pending = fetch(url).then(response => {
+          if (!response.ok) {
+            throw new Error(`Failed to fetch shard ${shard.key}: ${response.status}`);
+          }
+          return response.json() as Promise<unknown[]>;
+        });
+        // Failed fetches are retried on the next call
+        pending.catch(() => shardCache.delete(url));
+        shardCache.set(url, pending);
+      }
+      return pending;
+    })
+  );
+  return records.flat() as T[];
+}
+
+export function clearShardCache() {
+  shardCache.clear();
+}
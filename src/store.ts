@@ -1,5 +1,6 @@
 import { create } from 'zustand';
 import { getActiveFunds } from './lib/strikeFunds';
+import type { ProfilePhoto } from './types/gist';
 
 /**
  * Profile type representing a user profile in the app
@@ -15,6 +16,8 @@ export type Profile = {
   bio: string;
   /** URL to the profile photo */
   photoUrl: string;
+  /** Responsive variants and blur placeholder of the photo, when built */
+  photo?: ProfilePhoto;
   /** Geographic location coordinates */
   location: { lat: number; lon: number };
   /** Strike fund information */
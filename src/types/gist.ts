@@ -2,12 +2,32 @@
  * Type definitions for GitHub Gist integration
  */
 
+export interface ProfilePhotoSource {
+  /** MIME type, e.g. image/avif */
+  type: string;
+  /** Responsive candidates, e.g. "/assets/.../profile-001-1bdf-320.webp 320w, ..." */
+  srcSet: string;
+}
+
+/**
+ * Responsive variants and blur placeholder built by data-retrieval/profile_images.py
+ */
+export interface ProfilePhoto {
+  width: number;
+  height: number;
+  /** Tiny base64 thumbnail of the photo, shown blurred while it loads */
+  placeholder: string;
+  /** Preferred format first */
+  sources: ProfilePhotoSource[];
+}
+
 export interface GistProfile {
   id: string;
   name: string;
   age: number;
   bio: string;
   photoUrl: string;
+  photo?: ProfilePhoto;
   location: {
     lat: number;
     lon: number;